@@ -1,12 +1,17 @@
+import csv
+import os
 import sys
 import secrets
 import string
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple, Optional
 
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import IntegrityError, transaction
 
 from accounts.models import User
+from utils.processes import setup_django
 
 
 def generate_strong_password(length: int = 20) -> str:
@@ -50,6 +55,24 @@ def _parse_line(line: str, delimiter: str) -> Tuple[Optional[str], str, Optional
 
     return email, username, None
 
+# 배치 모드 CSV 행 파싱 함수
+def _parse_row(row: List[str]) -> Tuple[Optional[str], str, Optional[str]]:
+    """
+    Returns: (email, username, error_message)
+    - Accepts: [email, username] or [email]
+    """
+    cells = [c.strip() for c in row]
+    if not any(cells):
+        return None, "", "empty line"
+
+    email = cells[0]
+    username = cells[1] if len(cells) >= 2 else ""
+
+    if not email:
+        return None, "", "missing email"
+
+    return email, username, None
+
 class Command(BaseCommand):
     help = (
         "콘솔에서 email,username (또는 email) 라인을 여러 줄로 입력받아 "
@@ -58,7 +81,9 @@ class Command(BaseCommand):
         "  a@company.com,alice\n"
         "  b@company.com,bob\n"
         "  c@company.com\n\n"
-        "입력 종료: mac/linux Ctrl+D, windows Ctrl+Z 후 Enter"
+        "입력 종료: mac/linux Ctrl+D, windows Ctrl+Z 후 Enter\n\n"
+        "--file로 CSV 파일을 읽을 수 있고, --batch를 사용하면 많은 계정을 한 번에 생성합니다.\n"
+        "(기존 이메일을 한 번에 조회하고, 비밀번호 해시를 여러 프로세스에서 계산해 bulk_create로 저장)"
     )
         
     def add_arguments(self, parser):
@@ -78,6 +103,29 @@ class Command(BaseCommand):
             action="store_true",
             help="DB 반영 없이 생성될 항목과 비밀번호만 출력합니다.",
         )
+        parser.add_argument(
+            "--file",
+            default=None,
+            type=str,
+            help="email,username (또는 email) CSV 파일 경로 (기본: 표준입력)",
+        )
+        parser.add_argument(
+            "--batch",
+            action="store_true",
+            help="배치 모드로 계정을 한 번에 생성합니다.",
+        )
+        parser.add_argument(
+            "--workers",
+            default=os.cpu_count() or 1,
+            type=int,
+            help="배치 모드에서 비밀번호 해시를 계산할 프로세스 수 (기본 CPU 수)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            default=500,
+            type=int,
+            help="배치 모드에서 한 번에 저장할 계정 수 (기본 500)",
+        )
 
     def handle(self, *args, **options):
         delimiter: str = options["delimiter"]
@@ -85,24 +133,35 @@ class Command(BaseCommand):
         skip_existing: bool = options["skip_existing"]
         dry_run: bool = options["dry_run"]
 
-        self.stdout.write(
-            self.style.SUCCESS(
-                "콘솔에 email,username (또는 email) 을 여러 줄로 붙여넣고 입력을 종료하세요. "
-                "(mac/linux Ctrl+D, windows Ctrl+Z 후 Enter)"
-    )
+        if options["file"]:
+            # 파일 전체 읽기
+            try:
+                with open(options["file"], encoding="utf-8-sig") as f:
+                    input_text = f.read()
+            except Exception as e:
+                raise CommandError(f"파일 읽기 실패: {e}")
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    "콘솔에 email,username (또는 email) 을 여러 줄로 붙여넣고 입력을 종료하세요. "
+                    "(mac/linux Ctrl+D, windows Ctrl+Z 후 Enter)"
         )
-        
-        # stdin 전체 읽기
-        try:
-            input_text = sys.stdin.read()
-        except Exception as e:
-            raise CommandError(f"표준입력 읽기 실패: {e}")
+            )
+
+            # stdin 전체 읽기
+            try:
+                input_text = sys.stdin.read()
+            except Exception as e:
+                raise CommandError(f"표준입력 읽기 실패: {e}")
 
         lines: List[str] = input_text.splitlines()
 
         if not lines:
             raise CommandError("입력 라인이 없습니다. email,username 을 붙여넣어 주세요.")
 
+        if options["batch"]:
+            return self.handle_batch(lines, delimiter, password_length, skip_existing, dry_run, options["workers"], options["chunk_size"])
+
         created = 0
         skipped = 0
         errors = 0
@@ -173,3 +232,112 @@ class Command(BaseCommand):
 
         mode = "DRY-RUN" if dry_run else "APPLIED"
         self.stdout.write(f"\n[{mode}] created={created}, skipped={skipped}, errors={errors}")
+
+    def handle_batch(self, lines: List[str], delimiter: str, password_length: int, skip_existing: bool, dry_run: bool, workers: int, chunk_size: int):
+        created = 0
+        skipped = 0
+        errors = 0
+
+        # 1. 파싱 (입력 안에서 중복된 이메일은 처음 것만 사용)
+        entries: List[Tuple[int, str, str]] = []
+        seen = set()
+        for idx, row in enumerate(csv.reader(lines, delimiter=delimiter), start=1):
+            email, username, err = _parse_row(row)
+            if err:
+                if err == "empty line":
+                    skipped += 1
+                    continue
+                self.stderr.write(f"[line {idx}] 파싱 실패: {err} -> {lines[idx - 1]!r}")
+                errors += 1
+                continue
+            if idx == 1 and email.lower() == "email":
+                continue # CSV 헤더
+
+            assert email is not None
+            email = User.objects.normalize_email(email)
+            if email in seen:
+                self.stderr.write(f"[line {idx}] 입력에 중복된 이메일: {email}")
+                errors += 1
+                continue
+            seen.add(email)
+            entries.append((idx, email, username))
+
+        # 2. 기존 이메일을 IN 쿼리로 조회
+        existing = set()
+        emails = [email for _, email, _ in entries]
+        try:
+            for i in range(0, len(emails), chunk_size):
+                existing.update(
+                    User.objects.filter(email__in=emails[i:i + chunk_size]).values_list("email", flat=True)
+                )
+        except Exception as e:
+            raise CommandError(f"DB 조회 실패: {e}")
+
+        # 헤더 출력(email, password, status)
+        self.stdout.write("email\tpassword\tstatus")
+
+        new_entries: List[Tuple[int, str, str, str]] = []
+        for idx, email, username in entries:
+            if email in existing:
+                if skip_existing:
+                    self.stdout.write(f"{email}\t-\tskipped(existing)")
+                    skipped += 1
+                else:
+                    self.stderr.write(f"[line {idx}] 이미 존재하는 이메일: {email} (스킵하려면 --skip-existing)")
+                    errors += 1
+                continue
+            new_entries.append((idx, email, username, generate_strong_password(password_length)))
+
+        if dry_run:
+            for _, email, _, password in new_entries:
+                self.stdout.write(f"{email}\t{password}\tdry-run")
+                created += 1
+            self.stdout.write(f"\n[DRY-RUN] created={created}, skipped={skipped}, errors={errors}")
+            return
+
+        # 3. 비밀번호 해시 (PBKDF2는 CPU를 많이 쓰므로 여러 프로세스에서 계산)
+        passwords = [password for _, _, _, password in new_entries]
+        if workers > 1 and len(passwords) > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=setup_django) as executor:
+                hashed_passwords = list(
+                    executor.map(make_password, passwords, chunksize=max(1, len(passwords) // (workers * 4)))
+                )
+        else:
+            hashed_passwords = [make_password(password) for password in passwords]
+
+        # 4. chunk_size개씩 bulk_create
+        for i in range(0, len(new_entries), chunk_size):
+            chunk = new_entries[i:i + chunk_size]
+            users = [
+                User(
+                    email=email,
+                    username=username,
+                    password=hashed_password,
+                    is_staff=True,
+                    is_superuser=False,
+                    is_active=True,
+                )
+                for (_, email, username, _), hashed_password in zip(chunk, hashed_passwords[i:i + chunk_size])
+            ]
+            try:
+                with transaction.atomic():
+                    User.objects.bulk_create(users)
+            except IntegrityError:
+                # 조회 이후 다른 곳에서 같은 이메일이 생성된 경우 등: 이 청크만 한 행씩 다시 저장해 실패한 행만 골라냄
+                for (idx, email, _, password), user in zip(chunk, users):
+                    try:
+                        with transaction.atomic():
+                            user.save(force_insert=True)
+                    except IntegrityError as e:
+                        self.stderr.write(f"[line {idx}] 사용자 생성 실패({email}): {e}")
+                        errors += 1
+                        continue
+                    self.stdout.write(f"{email}\t{password}\tcreated")
+                    created += 1
+                continue
+
+            for _, email, _, password in chunk:
+                self.stdout.write(f"{email}\t{password}\tcreated")
+            created += len(chunk)
+
+        self.stdout.write(f"\n[APPLIED] created={created}, skipped={skipped}, errors={errors}")
@@ -1,3 +1,48 @@
+from io import StringIO
+import os
+from tempfile import TemporaryDirectory
+from unittest import mock
+from django.core.management import call_command
 from django.test import TestCase
+from accounts.management.commands.signup import generate_strong_password
+from .models import User
 
-# Create your tests here.
+class SignupBatchTest(TestCase):
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "users.csv")
+
+    def signup(self, lines:list[str], *args)->tuple[str, str]:
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines))
+        stdout, stderr = StringIO(), StringIO()
+        call_command("signup", "--file", self.path, "--batch", "--workers", "1", *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_dedupes_input_and_skips_existing(self):
+        User.objects.create(email="old@example.com")
+        stdout, stderr = self.signup(
+            ["email,username", "a@example.com,alice", "a@EXAMPLE.com,alice2", "old@example.com", "b@example.com"],
+            "--skip-existing",
+        )
+
+        self.assertIn("입력에 중복된 이메일: a@example.com", stderr)
+        self.assertIn("old@example.com\t-\tskipped(existing)", stdout)
+        self.assertIn("created=2, skipped=1, errors=1", stdout)
+        self.assertEqual(User.objects.get(email="a@example.com").username, "alice")
+        self.assertTrue(User.objects.get(email="b@example.com").is_staff)
+
+    def test_conflict_fails_only_conflicting_row(self):
+        # 기존 이메일 조회 후, 저장 전에 다른 곳에서 같은 이메일을 만든 경우
+        def generate_password(length:int)->str:
+            if not User.objects.filter(email="race@example.com").exists():
+                User.objects.create(email="race@example.com")
+            return generate_strong_password(length)
+
+        with mock.patch("accounts.management.commands.signup.generate_strong_password", side_effect=generate_password):
+            stdout, stderr = self.signup(["a@example.com", "race@example.com", "b@example.com"])
+
+        self.assertIn("사용자 생성 실패(race@example.com)", stderr)
+        self.assertIn("created=2, skipped=0, errors=1", stdout)
+        self.assertEqual(set(User.objects.filter(is_staff=True).values_list("email", flat=True)), {"a@example.com", "b@example.com"})
@@ -0,0 +1,88 @@
+"""
+지원서 개인정보 암호화(utils.encryption) 벤치마크
+
+데이터베이스 없이 지원서 한 건을 저장할 때와 여러 건을 읽을 때 암호화에 드는 시간만 측정합니다.
+FIELD_ENCRYPTION_KEYS가 없으면 임시 키를 만들어 사용합니다.
+
+    python benchmarks/encryption.py --rows 2000
+"""
+import argparse
+import base64
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'configs.settings')
+os.environ.setdefault('FIELD_ENCRYPTION_KEYS', base64.urlsafe_b64encode(os.urandom(32)).decode())
+
+import django
+django.setup()
+
+from datetime import date
+from recruitments.models import Application
+from utils.encryption import EncryptedFieldMixin, _unwrap_data_key
+
+LIST_FIELDS = ("name",) # 지원서 목록에서 출력하는 암호화 필드
+
+
+def make_application(i:int)->Application:
+    return Application(
+        student_number=f"{2400000 + i}",
+        name="홍길동",
+        phone_number="010-1234-5678",
+        birthday=date(2004, 1, 1),
+        personal_statement_1="자기소개" * 120,
+        personal_statement_2="자기소개" * 120,
+        personal_statement_3="자기소개" * 120,
+        personal_statement_4="자기소개" * 120,
+        personal_statement_5="자기소개" * 500,
+    )
+
+
+def measure(label:str, rows:int, func)->None:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{label}: total={elapsed * 1000:.1f}ms per_row={elapsed / rows * 1_000_000:.1f}us")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    fields = [field for field in Application._meta.concrete_fields if isinstance(field, EncryptedFieldMixin)]
+    applications = [make_application(i) for i in range(args.rows)]
+
+    # 저장: 행마다 데이터 키 생성(마스터 키로 감싸기) + 필드별 암호화
+    stored = list()
+    def encrypt_rows():
+        for application in applications:
+            stored.append({field.attname: field.pre_save(application, add=True) for field in fields})
+    measure(f"create ({len(fields)} fields)", args.rows, encrypt_rows)
+
+    def load():
+        return [Application.from_db("default", list(values), list(values.values())) for values in stored]
+
+    # 목록: 출력하는 필드만 복호화 (행마다 데이터 키 풀기 + 필드 하나)
+    _unwrap_data_key.cache_clear()
+    instances = load()
+    measure("list read (name only)", args.rows, lambda: [getattr(a, field) for a in instances for field in LIST_FIELDS])
+
+    # 내보내기: 모든 암호화 필드 복호화 (데이터 키는 행마다 한 번만 풂)
+    _unwrap_data_key.cache_clear()
+    instances = load()
+    measure(f"export read ({len(fields)} fields)", args.rows, lambda: [getattr(a, field.attname) for a in instances for field in fields])
+
+    # 데이터 키 캐시가 채워진 상태에서 다시 읽기
+    instances = load()
+    measure("list read, warm data key cache", args.rows, lambda: [getattr(a, field) for a in instances for field in LIST_FIELDS])
+
+    size = sum(len(value) for values in stored for value in values.values()) / args.rows
+    print(f"stored size per row: {size:.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+면접 시간 자동 배정(InterviewAssignmentService.solve) 벤치마크
+
+가상의 지원자와 면접 슬롯을 만들어 데이터베이스 없이 매칭만 측정합니다.
+
+    python benchmarks/interview_assignment.py --applicants 600 --days 5 --capacity 2
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'configs.settings')
+
+import django
+django.setup()
+
+from django.utils import timezone
+from recruitments.services import InterviewAssignmentService
+from utils.choices import InterviewMethodChoices, PartChoices
+from utils.helpers import iter_interview_slots
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--applicants", type=int, default=600)
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--hours", type=int, default=10, help="하루 면접 시간")
+    parser.add_argument("--choices", type=int, default=8, help="지원자별 면접 가능 시간 수")
+    parser.add_argument("--capacity", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    first_day = datetime(2026, 3, 2, 10, tzinfo=timezone.get_current_timezone())
+
+    slots = list()
+    for day in range(args.days):
+        start = first_day + timedelta(days=day)
+        for slot_start in iter_interview_slots(start, start + timedelta(hours=args.hours)):
+            for part in PartChoices.values:
+                for interview_method in InterviewMethodChoices.values:
+                    slots.append((part, interview_method, slot_start))
+    slot_times = sorted({slot[2] for slot in slots})
+
+    # 인기 시간대(저녁)에 선택이 몰리도록 가중치를 둠
+    weights = [1 + 3 * (slot_time.hour >= 17) for slot_time in slot_times]
+    applications = [
+        SimpleNamespace(
+            student_number=f"{2400000 + i}",
+            part=random.choice(PartChoices.values),
+            interview_method=random.choice(InterviewMethodChoices.values),
+            interview_available_times=list({*random.choices(slot_times, weights=weights, k=args.choices)}),
+        )
+        for i in range(args.applicants)
+    ]
+
+    service = InterviewAssignmentService(year=first_day.year, default_capacity=args.capacity)
+
+    elapsed = list()
+    for _ in range(args.repeat):
+        started_at = time.perf_counter()
+        assignments = service.solve(applications, slots)
+        elapsed.append(time.perf_counter() - started_at)
+
+    assigned = sum(interview_at is not None for interview_at in assignments.values())
+    print(f"applicants={args.applicants} slots={len(slots)} capacity={args.capacity}")
+    print(f"assigned={assigned} unassigned={args.applicants - assigned}")
+    print(f"best={min(elapsed)*1000:.1f}ms worst={max(elapsed)*1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
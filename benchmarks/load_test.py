@@ -0,0 +1,167 @@
+"""
+지원서 제출 API(POST /recruitments/application/) 부하 테스트
+
+실행 중인 서버에 일반 지원자 요청과 악성 요청(한 IP에서 큰 본문을 계속 보냄)을 동시에 보내고,
+그룹별 처리량과 응답 시간(p50, p99), 상태 코드 분포를 출력합니다.
+서버 설정은 필요 없고 표준 라이브러리만 사용합니다.
+
+    # 일반 요청만
+    python benchmarks/load_test.py --url http://localhost:8000/recruitments/application/ --clients 20 --duration 30
+
+    # 악성 요청을 섞어서 일반 요청의 처리량이 유지되는지 확인
+    python benchmarks/load_test.py --url http://localhost:8000/recruitments/application/ --clients 20 --abusers 20 --abuse-size 50
+
+각 클라이언트는 X-Forwarded-For로 서로 다른 IP를 흉내 내므로, nginx를 거치지 않고 웹 서버에 직접 보내야 합니다.
+
+WSGI(동기 워커)와 ASGI(비동기 뷰)의 워커 하나당 동시 처리량 비교
+(요청 제한에 걸리지 않도록 APPLICATION_RATE_LIMIT, APPLICATION_CONCURRENCY 등을 충분히 크게 설정)
+
+    gunicorn configs.wsgi:application --workers 1 --bind 0.0.0.0:8000
+    APPLICATION_VIEW_ASYNC=True gunicorn configs.asgi:application -k uvicorn_worker.UvicornWorker --workers 1 --bind 0.0.0.0:8000
+
+    python benchmarks/load_test.py --url http://localhost:8000/recruitments/application/ --clients 100 --interval 0 --server-workers 1
+
+DB 연결 재사용 전후의 p50, p99 비교 (같은 서버 설정에서 .env만 바꿔 가며 실행)
+
+    DB_CONN_MAX_AGE=0   # 요청마다 새로 연결 (기존 동작)
+    DB_CONN_MAX_AGE=60  # 스레드마다 연결 유지
+    DB_POOL=True        # 워커마다 연결 풀
+
+    python benchmarks/load_test.py --url http://localhost:8000/recruitments/application/ --clients 20 --interval 0.2 --duration 60
+
+풀을 쓰는 경우 GET /health/database/ (관리자)로 연결 대기 통계를 확인할 수 있습니다.
+"""
+import argparse
+import random
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+
+def build_multipart(fields:dict, files:dict)->tuple[bytes, str]:
+    boundary = uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        values = value if isinstance(value, list) else [value]
+        for v in values:
+            parts.append(
+                f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{v}\r\n'.encode()
+            )
+    for name, (file_name, content) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{file_name}"\r\n'
+            f'Content-Type: application/octet-stream\r\n\r\n'.encode() + content + b"\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n".encode())
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+def application_fields()->dict:
+    student_number = f"{random.randint(2000000, 2599999)}"
+    return {
+        "student_number": student_number,
+        "name": "부하테스트",
+        "department": "컴퓨터공학과",
+        "grade": 2,
+        "phone_number": f"010-{random.randint(1000, 9999)}-{random.randint(1000, 9999)}",
+        "interview_method": "OFFLINE",
+        "part": "BACKEND",
+        **{f"personal_statement_{i}": "자기소개" * 50 for i in range(1, 6)},
+    }
+
+
+def send(url:str, body:bytes, content_type:str, client_ip:str, timeout:float)->tuple[int, float]:
+    request = urllib.request.Request(
+        url,
+        data=body,
+        method="POST",
+        headers={"Content-Type": content_type, "X-Forwarded-For": client_ip},
+    )
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except Exception:
+        status = 0 # 연결 실패, 타임아웃
+    return status, time.perf_counter() - started
+
+
+class Group:
+    def __init__(self, name:str):
+        self.name = name
+        self.lock = threading.Lock()
+        self.statuses = Counter()
+        self.latencies = []
+
+    def record(self, status:int, latency:float):
+        with self.lock:
+            self.statuses[status] += 1
+            self.latencies.append(latency)
+
+    def report(self, duration:float, server_workers:int=1)->str:
+        if not self.latencies:
+            return f"{self.name}: 요청 없음"
+        latencies = sorted(self.latencies)
+        p50 = statistics.median(latencies)
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        served = sum(count for status, count in self.statuses.items() if status and status != 429)
+        return (
+            f"{self.name}: requests={len(latencies)} served/s={served / duration:.1f} "
+            f"served/s/worker={served / duration / server_workers:.1f} "
+            f"p50={p50 * 1000:.0f}ms p99={p99 * 1000:.0f}ms statuses={dict(sorted(self.statuses.items()))}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--clients", type=int, default=20, help="일반 지원자 수 (클라이언트마다 다른 IP)")
+    parser.add_argument("--interval", type=float, default=1.0, help="일반 지원자의 요청 간격 (초)")
+    parser.add_argument("--abusers", type=int, default=0, help="악성 요청을 보내는 스레드 수 (모두 같은 IP)")
+    parser.add_argument("--abuse-size", type=int, default=10, help="악성 요청 본문 크기 (MB)")
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--server-workers", type=int, default=1, help="서버 워커 프로세스 수 (워커당 처리량 계산용)")
+    args = parser.parse_args()
+
+    deadline = time.monotonic() + args.duration
+    legit = Group("legit")
+    abuse = Group("abuse")
+
+    abuse_body, abuse_content_type = build_multipart(
+        application_fields(),
+        {"portfolios": ("portfolio.pdf", b"%PDF-" + b"0" * (args.abuse_size * 1024 * 1024))},
+    )
+
+    def run_legit(index:int):
+        client_ip = f"10.0.{index // 256}.{index % 256}"
+        while time.monotonic() < deadline:
+            body, content_type = build_multipart(application_fields(), {})
+            legit.record(*send(args.url, body, content_type, client_ip, args.timeout))
+            time.sleep(args.interval)
+
+    def run_abuse():
+        while time.monotonic() < deadline:
+            abuse.record(*send(args.url, abuse_body, abuse_content_type, "203.0.113.1", args.timeout))
+
+    with ThreadPoolExecutor(max_workers=args.clients + args.abusers) as executor:
+        for i in range(args.clients):
+            executor.submit(run_legit, i)
+        for _ in range(args.abusers):
+            executor.submit(run_abuse)
+
+    print(legit.report(args.duration, args.server_workers))
+    if args.abusers:
+        print(abuse.report(args.duration, args.server_workers))
+
+
+if __name__ == "__main__":
+    main()
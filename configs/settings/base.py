@@ -1,6 +1,7 @@
 from datetime import timedelta
 import os
 from pathlib import Path
+from boto3.s3.transfer import TransferConfig
 import environ
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -33,6 +34,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'utils.middlewares.PerformanceMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -132,6 +134,8 @@ CORS_ALLOW_HEADERS = (
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
+    'idempotency-key',
+    'student-number',
 )
 
 CORS_ALLOW_CREDENTIALS = True
@@ -184,9 +188,19 @@ AWS_DEFAULT_ACL = None
 # S3 파일 URL에 서명 토큰을 붙일지 여부
 AWS_QUERYSTRING_AUTH = False
 
+# 로컬 S3 호환 서버(MinIO 등)로 테스트할 때 사용하는 엔드포인트
+AWS_S3_ENDPOINT_URL = env('AWS_S3_ENDPOINT_URL', default=None) or None
+
+# 8MB를 넘는 파일은 멀티파트로 나누어 업로드
+AWS_S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8*1024*1024,
+    multipart_chunksize=8*1024*1024,
+    max_concurrency=4,
+)
+
 STORAGES = {
     "default": {
-        "BACKEND": "configs.storages.CustomS3Storage",
+        "BACKEND": "configs.storages.ContentAddressedS3Storage",
         "OPTIONS": {
             "location": "media",
         },
@@ -197,3 +211,81 @@ STORAGES = {
 }
 
 MEDIA_URL = f"https://{AWS_S3_CUSTOM_DOMAIN}/media/"
+
+
+# 지원서 첨부 파일 비동기 업로드 (recruitments.services.ApplicationAttachmentService)
+
+# 웹 서버와 업로드 워커가 함께 접근할 수 있는 디렉터리여야 함
+ATTACHMENT_STAGING_ROOT = env('ATTACHMENT_STAGING_ROOT', default=os.path.join(BASE_DIR, 'staging'))
+
+# 업로드 워커 한 프로세스에서 동시에 업로드하는 파일 수
+ATTACHMENT_UPLOAD_WORKERS = env.int('ATTACHMENT_UPLOAD_WORKERS', default=4)
+
+ATTACHMENT_UPLOAD_MAX_ATTEMPTS = 3
+
+# S3 직접 업로드용 presigned POST 정책의 유효 시간 (초)
+ATTACHMENT_PRESIGNED_POST_EXPIRES = 600
+
+# 발급한 키(학번, 필드에 묶어 서명)를 지원서 제출에 사용할 수 있는 시간 (초)
+ATTACHMENT_SOURCE_KEY_MAX_AGE = 60*60*3
+
+# 이미지 첨부 파일 정규화 (utils.files.normalize_image)
+
+# 업로드 워커 한 프로세스에서 이미지 변환에 사용하는 프로세스 수
+IMAGE_PROCESS_WORKERS = env.int('IMAGE_PROCESS_WORKERS', default=2)
+
+# 긴 변 기준 최대 크기(px), 썸네일 크기(px), 저장 형식(WEBP 또는 JPEG), 인코딩 품질
+IMAGE_MAX_DIMENSION = 2048
+IMAGE_THUMBNAIL_SIZE = 320
+IMAGE_FORMAT = 'WEBP'
+IMAGE_QUALITY = 85
+
+
+# 지원서 제출 요청 제한 (utils.decorators.view.rate_limit)
+
+# IP별 요청 빈도 (횟수/기간), IP별 동시 처리 수, 전체 동시 처리 수
+APPLICATION_RATE_LIMIT = env('APPLICATION_RATE_LIMIT', default='10/m')
+APPLICATION_CONCURRENCY_PER_IP = env.int('APPLICATION_CONCURRENCY_PER_IP', default=2)
+APPLICATION_CONCURRENCY = env.int('APPLICATION_CONCURRENCY', default=8)
+
+# ASGI 서버(SERVER=asgi)로 실행할 때 지원서 제출을 비동기 뷰(AsyncApplicationView)로 처리
+APPLICATION_VIEW_ASYNC = env.bool('APPLICATION_VIEW_ASYNC', default=False)
+
+
+# 요청 성능 측정 (utils.middlewares.PerformanceMiddleware)
+
+# 응답에 Server-Timing 헤더를 붙일지 여부
+PERFORMANCE_SERVER_TIMING = env.bool('PERFORMANCE_SERVER_TIMING', default=True)
+
+# URL 패턴별 통계를 모아 /metrics(Prometheus 형식)로 노출할지 여부
+# Authorization: Bearer <METRICS_TOKEN> 헤더가 있어야 조회 가능 (METRICS_TOKEN이 없으면 항상 404)
+METRICS_ENABLED = env.bool('METRICS_ENABLED', default=False)
+METRICS_TOKEN = env('METRICS_TOKEN', default='')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        # 요청마다 JSON 한 줄 (WARNING으로 설정하면 남기지 않음)
+        'performance': {
+            'handlers': ['console'],
+            'level': env('PERFORMANCE_LOG_LEVEL', default='INFO'),
+            'propagate': False,
+        },
+    },
+}
+
+
+# 지원서 개인정보 암호화 (utils.encryption)
+
+# AES-256 마스터 키 목록 (URL-safe base64로 표기한 32바이트, 쉼표로 구분)
+# 첫 번째 키로 암호화하고, 키를 교체할 때는 새 키를 맨 앞에 추가한 뒤 기존 키를 남겨 둠
+FIELD_ENCRYPTION_KEYS = env.list('FIELD_ENCRYPTION_KEYS', default=[])
+
+# 지원 코드를 저장·조회할 때 사용하는 HMAC 키 (바꾸면 이미 저장된 지원 코드로 조회할 수 없음)
+APPLICATION_CODE_HMAC_KEY = env('APPLICATION_CODE_HMAC_KEY', default=SECRET_KEY)
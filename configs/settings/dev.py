@@ -9,6 +9,11 @@ DATABASES = {
 
 CACHES = {
     'default': env.cache(),
+    # 프로세스 메모리 캐시 (utils.caches.AbstractTwoTierCache의 1단계)
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {'MAX_ENTRIES': 256},
+    },
 }
 
 ALLOWED_HOSTS = env.list('ALLOWED_HOSTS', default=[])
@@ -3,15 +3,37 @@ import environ
 
 environ.Env.read_env(os.path.join(BASE_DIR, '.env', 'prod'))
 
+# 데이터베이스 연결 재사용 (요청마다 Postgres에 새로 연결하면 TLS 핸드셰이크 비용이 듦)
+# DB_POOL=True: 워커 프로세스마다 psycopg 연결 풀을 두고 요청이 끝나면 연결을 풀에 돌려줌 (ASGI에서는 이 방식을 사용)
+# DB_POOL=False: 스레드마다 연결을 DB_CONN_MAX_AGE초 동안 유지 (0이면 요청마다 새로 연결)
+DB_POOL = env.bool('DB_POOL', default=False)
+
 DATABASES = {
     'default': {
         **env.db(),
+        'CONN_MAX_AGE': 0 if DB_POOL else env.int('DB_CONN_MAX_AGE', default=60),
+        'CONN_HEALTH_CHECKS': True, # 유지한 연결을 재사용하기 전에 끊겼는지 확인
         'OPTIONS': {'sslmode': 'require'},
     }
 }
 
+if DB_POOL:
+    # 풀에서 꺼낼 때 연결이 살아 있는지는 Django가 확인함 (ConnectionPool.check_connection)
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': env.int('DB_POOL_MIN_SIZE', default=1),
+        'max_size': env.int('DB_POOL_MAX_SIZE', default=4),
+        'timeout': env.float('DB_POOL_TIMEOUT', default=10), # 연결을 기다리는 최대 시간 (초)
+        'max_idle': env.float('DB_POOL_MAX_IDLE', default=300),
+        'max_lifetime': env.float('DB_POOL_MAX_LIFETIME', default=1800),
+    }
+
 CACHES = {
     'default': env.cache(),
+    # 프로세스 메모리 캐시 (utils.caches.AbstractTwoTierCache의 1단계)
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {'MAX_ENTRIES': 256},
+    },
 }
 
 ALLOWED_HOSTS = env.list('ALLOWED_HOSTS', default=[])
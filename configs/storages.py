@@ -1,8 +1,25 @@
+import base64
+import hashlib
 import os
+import re
+import time
+from tempfile import SpooledTemporaryFile
 from uuid import uuid4
+from django.core.cache import cache
+from django.core.files import File
 from storages.backends.s3boto3 import S3Boto3Storage
+from storages.utils import clean_name, is_seekable
+from utils.caches import AbstractRedisSet
+from utils.constants import CacheKey
+from utils.metrics import record_s3
 
 class CustomS3Storage(S3Boto3Storage):
+    def _save(self, name, content):
+        started = time.perf_counter()
+        name = super()._save(name, content)
+        record_s3(getattr(content, "size", 0) or 0, time.perf_counter() - started)
+        return name
+
     def get_available_name(self, name, max_length=None):
         dir_name, file_name = os.path.split(name)
         ext = os.path.splitext(file_name)[1]
@@ -10,3 +27,139 @@ class CustomS3Storage(S3Boto3Storage):
         new_name = f"{uuid4()}{ext.lower()}"
 
         return os.path.join(dir_name, new_name)
+
+    def generate_presigned_post(self, name:str, fields:dict|None=None, conditions:list|None=None, expires_in:int=600)->tuple[str, dict]:
+        """
+        클라이언트가 S3에 직접 업로드할 수 있는 presigned POST 정책을 발급합니다.
+        Returns: (스토리지 기준 파일명, {"url": ..., "fields": {...}})
+        """
+        name = self.get_available_name(name)
+        key = self._normalize_name(clean_name(name))
+
+        presigned_post = self.connection.meta.client.generate_presigned_post(
+            Bucket=self.bucket_name,
+            Key=key,
+            Fields=fields,
+            Conditions=conditions,
+            ExpiresIn=expires_in,
+        )
+
+        return name, presigned_post
+
+    def download_fileobj(self, name:str, fileobj):
+        """
+        파일을 fileobj에 내려받습니다. (큰 파일은 AWS_S3_TRANSFER_CONFIG에 따라 나누어 동시에 받음)
+        open()과 달리 파일 전체를 메모리에 올리지 않습니다.
+        """
+        key = self._normalize_name(clean_name(name))
+        self.bucket.download_fileobj(key, fileobj, Config=self.transfer_config)
+
+def set_storage_reference(content:File, instance, field_name:str)->File:
+    """
+    content를 저장할 모델 필드를 표시합니다. (ContentAddressedS3Storage의 참조 이름으로 사용)
+    같은 필드에 여러 번 저장해도(업로드 재시도 등) 참조는 하나만 남습니다.
+    """
+    content.storage_reference = get_storage_reference(instance._meta.label_lower, instance.pk, field_name)
+    return content
+
+def get_storage_reference(model_label:str, pk, field_name:str)->str:
+    return f"{model_label}:{pk}:{field_name}"
+
+def delete_storage_reference(instance, field_name:str):
+    """
+    instance의 field_name 필드가 가리키는 파일에서 그 필드의 참조만 빼고, 다른 참조가 없으면 파일을 삭제합니다.
+    """
+    field_file = getattr(instance, field_name)
+    if not field_file:
+        return
+    if isinstance(field_file.storage, ContentAddressedS3Storage):
+        reference = get_storage_reference(instance._meta.label_lower, instance.pk, field_name)
+        field_file.storage.delete(field_file.name, reference=reference)
+    else:
+        field_file.storage.delete(field_file.name)
+
+class ContentAddressedS3Storage(CustomS3Storage):
+    """
+    파일 내용의 SHA-256을 파일명으로 저장하는 S3 스토리지 (같은 내용의 파일은 한 번만 저장)
+
+    - 저장: 내용을 해시해 "디렉터리/<sha256>.<확장자>"로 저장하고, 이미 있으면 업로드를 생략합니다.
+      (FileField 기본 max_length 100자에 맞도록 해시는 base32 소문자 52자로 표기)
+    - 참조: 파일마다 참조하는 필드(set_storage_reference)의 집합을 Redis에 두고, 업로드에 실패하면 이번 저장에서
+      추가한 참조를 되돌립니다. 삭제할 때는 삭제하는 필드의 참조만 빼고(delete_storage_reference),
+      남은 참조가 없으면 실제로 삭제합니다.
+      참조 집합이 없으면(Redis 초기화 등) 다른 지원서가 쓰고 있을 수 있으므로 삭제하지 않습니다.
+      (rebuild_storage_refcounts 명령어로 데이터베이스 기준으로 다시 계산)
+    - 해시 형식이 아닌 파일(uuid4 이름)은 CustomS3Storage와 같이 바로 삭제합니다.
+      presigned POST로 클라이언트가 직접 올린 파일(generate_presigned_post)은 uuid4 이름으로 올라가며,
+      업로드 워커가 내려받아 검증한 뒤 이 스토리지에 다시 저장하고 원본은 삭제합니다.
+    """
+    hash_chunk_size = 1024*1024
+    lock_timeout = 30
+
+    def _save(self, name, content):
+        # 참조할 필드를 표시하지 않은 저장은 저장할 때마다 새 참조로 셈
+        reference = getattr(content, "storage_reference", None) or uuid4().hex
+
+        if not is_seekable(content):
+            # 해시 후 다시 읽어야 하므로 임시 파일에 옮김 (작은 파일은 메모리에 유지)
+            spooled = SpooledTemporaryFile(max_size=self.hash_chunk_size)
+            for chunk in content.chunks() if hasattr(content, "chunks") else iter(lambda: content.read(self.hash_chunk_size), b""):
+                spooled.write(chunk)
+            content = File(spooled, name=getattr(content, "name", name))
+
+        # 호출한 쪽에서 이미 계산한 해시(16진수, content.sha256)가 있으면 다시 읽지 않음
+        if getattr(content, "sha256", None):
+            sha256_digest = bytes.fromhex(content.sha256)
+        else:
+            content.seek(0)
+            sha256 = hashlib.sha256()
+            while chunk := content.read(self.hash_chunk_size):
+                sha256.update(chunk)
+            sha256_digest = sha256.digest()
+        content.seek(0)
+
+        dir_name = os.path.dirname(name)
+        ext = os.path.splitext(name)[1].lower()
+        digest = base64.b32encode(sha256_digest).decode().rstrip("=").lower()
+        name = os.path.join(dir_name, f"{digest}{ext}")
+
+        # 참조를 먼저 추가해 두어, 같은 파일의 삭제와 겹쳐도 업로드한 파일이 지워지지 않게 함
+        references = self.get_references(name)
+        with self.lock(name):
+            added = references.add(reference)
+            exists = self.exists(name)
+        if exists:
+            return clean_name(name)
+
+        try:
+            return super()._save(name, content)
+        except Exception:
+            if added:
+                with self.lock(name):
+                    references.remove(reference)
+            raise
+
+    def delete(self, name, reference:str|None=None):
+        """
+        reference(set_storage_reference와 같은 참조 이름)를 참조 집합에서 빼고, 남은 참조가 없으면 실제로 삭제합니다.
+        누구의 참조인지 모르면(reference가 None, 예: FieldFile.delete) 다른 필드가 쓰고 있을 수 있으므로 삭제하지 않습니다.
+        """
+        if not self.is_content_addressed(name):
+            return super().delete(name)
+        if reference is None:
+            return
+
+        with self.lock(name):
+            references = self.get_references(name)
+            if not references.remove(reference) or references.count():
+                return
+            super().delete(name)
+
+    def is_content_addressed(self, name:str)->bool:
+        return bool(re.fullmatch(r"[a-z2-7]{52}(\.\w+)?", os.path.basename(name)))
+
+    def get_references(self, name:str)->AbstractRedisSet:
+        return AbstractRedisSet(CacheKey.STORAGE_REFERENCES.format(name=clean_name(name)))
+
+    def lock(self, name:str):
+        return cache.lock(f"{self.get_references(name).key}:lock", timeout=self.lock_timeout)
@@ -0,0 +1,136 @@
+import hashlib
+from types import SimpleNamespace
+from unittest import mock
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from storages.backends.s3boto3 import S3Boto3Storage
+from utils.metrics import RequestMetricsRegistry, record_cache, record_s3
+from utils.middlewares import PerformanceMiddleware
+from .storages import ContentAddressedS3Storage, get_storage_reference
+from .urls import metrics
+
+class ContentAddressedS3StorageTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        # S3 대신 딕셔너리에 저장
+        self.bucket = dict()
+        patches = [
+            mock.patch.object(S3Boto3Storage, "_save", lambda storage, name, content: self.upload(name, content)),
+            mock.patch.object(S3Boto3Storage, "exists", lambda storage, name: name in self.bucket),
+            mock.patch.object(S3Boto3Storage, "delete", lambda storage, name: self.bucket.pop(name, None)),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.storage = ContentAddressedS3Storage()
+
+    def upload(self, name:str, content)->str:
+        self.bucket[name] = content.read()
+        return name
+
+    def save(self, pk:str, content:bytes=b"%PDF-1.7 same")->tuple[str, str]:
+        file = ContentFile(content)
+        file.storage_reference = get_storage_reference("recruitments.application", pk, "portfolio_1")
+        return self.storage.save("portfolio/a.pdf", file), file.storage_reference
+
+    def test_shared_file_survives_until_last_reference_is_deleted(self):
+        name, a = self.save("A")
+        _, b = self.save("B")
+        self.assertEqual(self.storage.get_references(name).count(), 2)
+
+        # A 삭제 -> 다시 저장 -> B 삭제: A가 가리키는 파일은 남아 있어야 함
+        self.storage.delete(name, reference=a)
+        self.assertIn(name, self.bucket)
+        self.save("A")
+        self.storage.delete(name, reference=b)
+        self.assertIn(name, self.bucket)
+        self.assertTrue(self.storage.get_references(name).contains(a))
+
+        self.storage.delete(name, reference=a)
+        self.assertNotIn(name, self.bucket)
+
+    def test_repeated_delete_and_unknown_reference(self):
+        name, a = self.save("A")
+        _, b = self.save("B")
+        self.storage.delete(name, reference=a)
+        self.storage.delete(name, reference=a)
+        self.storage.delete(name)
+        self.assertIn(name, self.bucket)
+        self.assertEqual(self.storage.get_references(name).count(), 1)
+
+    def test_resave_same_field_is_idempotent(self):
+        name, a = self.save("A")
+        self.save("A")
+        self.assertEqual(self.storage.get_references(name).count(), 1)
+        self.storage.delete(name, reference=a)
+        self.assertNotIn(name, self.bucket)
+
+    def test_failed_upload_rolls_back_reference(self):
+        with mock.patch.object(S3Boto3Storage, "_save", side_effect=IOError("S3 오류")):
+            with self.assertRaises(IOError):
+                self.save("A")
+        name, _ = self.save("B")
+        self.assertEqual(self.storage.get_references(name).count(), 1)
+
+    def test_uses_precomputed_sha256(self):
+        content = b"%PDF-1.7 same"
+        name, _ = self.save("A", content)
+
+        # 미리 계산한 해시가 있으면 내용을 다시 해시하지 않고 그 해시로 이름을 정함
+        file = ContentFile(content)
+        file.sha256 = hashlib.sha256(content).hexdigest()
+        with mock.patch("configs.storages.hashlib.sha256") as sha256:
+            self.assertEqual(self.storage.save("portfolio/a.pdf", file), name)
+        sha256.assert_not_called()
+
+@override_settings(PERFORMANCE_SERVER_TIMING=True, METRICS_ENABLED=True)
+class PerformanceMiddlewareTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.registry = RequestMetricsRegistry(key="test_request_metrics")
+        patch = mock.patch("utils.middlewares.request_metrics_registry", self.registry)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def get_response(self, request):
+        request.resolver_match = SimpleNamespace(route="recruitments/", view_name="application")
+        record_cache(True)
+        record_cache(False)
+        record_s3(1024, 0.5)
+        return HttpResponse(status=201)
+
+    def test_server_timing_and_render(self):
+        with self.assertLogs("performance", "INFO") as logs:
+            response = PerformanceMiddleware(self.get_response)(RequestFactory().post("/recruitments/"))
+        self.assertIn('"route": "recruitments/"', logs.output[0])
+
+        server_timing = response["Server-Timing"]
+        self.assertIn("total;dur=", server_timing)
+        self.assertIn('cache;desc="1 hits, 1 misses"', server_timing)
+        self.assertIn('s3;dur=500.0;desc="1024 bytes"', server_timing)
+
+        self.registry.flush()
+        rendered = self.registry.render()
+        labels = 'route="recruitments/",method="POST",status="2xx"'
+        self.assertIn(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1', rendered)
+        self.assertIn(f"http_request_duration_seconds_count{{{labels}}} 1", rendered)
+        self.assertIn(f"http_request_cache_hits_total{{{labels}}} 1", rendered)
+        self.assertIn(f"http_request_s3_bytes_total{{{labels}}} 1024", rendered)
+
+class MetricsViewTest(SimpleTestCase):
+    def request(self, authorization:str|None=None):
+        headers = {"Authorization": authorization} if authorization else {}
+        return metrics(RequestFactory().get("/metrics", headers=headers))
+
+    @override_settings(METRICS_TOKEN="")
+    def test_denied_without_token_setting(self):
+        self.assertEqual(self.request().status_code, 404)
+        self.assertEqual(self.request("Bearer ").status_code, 404)
+
+    @override_settings(METRICS_TOKEN="secret")
+    def test_requires_bearer_token(self):
+        self.assertEqual(self.request().status_code, 401)
+        self.assertEqual(self.request("Bearer wrong").status_code, 401)
+        self.assertEqual(self.request("Bearer secret").status_code, 200)
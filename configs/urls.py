@@ -1,15 +1,41 @@
+import hmac
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from utils.helpers import get_database_pool_stats
+from utils.metrics import request_metrics_registry
 
 def health_check(request):
     return JsonResponse({"status": "ok"}, status=200)
 
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def database_pool_stats(request):
+    # 요청을 처리한 워커 프로세스의 연결 풀 통계 (워커마다 풀이 따로 있음)
+    return Response({"pool": get_database_pool_stats()})
+
+def metrics(request):
+    # Prometheus 형식의 요청 통계 (모든 워커의 합계)
+    # METRICS_TOKEN이 없으면 누구도 조회할 수 없도록 경로가 없는 것처럼 응답
+    if not settings.METRICS_TOKEN:
+        return JsonResponse({"detail": "찾을 수 없습니다."}, status=404)
+    authorization = request.headers.get("Authorization", "")
+    if not hmac.compare_digest(authorization, f"Bearer {settings.METRICS_TOKEN}"):
+        return JsonResponse({"detail": "인증이 필요합니다."}, status=401)
+    return HttpResponse(request_metrics_registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
 urlpatterns = [
     path('', health_check, name='health-check'),
+    path('health/database/', database_pool_stats, name='database-pool-stats'),
     path('admin/', admin.site.urls),
     path('accounts/', include('accounts.urls')),
     path('recruitments/', include('recruitments.urls')),
 ] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+
+if settings.METRICS_ENABLED:
+    urlpatterns.append(path('metrics', metrics, name='metrics'))
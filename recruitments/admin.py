@@ -1,6 +1,9 @@
 from django.contrib import admin
-from .models import RecruitmentSchedule, InterviewSchedule, Application
+from .models import RecruitmentSchedule, InterviewSchedule, Application, ApplicationAttachment, Review, ApplicationScoreSummary
 
 admin.site.register(RecruitmentSchedule)
 admin.site.register(InterviewSchedule)
 admin.site.register(Application)
+admin.site.register(ApplicationAttachment)
+admin.site.register(Review)
+admin.site.register(ApplicationScoreSummary)
@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class RecruitmentsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'recruitments'
+
+    def ready(self):
+        from . import signals
+        from utils.encryption import check_master_keys
+        checks.register(check_master_keys)
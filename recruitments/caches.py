@@ -0,0 +1,100 @@
+from utils.caches import AbstractCache, AbstractTwoTierCache, AbstractRedisCounter, AbstractRedisHash, AbstractRedisQueue, AbstractRedisSet
+from utils.constants import CacheKey
+
+class RecruitmentScheduleCache(AbstractTwoTierCache):
+    """
+    특정 연도의 모집 일정(RecruitmentSchedule) 캐시
+    """
+    def __init__(self, year:int):
+        super().__init__(CacheKey.RECRUITMENT_SCHEDULE.format(year=year))
+
+class InterviewSchedulesCache(AbstractTwoTierCache):
+    """
+    특정 연도의 면접 일정(InterviewSchedule) 목록 캐시 (start 오름차순)
+    """
+    def __init__(self, year:int):
+        super().__init__(CacheKey.INTERVIEW_SCHEDULES.format(year=year))
+
+class InterviewIntervalIndexCache(AbstractTwoTierCache):
+    """
+    특정 연도의 면접 가능 시간 구간 인덱스(utils.helpers.IntervalIndex) 캐시
+    """
+    def __init__(self, year:int):
+        super().__init__(CacheKey.INTERVIEW_INTERVAL_INDEX.format(year=year))
+
+class RecruitmentPhaseCache(AbstractTwoTierCache):
+    """
+    특정 연도의 현재 모집 단계(recruitments.services.RecruitmentPhase) 캐시 (다음 단계가 시작될 때까지)
+    """
+    def __init__(self, year:int):
+        super().__init__(CacheKey.RECRUITMENT_PHASE.format(year=year))
+
+class InterviewSlotLimitsCache(AbstractTwoTierCache):
+    """
+    특정 연도의 면접 슬롯별 선택 가능 인원 캐시 (슬롯 시작 시각의 타임스탬프 -> 인원, None이면 제한 없음)
+    """
+    def __init__(self, year:int):
+        super().__init__(CacheKey.INTERVIEW_SLOT_LIMITS.format(year=year))
+
+class InterviewSlotCounter(AbstractRedisCounter):
+    """
+    특정 연도의 면접 슬롯별 선택 인원 (슬롯 시작 시각의 타임스탬프 -> 인원)
+    """
+    def __init__(self, year:int):
+        super().__init__(CacheKey.INTERVIEW_SLOT_COUNTS.format(year=year))
+
+class AttachmentUploadQueue(AbstractRedisQueue):
+    """
+    S3 업로드를 기다리는 ApplicationAttachment id 큐
+    """
+    def __init__(self):
+        super().__init__(CacheKey.ATTACHMENT_UPLOAD_QUEUE.value)
+
+class ApplicationResultHash(AbstractRedisHash):
+    """
+    특정 연도의 합격자 조회용 해시 (hash_application_code(지원 코드) -> 결과)
+    """
+    def __init__(self, year:int):
+        super().__init__(CacheKey.APPLICATION_RESULTS.format(year=year))
+
+class ScheduleVersionCache(AbstractCache):
+    """
+    특정 연도의 모집·면접 일정 버전 (일정이 바뀔 때마다 1씩 증가)
+    """
+    def __init__(self, year:int):
+        super().__init__(CacheKey.SCHEDULE_VERSION.format(year=year))
+
+class PublicScheduleCache(AbstractTwoTierCache):
+    """
+    공개 모집 일정 응답 캐시 (일정 버전별이므로 버전이 같으면 내용도 같음)
+    """
+    def __init__(self, year:int, version:int):
+        super().__init__(CacheKey.PUBLIC_SCHEDULE.format(year=year, version=version))
+
+class PublicInterviewSlotsCache(AbstractTwoTierCache):
+    """
+    공개 면접 슬롯 목록 응답 캐시 (일정 버전별)
+    """
+    def __init__(self, year:int, version:int):
+        super().__init__(CacheKey.PUBLIC_INTERVIEW_SLOTS.format(year=year, version=version))
+
+class SlotDemandCache(AbstractCache):
+    """
+    면접 슬롯별·파트별 선택 인원 집계 캐시 (일정 버전별)
+    """
+    def __init__(self, year:int, status:str|None, version:int):
+        super().__init__(CacheKey.SLOT_DEMAND.format(year=year, status=status or "ALL", version=version))
+
+class SubmittedStudentNumberSet(AbstractRedisSet):
+    """
+    특정 연도에 지원서를 제출한 학번 집합 (중복 제출을 데이터베이스 조회 없이 거르기 위함)
+    """
+    def __init__(self, year:int):
+        super().__init__(CacheKey.SUBMITTED_STUDENT_NUMBERS.format(year=year))
+
+class PdfVerdictCache(AbstractCache):
+    """
+    PDF 검증 결과 (파일 내용의 SHA-256별)
+    """
+    def __init__(self, sha256:str):
+        super().__init__(CacheKey.PDF_VERDICT.format(sha256=sha256))
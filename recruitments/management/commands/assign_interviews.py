@@ -0,0 +1,84 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.timezone import localtime
+
+from recruitments.services import InterviewAssignmentService
+from utils.choices import PartChoices
+
+
+class Command(BaseCommand):
+    help = (
+        "1차 합격자에게 면접 가능 시간 중 하나를 자동으로 배정하고 interview_at에 일괄 저장합니다.\n"
+        "슬롯(파트별 30분, 면접 방식과 관계없이 공유)마다 --capacity 명까지 배정하며, 배정하지 못한 지원자를 출력합니다.\n"
+        "이미 면접 시각이 있는 지원자(수동 배정 포함)는 그대로 두며, --reassign을 주면 모두 다시 배정합니다.\n\n"
+        "예) python manage.py assign_interviews --capacity BACKEND=2 --capacity FRONTEND=2 --dry-run"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--year",
+            default=timezone.localdate().year,
+            type=int,
+            help="모집 연도 (기본 올해)",
+        )
+        parser.add_argument(
+            "--capacity",
+            action="append",
+            default=[],
+            metavar="PART=N",
+            help="파트별 슬롯당 면접 인원 (지정하지 않은 파트는 --default-capacity)",
+        )
+        parser.add_argument(
+            "--default-capacity",
+            default=1,
+            type=int,
+            help="슬롯당 면접 인원 기본값 (기본 1)",
+        )
+        parser.add_argument(
+            "--reassign",
+            action="store_true",
+            help="이미 배정된 면접 시각도 무시하고 모두 다시 배정합니다. (배정하지 못한 지원자의 면접 시각은 비움)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="DB 반영 없이 배정 결과만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run: bool = options["dry_run"]
+
+        capacities = dict()
+        for value in options["capacity"]:
+            part, _, capacity = value.partition("=")
+            if part not in PartChoices.values or not capacity.isdigit():
+                raise CommandError(f"잘못된 --capacity 값입니다: {value!r} (예: BACKEND=2)")
+            capacities[part] = int(capacity)
+
+        service = InterviewAssignmentService(
+            year=options["year"],
+            capacities=capacities,
+            default_capacity=options["default_capacity"],
+        )
+
+        started_at = time.perf_counter()
+        assignments = service.assign(dry_run=dry_run, reassign=options["reassign"])
+        elapsed = time.perf_counter() - started_at
+
+        self.stdout.write("student_number\tinterview_at")
+        unassigned = list()
+        for student_number, interview_at in assignments.items():
+            if interview_at is None:
+                unassigned.append(student_number)
+                continue
+            self.stdout.write(f"{student_number}\t{localtime(interview_at).strftime('%Y-%m-%d %H:%M')}")
+
+        for student_number in unassigned:
+            self.stderr.write(f"{student_number}\t배정 불가")
+
+        mode = "DRY-RUN" if dry_run else "APPLIED"
+        self.stdout.write(
+            f"\n[{mode}] assigned={len(assignments) - len(unassigned)}, unassigned={len(unassigned)}, elapsed={elapsed:.3f}s"
+        )
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from recruitments.services import ApplicationExportService
+
+
+class Command(BaseCommand):
+    help = (
+        "해당 연도 지원서 전체를 CSV 파일로 내보냅니다. --zip을 사용하면 첨부 파일을 포함한 ZIP 파일로 내보냅니다.\n"
+        "지원서와 첨부 파일을 조금씩 읽어 바로 파일에 쓰므로, 지원서 수와 관계없이 메모리를 일정하게 사용합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "output",
+            type=str,
+            help="저장할 파일 경로",
+        )
+        parser.add_argument(
+            "--year",
+            default=timezone.localdate().year,
+            type=int,
+            help="모집 연도 (기본 올해)",
+        )
+        parser.add_argument(
+            "--zip",
+            action="store_true",
+            help="첨부 파일을 포함한 ZIP 파일로 내보냅니다.",
+        )
+        parser.add_argument(
+            "--workers",
+            default=4,
+            type=int,
+            help="--zip 사용 시, S3에서 첨부 파일을 동시에 내려받을 개수 (기본 4)",
+        )
+
+    def handle(self, *args, **options):
+        year: int = options["year"]
+
+        export_service = ApplicationExportService(year=year, download_workers=options["workers"])
+        chunks = export_service.iter_zip() if options["zip"] else export_service.iter_csv()
+
+        written = 0
+        with open(options["output"], "wb") as output:
+            for chunk in chunks:
+                output.write(chunk)
+                written += len(chunk)
+
+        self.stdout.write(self.style.SUCCESS(f"[{year}] {options['output']} ({written} bytes)"))
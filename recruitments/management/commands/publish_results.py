@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from recruitments.services import ApplicationResultService
+
+
+class Command(BaseCommand):
+    help = (
+        "해당 연도 지원서의 합불 결과를 합격자 조회용 Redis 해시로 발표(재생성)합니다.\n"
+        "합격자 조회는 이 해시에서만 하므로, 발표 시작 전에 반드시 실행해야 합니다. (실행 전 조회는 발표 전으로 응답)\n"
+        "발표 후 상태 변경과 면접 배정은 해당 지원서만 자동으로 갱신됩니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--year",
+            default=timezone.localdate().year,
+            type=int,
+            help="모집 연도 (기본 올해)",
+        )
+
+    def handle(self, *args, **options):
+        year: int = options["year"]
+
+        published = ApplicationResultService(year=year).publish()
+
+        self.stdout.write(self.style.SUCCESS(f"[{year}] published={published}"))
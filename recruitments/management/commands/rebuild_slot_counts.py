@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from recruitments.services import InterviewSlotCapacityService
+
+
+class Command(BaseCommand):
+    help = (
+        "해당 연도 지원서로 면접 슬롯별 선택 인원(Redis 카운터)을 다시 만듭니다.\n"
+        "지원서를 제출·삭제할 때마다 카운터에 반영되므로, Redis가 비워졌거나 관리자 페이지에서 "
+        "지원서의 면접 가능 시간을 수정한 경우에만 실행하세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--year",
+            default=timezone.localdate().year,
+            type=int,
+            help="모집 연도 (기본 올해)",
+        )
+
+    def handle(self, *args, **options):
+        year: int = options["year"]
+
+        slots = InterviewSlotCapacityService(year=year).rebuild()
+
+        self.stdout.write(self.style.SUCCESS(f"[{year}] slots={slots}"))
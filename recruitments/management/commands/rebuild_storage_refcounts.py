@@ -0,0 +1,54 @@
+from collections import defaultdict
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import models
+
+from configs.storages import get_storage_reference
+
+
+class Command(BaseCommand):
+    help = (
+        "ContentAddressedS3Storage의 파일별 참조 집합을 데이터베이스의 FileField 값 기준으로 다시 만듭니다.\n"
+        "Redis가 초기화되어 참조가 사라진 뒤에 실행하세요. (참조가 없는 파일은 삭제되지 않음)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="참조를 저장하지 않고 계산 결과만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run: bool = options["dry_run"]
+
+        references = defaultdict(set)
+        storage = None
+        for model in apps.get_models():
+            for field in model._meta.get_fields():
+                if not isinstance(field, models.FileField) or not hasattr(field.storage, "get_references"):
+                    continue
+                storage = field.storage
+                rows = (
+                    model._default_manager
+                    .exclude(**{field.name: ""})
+                    .exclude(**{f"{field.name}__isnull": True})
+                    .values_list("pk", field.name)
+                    .iterator(chunk_size=2000)
+                )
+                for pk, name in rows:
+                    if storage.is_content_addressed(name):
+                        references[name].add(get_storage_reference(model._meta.label_lower, pk, field.name))
+
+        if not dry_run:
+            for name, file_references in references.items():
+                reference_set = storage.get_references(name)
+                with storage.lock(name):
+                    reference_set.delete()
+                    reference_set.add(*file_references)
+
+        mode = "DRY-RUN" if dry_run else "REBUILD"
+        self.stdout.write(self.style.SUCCESS(
+            f"[{mode}] files={len(references)}, references={sum(map(len, references.values()))}"
+        ))
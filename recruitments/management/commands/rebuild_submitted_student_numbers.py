@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from recruitments.services import SubmittedStudentNumberService
+
+
+class Command(BaseCommand):
+    help = (
+        "해당 연도 지원서로 제출 학번 집합(Redis)을 다시 만듭니다.\n"
+        "지원서를 제출·삭제할 때마다 집합에 반영되므로, Redis가 비워진 경우에만 실행하세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--year",
+            default=timezone.localdate().year,
+            type=int,
+            help="모집 연도 (기본 올해)",
+        )
+
+    def handle(self, *args, **options):
+        year: int = options["year"]
+
+        student_numbers = SubmittedStudentNumberService(year=year).rebuild()
+
+        self.stdout.write(self.style.SUCCESS(f"[{year}] student_numbers={student_numbers}"))
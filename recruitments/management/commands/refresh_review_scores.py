@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from recruitments.services import ReviewService
+
+
+class Command(BaseCommand):
+    help = (
+        "해당 연도 서류 평가 집계(ApplicationScoreSummary)를 전체 평가 기준으로 다시 계산합니다.\n"
+        "평가는 저장할 때마다 집계에 반영되므로, 평가를 관리자 페이지 등에서 직접 수정·삭제한 경우에만 실행하세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--year",
+            default=timezone.localdate().year,
+            type=int,
+            help="모집 연도 (기본 올해)",
+        )
+
+    def handle(self, *args, **options):
+        year: int = options["year"]
+
+        refreshed = ReviewService(year=year).refresh()
+
+        self.stdout.write(self.style.SUCCESS(f"[{year}] refreshed={refreshed}"))
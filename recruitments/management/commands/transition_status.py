@@ -0,0 +1,59 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from recruitments.services import ApplicationStatusService
+from utils.choices import StatusChoices
+
+
+class Command(BaseCommand):
+    help = (
+        "콘솔(또는 --file)에서 학번을 한 줄에 하나씩 입력받아 지원서 합불 상태를 --to 상태로 일괄 변경합니다.\n"
+        "학번별 처리 결과(UPDATED, UNCHANGED, NOT_FOUND, INVALID_TRANSITION ...)를 출력합니다.\n\n"
+        "입력 종료: mac/linux Ctrl+D, windows Ctrl+Z 후 Enter"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--to",
+            required=True,
+            choices=StatusChoices.values,
+            help="변경할 상태",
+        )
+        parser.add_argument(
+            "--file",
+            type=str,
+            help="학번 목록 파일 경로 (없으면 표준입력)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="DB 반영 없이 처리 결과만 출력합니다.",
+        )
+
+    def handle(self, *args, **options):
+        target: str = options["to"]
+        dry_run: bool = options["dry_run"]
+
+        try:
+            if options["file"]:
+                with open(options["file"], encoding="utf-8") as f:
+                    input_text = f.read()
+            else:
+                input_text = sys.stdin.read()
+        except Exception as e:
+            raise CommandError(f"입력 읽기 실패: {e}")
+
+        student_numbers = [line.strip() for line in input_text.splitlines() if line.strip()]
+        if not student_numbers:
+            raise CommandError("입력된 학번이 없습니다.")
+
+        results = ApplicationStatusService().transition(targets={target: student_numbers}, dry_run=dry_run)
+
+        self.stdout.write("student_number\tfrom\tto\tresult")
+        for result in results:
+            self.stdout.write(f"{result['student_number']}\t{result['from'] or '-'}\t{result['to']}\t{result['result']}")
+
+        updated = sum(result["result"] == ApplicationStatusService.UPDATED for result in results)
+        mode = "DRY-RUN" if dry_run else "APPLIED"
+        self.stdout.write(f"\n[{mode}] updated={updated}, total={len(results)}")
@@ -0,0 +1,93 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import timedelta
+import multiprocessing
+from threading import BoundedSemaphore
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from recruitments.caches import AttachmentUploadQueue
+from recruitments.services import ApplicationAttachmentService
+
+
+class Command(BaseCommand):
+    help = (
+        "임시 저장된 지원서 첨부 파일을 S3에 업로드하는 워커를 실행합니다.\n"
+        "Redis 큐에서 ApplicationAttachment id를 꺼내 최대 --workers개까지 동시에 업로드합니다.\n"
+        "이미지 정규화는 최대 --image-workers개의 별도 프로세스에서 실행합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            default=settings.ATTACHMENT_UPLOAD_WORKERS,
+            type=int,
+            help=f"동시에 업로드할 파일 수 (기본 {settings.ATTACHMENT_UPLOAD_WORKERS})",
+        )
+        parser.add_argument(
+            "--image-workers",
+            default=settings.IMAGE_PROCESS_WORKERS,
+            type=int,
+            help=f"이미지 정규화에 사용할 프로세스 수 (기본 {settings.IMAGE_PROCESS_WORKERS})",
+        )
+        parser.add_argument(
+            "--requeue",
+            action="store_true",
+            help="시작할 때 업로드가 멈춘 첨부 파일을 다시 큐에 넣습니다.",
+        )
+        parser.add_argument(
+            "--requeue-after",
+            default=10,
+            type=int,
+            help="--requeue 사용 시, 상태가 이 시간(분) 이상 바뀌지 않은 첨부 파일만 다시 넣습니다. (기본 10)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="큐가 빌 때까지만 처리하고 종료합니다.",
+        )
+
+    def handle(self, *args, **options):
+        workers: int = options["workers"]
+        once: bool = options["once"]
+
+        # 업로드 스레드가 돌고 있는 프로세스를 fork하지 않도록 spawn 사용
+        image_executor = ProcessPoolExecutor(
+            max_workers=options["image_workers"],
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        service = ApplicationAttachmentService(image_executor=image_executor)
+        queue = AttachmentUploadQueue()
+
+        if options["requeue"]:
+            requeued = service.requeue_stale(older_than=timedelta(minutes=options["requeue_after"]))
+            self.stdout.write(f"requeued={requeued}")
+
+        self.stdout.write(self.style.SUCCESS(f"업로드 워커 시작 (workers={workers}, image_workers={options['image_workers']})"))
+
+        # 처리 중인 업로드가 workers개이면 큐에서 더 꺼내지 않음 (남은 작업은 다른 워커 프로세스가 가져감)
+        slots = BoundedSemaphore(workers)
+
+        def run(attachment_id: int):
+            try:
+                result = service.upload(attachment_id)
+                if result is not None:
+                    self.stdout.write(f"{attachment_id}\t{result}")
+            except Exception as e:
+                self.stderr.write(f"{attachment_id}\t업로드 실패: {e}")
+            finally:
+                slots.release()
+
+        with image_executor, ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                while True:
+                    slots.acquire()
+                    attachment_id = queue.pop(timeout=1 if once else 5)
+                    if attachment_id is None:
+                        slots.release()
+                        if once:
+                            break
+                        continue
+                    executor.submit(run, attachment_id)
+            except KeyboardInterrupt:
+                self.stdout.write("진행 중인 업로드를 마친 뒤 종료합니다.")
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.9 on 2026-10-18 16:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitments', '0002_remove_application_completed_prerequisites_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationAttachment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('field_name', models.CharField(help_text='업로드 후 파일을 저장할 지원서 필드명', max_length=30)),
+                ('file_name', models.CharField(help_text='업로드된 원본 파일명', max_length=255)),
+                ('staged_path', models.CharField(help_text='로컬 임시 저장 경로', max_length=255)),
+                ('status', models.CharField(choices=[('PENDING', '업로드 대기'), ('UPLOADING', '업로드 중'), ('DONE', '업로드 완료'), ('FAILED', '업로드 실패')], default='PENDING', help_text='업로드 상태', max_length=9)),
+                ('attempts', models.PositiveSmallIntegerField(default=0, help_text='업로드 시도 횟수')),
+                ('error', models.TextField(blank=True, help_text='마지막 업로드 실패 사유')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='첨부 파일 추가 일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='업로드 상태 변경 일시')),
+                ('application', models.ForeignKey(help_text='첨부 파일이 속한 지원서', on_delete=django.db.models.deletion.CASCADE, related_name='attachments', to='recruitments.application')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'updated_at'], name='attachment_status_idx')],
+            },
+        ),
+    ]
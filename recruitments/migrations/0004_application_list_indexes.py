@@ -0,0 +1,21 @@
+# Generated by Django 5.2.9 on 2026-10-18 16:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitments', '0003_application_attachment'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['created_at', 'student_number'], name='application_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['part', 'created_at', 'student_number'], name='application_part_created_idx'),
+        ),
+    ]
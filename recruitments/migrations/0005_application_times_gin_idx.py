@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 16:13
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitments', '0004_application_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['interview_available_times'], name='application_times_gin_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 16:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitments', '0005_application_times_gin_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationattachment',
+            name='thumbnail',
+            field=models.ImageField(blank=True, help_text='이미지 첨부 파일의 썸네일', upload_to='application/thumbnail'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 16:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitments', '0006_application_attachment_thumbnail'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applicationattachment',
+            name='status',
+            field=models.CharField(choices=[('PENDING', '업로드 대기'), ('UPLOADING', '업로드 중'), ('DONE', '업로드 완료'), ('FAILED', '업로드 실패'), ('REJECTED', '파일 검증 실패')], default='PENDING', help_text='업로드 상태', max_length=9),
+        ),
+    ]
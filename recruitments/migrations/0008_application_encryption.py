@@ -0,0 +1,63 @@
+# Generated by Django 5.2.9 on 2026-10-18 16:35
+
+import utils.encryption
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitments', '0007_application_attachment_rejected'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='application',
+            name='application_code',
+            field=models.CharField(help_text='지원 코드의 HMAC-SHA256 (utils.helpers.hash_application_code)', max_length=64),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='birthday',
+            field=utils.encryption.EncryptedDateField(help_text='생년월일'),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='name',
+            field=utils.encryption.EncryptedCharField(help_text='이름', max_length=30),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='personal_statement_1',
+            field=utils.encryption.EncryptedCharField(help_text='자기소개 1번 문항의 답변', max_length=500),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='personal_statement_2',
+            field=utils.encryption.EncryptedCharField(help_text='자기소개 2번 문항의 답변', max_length=500),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='personal_statement_3',
+            field=utils.encryption.EncryptedCharField(help_text='자기소개 3번 문항의 답변', max_length=500),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='personal_statement_4',
+            field=utils.encryption.EncryptedCharField(help_text='자기소개 4번 문항의 답변', max_length=500),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='personal_statement_5',
+            field=utils.encryption.EncryptedTextField(help_text='자기소개 5번 문항의 답변'),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='phone_number',
+            field=utils.encryption.EncryptedCharField(help_text='전화번호', max_length=13),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['application_code'], name='application_code_idx'),
+        ),
+    ]
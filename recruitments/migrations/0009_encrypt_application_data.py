@@ -0,0 +1,78 @@
+from django.db import migrations
+from utils.encryption import TOKEN_PREFIX, DataKey, decrypt_token
+from utils.helpers import hash_application_code
+
+ENCRYPTED_FIELDS = (
+    "name", "phone_number", "birthday",
+    "personal_statement_1", "personal_statement_2", "personal_statement_3", "personal_statement_4", "personal_statement_5",
+)
+
+def encrypt_applications(apps, schema_editor):
+    """
+    기존 지원서의 평문 인적사항·자기소개 답변을 암호화하고, 지원 코드를 HMAC으로 바꿉니다.
+    """
+    Application = apps.get_model("recruitments", "Application")
+    fields = [Application._meta.get_field(field) for field in ENCRYPTED_FIELDS]
+    connection = schema_editor.connection
+    quote_name = connection.ops.quote_name
+
+    # 필드가 값을 암호문으로 읽으므로 평문은 SQL로 직접 읽음
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT {quote_name('student_number')}, {quote_name('application_code')}, "
+            f"{', '.join(quote_name(field.column) for field in fields)} "
+            f"FROM {quote_name(Application._meta.db_table)}"
+        )
+        rows = cursor.fetchall()
+
+    for student_number, application_code, *values in rows:
+        if values[0].startswith(f"{TOKEN_PREFIX}$"):
+            continue # 이미 암호화됨
+        data_key = DataKey.generate()
+        Application.objects.filter(pk=student_number).update(
+            application_code=hash_application_code(application_code),
+            **{field.attname: field.encrypt(value, data_key) for field, value in zip(fields, values)},
+        )
+
+def decrypt_applications(apps, schema_editor):
+    """
+    encrypt_applications를 되돌려 인적사항·자기소개 답변을 평문으로 복호화합니다.
+    지원 코드는 단방향 해시(HMAC)라 원래 값으로 되돌릴 수 없으므로 그대로 둡니다.
+    (0008 이전으로 되돌리면 지원 코드 컬럼이 10자로 줄어드므로, 지원서가 있으면 지원 코드를 다시 발급해야 함)
+    """
+    Application = apps.get_model("recruitments", "Application")
+    fields = [Application._meta.get_field(field) for field in ENCRYPTED_FIELDS]
+    connection = schema_editor.connection
+    quote_name = connection.ops.quote_name
+    table = quote_name(Application._meta.db_table)
+
+    # 필드가 저장할 때 다시 암호화하므로 평문은 SQL로 직접 씀
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT {quote_name('student_number')}, "
+            f"{', '.join(quote_name(field.column) for field in fields)} "
+            f"FROM {table}"
+        )
+        rows = cursor.fetchall()
+
+        for student_number, *values in rows:
+            if not values[0].startswith(f"{TOKEN_PREFIX}$"):
+                continue # 이미 평문
+            cursor.execute(
+                f"UPDATE {table} SET {', '.join(f'{quote_name(field.column)} = %s' for field in fields)} "
+                f"WHERE {quote_name('student_number')} = %s",
+                [
+                    *(decrypt_token(value, field.get_associated_data()) for field, value in zip(fields, values)),
+                    student_number,
+                ],
+            )
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitments', '0008_application_encryption'),
+    ]
+
+    operations = [
+        migrations.RunPython(encrypt_applications, decrypt_applications),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.9 on 2026-10-18 16:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitments', '0009_encrypt_application_data'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationScoreSummary',
+            fields=[
+                ('application', models.OneToOneField(help_text='집계한 지원서', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='score_summary', serialize=False, to='recruitments.application')),
+                ('year', models.PositiveSmallIntegerField(help_text='모집 연도')),
+                ('part', models.CharField(choices=[('PM_DESIGN', '기획·디자인'), ('FRONTEND', '프론트엔드'), ('BACKEND', '백엔드')], help_text='지원 파트', max_length=9)),
+                ('review_count', models.PositiveSmallIntegerField(help_text='평가 수')),
+                ('mean_score', models.FloatField(help_text='평가 총점의 평균')),
+                ('normalized_score', models.FloatField(help_text='평가 총점의 평균을 만점 기준 100점으로 환산한 점수')),
+                ('calibrated_score', models.FloatField(help_text='평가자별로 표준화한 총점(z-score)의 평균')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='집계 일시')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['year', 'part', '-calibrated_score'], name='score_summary_ranking_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='Review',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scores', models.JSONField(default=dict, help_text='평가 항목별 점수 (ReviewCriterionChoices -> 점수)')),
+                ('total', models.PositiveSmallIntegerField(help_text='평가 항목별 점수의 합')),
+                ('comment', models.TextField(blank=True, help_text='평가 의견')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='평가 추가 일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='평가 수정 일시')),
+                ('application', models.ForeignKey(help_text='평가한 지원서', on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='recruitments.application')),
+                ('reviewer', models.ForeignKey(help_text='평가한 운영진', on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('application', 'reviewer'), name='review_application_reviewer_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 16:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitments', '0010_review'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewschedule',
+            name='slot_capacity',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='면접 슬롯(30분)마다 선택할 수 있는 지원자 수 (비우면 제한 없음)', null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 16:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitments', '0011_interviewschedule_slot_capacity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationattachment',
+            name='claim_token',
+            field=models.UUIDField(blank=True, help_text='업로드 중인 워커가 가져갈 때 발급한 토큰', null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 17:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitments', '0012_application_attachment_claim_token'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationattachment',
+            name='source_key',
+            field=models.CharField(blank=True, help_text='클라이언트가 presigned POST로 직접 업로드한 파일의 스토리지 키 (워커가 내려받아 검증)', max_length=255),
+        ),
+    ]
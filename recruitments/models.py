@@ -1,7 +1,10 @@
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.conf import settings
 from django.db import models
 from django.utils.timezone import localtime
-from utils.choices import PartChoices, InterviewMethodChoices, StatusChoices
+from utils.encryption import EncryptedCharField, EncryptedDateField, EncryptedTextField
+from utils.choices import PartChoices, InterviewMethodChoices, StatusChoices, AttachmentStatusChoices
 
 class RecruitmentSchedule(models.Model):
     year = models.PositiveSmallIntegerField(
@@ -65,21 +68,26 @@ class InterviewSchedule(models.Model):
         null=True,
         blank=True,
     )
+    slot_capacity = models.PositiveSmallIntegerField(
+        help_text="면접 슬롯(30분)마다 선택할 수 있는 지원자 수 (비우면 제한 없음)",
+        null=True,
+        blank=True,
+    )
 
     def __str__(self):
         return f"{self.recruitment_schedule.year}년 면접 일정 | {localtime(self.start).strftime('%Y-%m-%d %H:%M:%S %Z')} ~ {localtime(self.end).strftime('%Y-%m-%d %H:%M:%S %Z')} ({self.get_interview_method_display()})"
 
 class Application(models.Model):
-    # 인적사항
-    name = models.CharField(
+    # 인적사항 (이름, 전화번호, 생년월일, 자기소개 답변은 암호화해 저장)
+    name = EncryptedCharField(
         help_text="이름",
         max_length=30,
     )
-    phone_number = models.CharField(
+    phone_number = EncryptedCharField(
         help_text="전화번호",
         max_length=13,
     )
-    birthday = models.DateField(
+    birthday = EncryptedDateField(
         help_text="생년월일",
     )
     department = models.CharField(
@@ -119,23 +127,23 @@ class Application(models.Model):
         max_length=9,
         choices=PartChoices.choices,
     )
-    personal_statement_1 = models.CharField(
+    personal_statement_1 = EncryptedCharField(
         help_text="자기소개 1번 문항의 답변",
         max_length=500,
     )
-    personal_statement_2 = models.CharField(
+    personal_statement_2 = EncryptedCharField(
         help_text="자기소개 2번 문항의 답변",
         max_length=500,
     )
-    personal_statement_3 = models.CharField(
+    personal_statement_3 = EncryptedCharField(
         help_text="자기소개 3번 문항의 답변",
         max_length=500,
     )
-    personal_statement_4 = models.CharField(
+    personal_statement_4 = EncryptedCharField(
         help_text="자기소개 4번 문항의 답변",
         max_length=500,
     )
-    personal_statement_5 = models.TextField(
+    personal_statement_5 = EncryptedTextField(
         help_text="자기소개 5번 문항의 답변",
     )
     completed_prerequisite_1 = models.ImageField(
@@ -181,8 +189,8 @@ class Application(models.Model):
         auto_now_add=True,
     )
     application_code = models.CharField(
-        help_text="지원 코드",
-        max_length=10,
+        help_text="지원 코드의 HMAC-SHA256 (utils.helpers.hash_application_code)",
+        max_length=64,
     )
     status = models.CharField(
         help_text="합불 여부",
@@ -193,8 +201,171 @@ class Application(models.Model):
 
     class Meta:
         indexes = [
-            models.Index(fields=["status"], name="application_status_idx")
+            models.Index(fields=["status"], name="application_status_idx"),
+            models.Index(fields=["application_code"], name="application_code_idx"),
+            # 지원서 목록 키셋 페이지네이션 (created_at, student_number)
+            models.Index(fields=["created_at", "student_number"], name="application_created_idx"),
+            models.Index(fields=["part", "created_at", "student_number"], name="application_part_created_idx"),
+            # 특정 시간에 면접 가능한 지원자 조회 (interview_available_times @> ARRAY[...])
+            # 그 시간을 고른 지원자가 적을 때만 사용되며, unnest 집계(SlotDemandService)에는 쓰이지 않음
+            GinIndex(fields=["interview_available_times"], name="application_times_gin_idx"),
         ]
 
     def __str__(self):
         return f"{self.student_number} {self.name} ({localtime(self.created_at).strftime('%Y-%m-%d %H:%M:%S %Z')})"
+
+class ApplicationAttachment(models.Model):
+    """
+    S3 업로드 전에 로컬 디스크에 임시 저장된 지원서 첨부 파일
+    """
+    application = models.ForeignKey(
+        help_text="첨부 파일이 속한 지원서",
+        to=Application,
+        on_delete=models.CASCADE,
+        related_name="attachments",
+    )
+    field_name = models.CharField(
+        help_text="업로드 후 파일을 저장할 지원서 필드명",
+        max_length=30,
+    )
+    file_name = models.CharField(
+        help_text="업로드된 원본 파일명",
+        max_length=255,
+    )
+    staged_path = models.CharField(
+        help_text="로컬 임시 저장 경로",
+        max_length=255,
+    )
+    source_key = models.CharField(
+        help_text="클라이언트가 presigned POST로 직접 업로드한 파일의 스토리지 키 (워커가 내려받아 검증)",
+        max_length=255,
+        blank=True,
+    )
+    status = models.CharField(
+        help_text="업로드 상태",
+        max_length=9,
+        choices=AttachmentStatusChoices.choices,
+        default=AttachmentStatusChoices.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(
+        help_text="업로드 시도 횟수",
+        default=0,
+    )
+    error = models.TextField(
+        help_text="마지막 업로드 실패 사유",
+        blank=True,
+    )
+    claim_token = models.UUIDField(
+        help_text="업로드 중인 워커가 가져갈 때 발급한 토큰",
+        null=True,
+        blank=True,
+    )
+    thumbnail = models.ImageField(
+        help_text="이미지 첨부 파일의 썸네일",
+        upload_to="application/thumbnail",
+        blank=True,
+    )
+    created_at = models.DateTimeField(
+        help_text="첨부 파일 추가 일시",
+        auto_now_add=True,
+    )
+    updated_at = models.DateTimeField(
+        help_text="업로드 상태 변경 일시",
+        auto_now=True,
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "updated_at"], name="attachment_status_idx")
+        ]
+
+    def __str__(self):
+        return f"{self.application_id} {self.field_name} ({self.get_status_display()})"
+
+class Review(models.Model):
+    """
+    운영진 한 명이 지원서 하나에 매긴 서류 평가
+    """
+    reviewer = models.ForeignKey(
+        help_text="평가한 운영진",
+        to=settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="reviews",
+    )
+    application = models.ForeignKey(
+        help_text="평가한 지원서",
+        to=Application,
+        on_delete=models.CASCADE,
+        related_name="reviews",
+    )
+    scores = models.JSONField(
+        help_text="평가 항목별 점수 (ReviewCriterionChoices -> 점수)",
+        default=dict,
+    )
+    total = models.PositiveSmallIntegerField(
+        help_text="평가 항목별 점수의 합",
+    )
+    comment = models.TextField(
+        help_text="평가 의견",
+        blank=True,
+    )
+    created_at = models.DateTimeField(
+        help_text="평가 추가 일시",
+        auto_now_add=True,
+    )
+    updated_at = models.DateTimeField(
+        help_text="평가 수정 일시",
+        auto_now=True,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["application", "reviewer"], name="review_application_reviewer_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.application_id} - {self.reviewer} ({self.total}점)"
+
+class ApplicationScoreSummary(models.Model):
+    """
+    지원서별 서류 평가 집계 (평가가 바뀔 때마다 ReviewService.refresh로 갱신)
+    """
+    application = models.OneToOneField(
+        help_text="집계한 지원서",
+        to=Application,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="score_summary",
+    )
+    year = models.PositiveSmallIntegerField(
+        help_text="모집 연도",
+    )
+    part = models.CharField(
+        help_text="지원 파트",
+        max_length=9,
+        choices=PartChoices.choices,
+    )
+    review_count = models.PositiveSmallIntegerField(
+        help_text="평가 수",
+    )
+    mean_score = models.FloatField(
+        help_text="평가 총점의 평균",
+    )
+    normalized_score = models.FloatField(
+        help_text="평가 총점의 평균을 만점 기준 100점으로 환산한 점수",
+    )
+    calibrated_score = models.FloatField(
+        help_text="평가자별로 표준화한 총점(z-score)의 평균",
+    )
+    updated_at = models.DateTimeField(
+        help_text="집계 일시",
+        auto_now=True,
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["year", "part", "-calibrated_score"], name="score_summary_ranking_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.application_id} {self.calibrated_score:.2f} ({self.review_count}명 평가)"
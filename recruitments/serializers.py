@@ -1,12 +1,33 @@
 from datetime import datetime
+from functools import cache
+import mimetypes
+import os
 import re
 from string import ascii_uppercase, digits
+from django.conf import settings
+from django.core import signing
+from django.core.files.storage import default_storage
 from django.core.validators import FileExtensionValidator
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.timezone import localtime
 from rest_framework import serializers
 import nanoid
-from utils.choices import InterviewMethodChoices, PartChoices
+from utils.choices import InterviewMethodChoices, PartChoices, ReviewCriterionChoices, StatusChoices
+from utils.constants import REVIEW_SCORE_MAX, REVIEW_SCORE_MIN
+from utils.helpers import FileUploadRule, IntervalIndex, get_file_upload_rules, hash_application_code, is_on_interview_slot_grid
 from utils.validators import FileSizeValidator
-from .models import InterviewSchedule, Application
+from .models import Application, ApplicationAttachment, Review
+from .services import ApplicationAttachmentService, InterviewSlotCapacityService, SubmittedStudentNumberService
+
+# 시리얼라이저의 첨부 파일 필드 -> 파일이 저장될 Application 필드명의 접두사 (예: portfolio_1)
+ATTACHMENT_FIELD_PREFIXES = {
+    "completed_prerequisites": "completed_prerequisite",
+    "portfolios": "portfolio",
+}
+
+def get_attachment_upload_to(field_name:str)->str:
+    return Application._meta.get_field(f"{ATTACHMENT_FIELD_PREFIXES[field_name]}_1").upload_to
 
 class ApplicationCreateSerializer(serializers.ModelSerializer):
     """
@@ -37,6 +58,17 @@ class ApplicationCreateSerializer(serializers.ModelSerializer):
         required=False,
         allow_null=True,
     )
+    # presigned POST로 S3에 직접 업로드한 파일의 서명 키 (ApplicationUploadSerializer가 발급)
+    completed_prerequisite_keys = serializers.ListField(
+        child=serializers.CharField(max_length=255),
+        max_length=3,
+        required=False,
+    )
+    portfolio_keys = serializers.ListField(
+        child=serializers.CharField(max_length=255),
+        max_length=3,
+        required=False,
+    )
 
     class Meta:
         model = Application
@@ -44,8 +76,21 @@ class ApplicationCreateSerializer(serializers.ModelSerializer):
                     "name","phone_number","birthday","department","student_number","grade",
                     "interview_method","interview_available_times",
                     "part","personal_statement_1","personal_statement_2","personal_statement_3","personal_statement_4","personal_statement_5",
-                    "completed_prerequisites","portfolios",
+                    "completed_prerequisites","portfolios","completed_prerequisite_keys","portfolio_keys",
                  )
+        extra_kwargs = {
+            # 중복 제출은 validate_student_number(Redis)와 기본 키 제약으로 확인하므로 UniqueValidator의 DB 조회는 생략
+            "student_number": {"validators": []},
+        }
+
+    def validate_student_number(self, value:str):
+        # 중복 제출은 뷰에서 Student-Number 헤더로 먼저 거르므로, 헤더를 보냈다면 본문의 학번과 같아야 함
+        header_student_number = self.context.get("student_number")
+        if header_student_number and header_student_number != value:
+            raise serializers.ValidationError(detail="Student-Number 헤더의 학번과 다릅니다.")
+        if SubmittedStudentNumberService(year=timezone.localdate().year).contains(value):
+            raise serializers.ValidationError(detail="이미 지원서를 제출한 학번입니다.")
+        return value
 
     def validate_phone_number(self, value:str):
         phone_regex = r"^01([0|1|6|7|8|9])-?([0-9]{4})-?([0-9]{4})$"
@@ -56,23 +101,90 @@ class ApplicationCreateSerializer(serializers.ModelSerializer):
         return value
 
     def validate_interview_available_times(self, value:list[datetime]):
-        if len(value) != len(set(value)):
+        unique_times = set(value)
+        if len(value) != len(unique_times):
             raise serializers.ValidationError(detail="면접 일정은 중복으로 선택할 수 없습니다.")
 
-        interview_schedules:list[InterviewSchedule] = self.context.get("interview_schedules", list())
-        if not interview_schedules:
+        interview_interval_index:IntervalIndex|None = self.context.get("interview_interval_index")
+        if not interview_interval_index:
             raise serializers.ValidationError(detail="면접 일정이 준비되지 않았습니다.")
 
-        for interview_available_time in value:
-            is_valid = any(
-                interview_schedule.start <= interview_available_time <= interview_schedule.end
-                for interview_schedule in interview_schedules
+        sorted_times = sorted(unique_times)
+
+        # 면접 일정 안에 있으면서 30분 단위의 선택지를 선택했는지 확인하기
+        invalid_times = [
+            interview_available_time
+            for interview_available_time in sorted_times
+            if not (
+                is_on_interview_slot_grid(interview_available_time)
+                and interview_available_time in interview_interval_index
+            )
+        ]
+        if invalid_times:
+            raise serializers.ValidationError(
+                detail=[f"면접 일정 '{invalid_time}'은/는 선택할 수 없습니다." for invalid_time in invalid_times]
             )
-            # 30분 단위의 선택지를 선택했는지 확인하기
-            if not is_valid:
-                raise serializers.ValidationError(detail=f"면접 일정 '{interview_available_time}'은/는 선택할 수 없습니다.")
 
-        return sorted(value)
+        return sorted_times
+
+    def validate_completed_prerequisite_keys(self, value:list[str]):
+        return self._validate_unique_keys(value)
+
+    def validate_portfolio_keys(self, value:list[str]):
+        return self._validate_unique_keys(value)
+
+    def _validate_unique_keys(self, value:list[str]):
+        if len(value) != len(set(value)):
+            raise serializers.ValidationError(detail="같은 파일을 중복으로 제출할 수 없습니다.")
+        return value
+
+    def _validate_attachment_keys(self, field_name:str, value:list[str], student_number:str)->list[str]:
+        """
+        ApplicationUploadSerializer가 발급한 서명 키를 검증하고, 스토리지 키 목록을 반환합니다.
+        """
+        rule:FileUploadRule = get_application_file_upload_rules()[field_name]
+        key_regex = (
+            rf"^{re.escape(get_attachment_upload_to(field_name))}/"
+            rf"[0-9a-f]{{8}}-[0-9a-f]{{4}}-[0-9a-f]{{4}}-[0-9a-f]{{4}}-[0-9a-f]{{12}}"
+            rf"\.({'|'.join(rule.allowed_extensions)})$"
+        )
+
+        keys = list()
+        for signed_key in value:
+            # 이 학번과 필드로 발급한 키만 제출할 수 있음
+            try:
+                key = ApplicationAttachmentService().load_source_key(signed_key, student_number, field_name)
+            except signing.BadSignature:
+                raise serializers.ValidationError(detail="발급되지 않았거나 만료된 파일 키입니다.")
+
+            if not re.match(key_regex, key):
+                raise serializers.ValidationError(detail=f"파일 '{key}'은/는 제출할 수 없습니다.")
+
+            # 업로드 여부와 용량은 HEAD 요청으로 확인하고, 내용은 업로드 워커가 내려받아 검증
+            try:
+                size = default_storage.size(key)
+            except FileNotFoundError:
+                raise serializers.ValidationError(detail=f"파일 '{key}'이/가 업로드되지 않았습니다.")
+
+            if size < rule.min_size or (rule.max_size and size > rule.max_size):
+                raise serializers.ValidationError(detail=f"파일 '{key}'의 용량이 허용 범위를 벗어납니다.")
+            keys.append(key)
+
+        return keys
+
+    def validate(self, attrs:dict):
+        for field_name, prefix in ATTACHMENT_FIELD_PREFIXES.items():
+            if not attrs.get(f"{prefix}_keys"):
+                continue
+            if attrs.get(field_name):
+                raise serializers.ValidationError(
+                    detail={field_name: "파일 업로드와 직접 업로드한 파일의 키를 함께 제출할 수 없습니다."}
+                )
+            try:
+                attrs[f"{prefix}_keys"] = self._validate_attachment_keys(field_name, attrs[f"{prefix}_keys"], attrs["student_number"])
+            except serializers.ValidationError as e:
+                raise serializers.ValidationError(detail={f"{prefix}_keys": e.detail})
+        return attrs
 
     # def validate_completed_prerequisites(self, value:list):
     #     ALLOWED_MIME_TYPES = {"image/png","image/jpg","image/jpeg","image/gif"}
@@ -99,27 +211,216 @@ class ApplicationCreateSerializer(serializers.ModelSerializer):
     #     return value
 
     def create(self, validated_data:dict)->str:
-        completed_prerequisites:list = validated_data.pop("completed_prerequisites", list())
-        portfolios:list = validated_data.pop("portfolios", list())
-        completed_prerequisite_list = (completed_prerequisites + [None]*3)[:3]
-        portfolio_list = (portfolios + [None]*3)[:3]
+        uploaded_files:dict[str, list] = dict()
+        uploaded_keys:dict[str, list[str]] = dict()
+        for field_name, prefix in ATTACHMENT_FIELD_PREFIXES.items():
+            uploaded_files[prefix] = validated_data.pop(field_name, None) or list()
+            uploaded_keys[prefix] = validated_data.pop(f"{prefix}_keys", None) or list()
 
-        # 지원 코드 생성
+        # 지원 코드 생성 (데이터베이스에는 HMAC만 저장하고, 인적사항과 자기소개 답변은 모델 필드에서 암호화)
         application_code = nanoid.generate(alphabet=ascii_uppercase+digits, size=10)
 
-        # 지원 코드 단방향 암호화
-        # 나머지 정보(이미지, 포트폴리오 제외) 양방향 암호화
-
-        # 데이터베이스 저장
-        Application.objects.create(
-            application_code=application_code,
-            completed_prerequisite_1=completed_prerequisite_list[0],
-            completed_prerequisite_2=completed_prerequisite_list[1],
-            completed_prerequisite_3=completed_prerequisite_list[2],
-            portfolio_1=portfolio_list[0],
-            portfolio_2=portfolio_list[1],
-            portfolio_3=portfolio_list[2],
-            **validated_data,
+        # 면접 슬롯 자리 확보 (자리가 없는 슬롯이 있으면 저장하지 않고, 저장에 실패하면 되돌림)
+        # 카운터는 지원서의 created_at 연도별이므로 현지 날짜의 연도를 사용
+        slot_capacity_service = InterviewSlotCapacityService(year=timezone.localdate().year)
+        full_slots = slot_capacity_service.reserve(validated_data["interview_available_times"])
+        if full_slots:
+            raise serializers.ValidationError(
+                detail={"interview_available_times": [f"면접 일정 '{full_slot}'은/는 마감되었습니다." for full_slot in full_slots]}
+            )
+
+        # 첨부 파일은 로컬 디스크에 임시 저장하고, S3 업로드는 워커에 맡김
+        attachment_service = ApplicationAttachmentService()
+        attachments = list()
+        try:
+            for prefix, files in uploaded_files.items():
+                for i, uploaded_file in enumerate(files[:3], start=1):
+                    attachments.append(attachment_service.stage(f"{prefix}_{i}", uploaded_file))
+            # S3에 직접 업로드된 파일도 같은 큐에서 워커가 내려받아 검증한 뒤 저장
+            for prefix, keys in uploaded_keys.items():
+                for i, key in enumerate(keys[:3], start=1):
+                    attachments.append(attachment_service.stage_key(f"{prefix}_{i}", key))
+
+            # 데이터베이스 저장
+            with transaction.atomic():
+                try:
+                    application = Application.objects.create(
+                        application_code=hash_application_code(application_code),
+                        **validated_data,
+                    )
+                except IntegrityError:
+                    SubmittedStudentNumberService(year=timezone.localdate().year).add(validated_data["student_number"])
+                    raise serializers.ValidationError(detail={"student_number": "이미 지원서를 제출한 학번입니다."})
+                for attachment in attachments:
+                    attachment.application = application
+                ApplicationAttachment.objects.bulk_create(attachments)
+        except Exception:
+            # 저장(커밋) 전에 실패한 경우에만 임시 파일과 면접 슬롯 자리를 되돌림
+            attachment_service.discard(attachments)
+            slot_capacity_service.release(validated_data["interview_available_times"])
+            raise
+
+        # 커밋 후 작업은 실패해도 이미 저장된 지원서에 영향이 없도록 오류를 기록만 함
+        # (큐에 넣지 못한 첨부 파일은 requeue_stale이, 학번 집합은 기본 키 제약이 대신함)
+        attachment_ids = [attachment.id for attachment in attachments]
+        transaction.on_commit(lambda: attachment_service.enqueue(attachment_ids), robust=True)
+        transaction.on_commit(
+            lambda: SubmittedStudentNumberService(year=localtime(application.created_at).year).add(application.student_number),
+            robust=True,
         )
 
         return application_code
+
+@cache
+def get_application_file_upload_rules()->dict[str, FileUploadRule]:
+    return get_file_upload_rules(ApplicationCreateSerializer)
+
+class ApplicationUploadSerializer(serializers.Serializer):
+    """
+    첨부 파일 직접 업로드(presigned POST) 발급 API용 시리얼라이저
+    """
+    field = serializers.ChoiceField(choices=list(ATTACHMENT_FIELD_PREFIXES))
+    file_name = serializers.CharField(max_length=255)
+
+    def validate(self, attrs:dict):
+        # 발급한 키는 이 학번으로 제출하는 지원서에만 사용할 수 있음
+        if not self.context.get("student_number"):
+            raise serializers.ValidationError(detail={"student_number": "Student-Number 헤더가 필요합니다."})
+
+        rule:FileUploadRule = get_application_file_upload_rules()[attrs["field"]]
+        ext = os.path.splitext(attrs["file_name"])[1].lower().lstrip(".")
+
+        if ext not in rule.allowed_extensions:
+            raise serializers.ValidationError(
+                detail={"file_name": f"허용되지 않는 확장자입니다. ({', '.join(rule.allowed_extensions)})"}
+            )
+
+        attrs["extension"] = ext
+        return attrs
+
+    def create(self, validated_data:dict)->dict:
+        rule:FileUploadRule = get_application_file_upload_rules()[validated_data["field"]]
+        ext = validated_data["extension"]
+        content_type = mimetypes.guess_type(f"file.{ext}")[0] or "application/octet-stream"
+
+        # 키 이름은 CustomS3Storage.get_available_name 규칙(uuid4 + 확장자)을 따름
+        key, presigned_post = default_storage.generate_presigned_post(
+            f"{get_attachment_upload_to(validated_data['field'])}/file.{ext}",
+            fields={"Content-Type": content_type},
+            conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", rule.min_size, rule.max_size],
+            ],
+            expires_in=settings.ATTACHMENT_PRESIGNED_POST_EXPIRES,
+        )
+
+        # 지원서 제출 시에는 스토리지 키 대신 학번과 필드에 묶어 서명한 키를 제출
+        return {
+            "key": ApplicationAttachmentService().sign_source_key(key, self.context["student_number"], validated_data["field"]),
+            "url": presigned_post["url"],
+            "fields": presigned_post["fields"],
+        }
+
+class ApplicationListQuerySerializer(serializers.Serializer):
+    """
+    지원서 목록 조회 API의 필터(쿼리 파라미터)용 시리얼라이저
+    """
+    year = serializers.IntegerField(required=False)
+    part = serializers.ChoiceField(choices=PartChoices.choices, required=False)
+    status = serializers.ChoiceField(choices=StatusChoices.choices, required=False)
+    interview_method = serializers.ChoiceField(choices=InterviewMethodChoices.choices, required=False)
+    available_at = serializers.DateTimeField(required=False, help_text="이 시각에 면접 가능한 지원자만 조회")
+
+class ApplicationListSerializer(serializers.ModelSerializer):
+    """
+    지원서 목록 조회 API용 시리얼라이저 (자기소개 답변, 첨부 파일 제외)
+    """
+    class Meta:
+        model = Application
+        fields = (
+                    "student_number","name","department","grade",
+                    "part","interview_method","interview_at","status","created_at",
+                 )
+
+class ApplicationResultSerializer(serializers.Serializer):
+    """
+    합격자 조회 API용 시리얼라이저
+    """
+    application_code = serializers.CharField(max_length=10)
+
+class ApplicationStatusSerializer(serializers.Serializer):
+    """
+    지원서 합불 상태 일괄 변경 API용 시리얼라이저
+    예) {"transitions": {"FIRST_ACCEPTED": ["2400001", ...], "FIRST_REJECTED": [...]}}
+    """
+    transitions = serializers.DictField(
+        child=serializers.ListField(child=serializers.CharField(max_length=7), allow_empty=True),
+        allow_empty=False,
+    )
+    dry_run = serializers.BooleanField(default=False)
+
+    def validate_transitions(self, value:dict):
+        invalid_statuses = [status for status in value if status not in StatusChoices.values]
+        if invalid_statuses:
+            raise serializers.ValidationError(detail=f"알 수 없는 상태입니다. ({', '.join(invalid_statuses)})")
+        return value
+
+class SlotDemandQuerySerializer(serializers.Serializer):
+    """
+    면접 슬롯별 수요 집계 API의 쿼리 파라미터용 시리얼라이저
+    """
+    year = serializers.IntegerField(required=False)
+    status = serializers.ChoiceField(choices=StatusChoices.choices, required=False)
+
+class PublicScheduleQuerySerializer(serializers.Serializer):
+    """
+    공개 모집·면접 일정 조회 API의 쿼리 파라미터용 시리얼라이저
+    """
+    year = serializers.IntegerField(required=False)
+
+class ApplicationExportQuerySerializer(serializers.Serializer):
+    """
+    지원서 일괄 내보내기 API의 쿼리 파라미터용 시리얼라이저
+    """
+    CSV = "csv"
+    ZIP = "zip"
+
+    year = serializers.IntegerField(required=False)
+    mode = serializers.ChoiceField(choices=[CSV, ZIP], default=CSV)
+
+class ReviewSerializer(serializers.ModelSerializer):
+    """
+    서류 평가 추가·수정 API용 시리얼라이저
+    예) {"student_number": "2400001", "scores": {"PASSION": 5, "COMPETENCE": 4, ...}, "comment": "..."}
+    """
+    student_number = serializers.CharField(source="application_id", max_length=7)
+    scores = serializers.DictField(child=serializers.IntegerField(min_value=REVIEW_SCORE_MIN, max_value=REVIEW_SCORE_MAX))
+    reviewer = serializers.StringRelatedField(read_only=True)
+
+    class Meta:
+        model = Review
+        fields = ("student_number", "reviewer", "scores", "total", "comment", "updated_at")
+        read_only_fields = ("total", "updated_at")
+
+    def validate_scores(self, value:dict):
+        missing = [criterion for criterion in ReviewCriterionChoices.values if criterion not in value]
+        unknown = [criterion for criterion in value if criterion not in ReviewCriterionChoices.values]
+        if missing or unknown:
+            raise serializers.ValidationError(
+                detail=f"평가 항목은 {', '.join(ReviewCriterionChoices.values)}이어야 합니다."
+            )
+        return value
+
+    def validate(self, attrs:dict):
+        try:
+            attrs["application"] = Application.objects.only("student_number", "created_at").get(pk=attrs.pop("application_id"))
+        except Application.DoesNotExist:
+            raise serializers.ValidationError(detail={"student_number": "지원서를 찾을 수 없습니다."})
+        return attrs
+
+class ReviewRankingQuerySerializer(serializers.Serializer):
+    """
+    서류 평가 순위 API의 쿼리 파라미터용 시리얼라이저
+    """
+    year = serializers.IntegerField(required=False)
+    part = serializers.ChoiceField(choices=PartChoices.choices, required=False)
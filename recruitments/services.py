@@ -1 +1,1384 @@
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+import csv
+import hashlib
+import math
+import os
+import time
+from datetime import datetime, timedelta
+from tempfile import TemporaryFile
+from typing import Iterator, NamedTuple
+from uuid import uuid4
+import zipfile
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.move import file_move_safe
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import UploadedFile
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Avg, Count
 from django.http import HttpRequest
+from django.utils import timezone
+from django.utils.timezone import localtime, make_aware
+from configs.storages import set_storage_reference
+from utils.choices import AttachmentStatusChoices, InterviewMethodChoices, PartChoices, RecruitmentPhaseChoices, ReviewCriterionChoices, StatusChoices
+from utils.constants import REVIEW_SCORE_MAX, CacheKey
+from utils.encryption import EncryptedFieldMixin
+from utils.files import IMAGE_FORMAT_EXTENSIONS, InvalidFileError, get_file_sha256, normalize_image, verify_file_signature, verify_pdf, verify_pdf_ends
+from utils.helpers import IntervalIndex, build_interview_interval_index, hash_application_code, iter_interview_slots, max_bipartite_matching
+from utils.upload_handlers import FILE_SIGNATURES
+from .caches import (
+    RecruitmentScheduleCache, InterviewSchedulesCache, InterviewIntervalIndexCache, ScheduleVersionCache, SlotDemandCache,
+    RecruitmentPhaseCache, PublicScheduleCache, PublicInterviewSlotsCache, InterviewSlotLimitsCache, InterviewSlotCounter,
+    AttachmentUploadQueue, ApplicationResultHash, PdfVerdictCache, SubmittedStudentNumberSet,
+)
+from .models import RecruitmentSchedule, InterviewSchedule, Application, ApplicationAttachment, Review, ApplicationScoreSummary
+
+class RecruitmentScheduleService:
+    """
+    모집 일정 조회 서비스
+
+    모집 일정과 면접 일정은 2단계 캐시(프로세스 메모리 → Redis)에서 먼저 읽고,
+    캐시에 없을 때만 데이터베이스를 조회합니다.
+    캐시는 recruitments.signals에서 모델 저장/삭제 시 무효화됩니다.
+    """
+    # 일정이 바뀌면 시그널로 무효화하므로, TTL은 시그널이 누락된 경우(queryset.update 등)를 위한 안전장치
+    timeout = 60*60*24
+
+    def __init__(self, year:int):
+        self.year = year
+
+    def get_recruitment_schedule(self)->RecruitmentSchedule:
+        """
+        모집 일정이 없으면 RecruitmentSchedule.DoesNotExist를 발생시킵니다.
+        """
+        return RecruitmentScheduleCache(year=self.year).get_or_set(
+            lambda: RecruitmentSchedule.objects.get(year=self.year),
+            timeout=self.timeout,
+        )
+
+    def get_interview_schedules(self)->list[InterviewSchedule]:
+        return InterviewSchedulesCache(year=self.year).get_or_set(
+            lambda: list(
+                InterviewSchedule.objects
+                .filter(recruitment_schedule_id=self.year)
+                .order_by("start")
+            ),
+            timeout=self.timeout,
+        )
+
+    def get_interview_interval_index(self)->IntervalIndex:
+        """
+        면접 일정이 바뀔 때마다(캐시 무효화 후) 한 번만 만들어 캐시에 함께 저장합니다.
+        """
+        return InterviewIntervalIndexCache(year=self.year).get_or_set(
+            lambda: build_interview_interval_index(self.get_interview_schedules()),
+            timeout=self.timeout,
+        )
+
+    async def aget_recruitment_schedule(self)->RecruitmentSchedule:
+        """
+        get_recruitment_schedule의 비동기 버전 (캐시에 없으면 비동기 ORM으로 조회)
+        """
+        return await RecruitmentScheduleCache(year=self.year).aget_or_set(
+            lambda: RecruitmentSchedule.objects.aget(year=self.year),
+            timeout=self.timeout,
+        )
+
+    async def aget_interview_schedules(self)->list[InterviewSchedule]:
+        async def get_interview_schedules():
+            return [
+                interview_schedule async for interview_schedule in
+                InterviewSchedule.objects
+                .filter(recruitment_schedule_id=self.year)
+                .order_by("start")
+            ]
+        return await InterviewSchedulesCache(year=self.year).aget_or_set(
+            get_interview_schedules,
+            timeout=self.timeout,
+        )
+
+    async def aget_interview_interval_index(self)->IntervalIndex:
+        async def build_index():
+            return build_interview_interval_index(await self.aget_interview_schedules())
+        return await InterviewIntervalIndexCache(year=self.year).aget_or_set(
+            build_index,
+            timeout=self.timeout,
+        )
+
+    def get_version(self)->int:
+        """
+        일정이 바뀔 때마다(invalidate) 1씩 증가하는 버전
+        Redis가 비워져 버전이 사라지면 현재 시각(밀리초)에서 다시 시작하므로, 이전에 발급한 ETag와 겹치지 않습니다.
+        """
+        schedule_version_cache = ScheduleVersionCache(year=self.year)
+        version = schedule_version_cache.get()
+        if version is None:
+            schedule_version_cache.add(time.time_ns() // 1_000_000)
+            version = schedule_version_cache.get(default=0)
+        return version
+
+    def invalidate(self):
+        RecruitmentScheduleCache(year=self.year).delete()
+        InterviewSchedulesCache(year=self.year).delete()
+        InterviewIntervalIndexCache(year=self.year).delete()
+        RecruitmentPhaseCache(year=self.year).delete()
+        InterviewSlotLimitsCache(year=self.year).delete()
+        self.get_version()
+        ScheduleVersionCache(year=self.year).incr()
+
+    def get_public_schedule(self)->tuple[dict|None, str]:
+        """
+        공개 모집 일정과 그 ETag를 반환합니다. (모집 일정이 없으면 None)
+
+        응답은 일정 버전별로 캐시하고 ETag도 버전에서 만듭니다.
+        버전은 커밋 후에 증가하므로 새 버전의 응답은 데이터베이스에서 직접 만들어,
+        다른 프로세스의 로컬 캐시에 남은 이전 일정이 새 ETag로 나가지 않게 합니다.
+        """
+        version = self.get_version()
+
+        def build():
+            recruitment_schedule = RecruitmentSchedule.objects.filter(year=self.year).first()
+            if recruitment_schedule is None:
+                return (None,) # 일정이 없다는 것도 캐시하도록 튜플로 감쌈
+            return ({
+                "year": recruitment_schedule.year,
+                "application_start": localtime(recruitment_schedule.application_start),
+                "application_end": localtime(recruitment_schedule.application_end),
+                "first_result_start": localtime(recruitment_schedule.first_result_start),
+                "first_result_end": localtime(recruitment_schedule.first_result_end),
+                "interview_start": recruitment_schedule.interview_start,
+                "interview_end": recruitment_schedule.interview_end,
+                "final_result_start": localtime(recruitment_schedule.final_result_start),
+                "final_result_end": localtime(recruitment_schedule.final_result_end),
+            },)
+
+        data, = PublicScheduleCache(year=self.year, version=version).get_or_set(build, timeout=self.timeout)
+        return data, f'"schedule-{self.year}-v{version}"'
+
+    def get_public_interview_slots(self)->tuple[dict|None, str]:
+        """
+        지원서에서 선택할 수 있는 면접 슬롯 목록과 그 ETag를 반환합니다. (모집 일정이 없으면 None)
+        면접 장소(온라인 면접 링크)는 포함하지 않습니다. 캐시·ETag는 get_public_schedule과 같습니다.
+        """
+        version = self.get_version()
+
+        def build():
+            if not RecruitmentSchedule.objects.filter(year=self.year).exists():
+                return (None,)
+            interview_schedules = list(
+                InterviewSchedule.objects
+                .filter(recruitment_schedule_id=self.year)
+                .order_by("start")
+            )
+            slots:dict[datetime, dict[str, set]] = dict()
+            for interview_schedule in interview_schedules:
+                for slot_start in iter_interview_slots(interview_schedule.start, interview_schedule.end):
+                    slot = slots.setdefault(slot_start, {"parts": set(), "interview_methods": set()})
+                    slot["parts"].add(interview_schedule.part)
+                    slot["interview_methods"].add(interview_schedule.interview_method)
+            return ({
+                "year": self.year,
+                "interview_schedules": [
+                    {
+                        "part": interview_schedule.part,
+                        "interview_method": interview_schedule.interview_method,
+                        "start": localtime(interview_schedule.start),
+                        "end": localtime(interview_schedule.end),
+                    }
+                    for interview_schedule in interview_schedules
+                ],
+                "slots": [
+                    {
+                        "start": localtime(slot_start),
+                        "parts": sorted(slot["parts"]),
+                        "interview_methods": sorted(slot["interview_methods"]),
+                    }
+                    for slot_start, slot in sorted(slots.items())
+                ],
+            },)
+
+        data, = PublicInterviewSlotsCache(year=self.year, version=version).get_or_set(build, timeout=self.timeout)
+        return data, f'"interview-slots-{self.year}-v{version}"'
+
+class RecruitmentPhase(NamedTuple):
+    """
+    특정 연도의 모집 단계 하나 (start 이상 end 미만, None이면 그쪽으로 끝이 없음)
+    """
+    year:int
+    phase:str
+    start:datetime|None
+    end:datetime|None
+    next_phase:str|None
+    etag:str
+
+    def contains(self, current_time:datetime)->bool:
+        return (self.start is None or self.start <= current_time) and (self.end is None or current_time < self.end)
+
+    def get_remaining_seconds(self, current_time:datetime)->float|None:
+        """
+        다음 단계가 시작될 때까지 남은 시간 (다음 단계가 없으면 None)
+        """
+        if self.end is None:
+            return None
+        return (self.end - current_time).total_seconds()
+
+    def as_dict(self)->dict:
+        return {
+            "year": self.year,
+            "phase": self.phase,
+            "label": RecruitmentPhaseChoices(self.phase).label,
+            "start": self.start and localtime(self.start),
+            "end": self.end and localtime(self.end),
+            "next_phase": self.next_phase,
+        }
+
+class RecruitmentPhaseService:
+    """
+    모집 단계 조회 서비스
+
+    모집 일정의 기간들을 단계가 바뀌는 시각의 목록(build_timeline)으로 펼친 뒤,
+    현재 단계를 다음 단계가 시작될 때까지 2단계 캐시에 저장합니다.
+    단계가 바뀌기 전까지는 프로세스 메모리에서 응답하고, 모집 일정이 바뀌면
+    RecruitmentScheduleService.invalidate()에서 함께 무효화됩니다.
+    """
+    # 기간이 겹치면 앞의 단계를 우선 (발표 기간과 면접 기간이 겹치면 발표)
+    # 기간의 끝 시각도 기간에 포함되므로, 다음 단계는 끝 시각 바로 다음(1마이크로초 뒤)부터 시작됨
+    RESOLUTION = timedelta(microseconds=1)
+
+    def __init__(self, year:int):
+        self.year = year
+
+    def get_current(self, current_time:datetime|None=None)->RecruitmentPhase:
+        current_time = current_time or timezone.now()
+        phase_cache = RecruitmentPhaseCache(year=self.year)
+        phase = phase_cache.get()
+        # TTL은 초 단위로 올림하므로, 경계를 지난 값은 캐시에 남아 있어도 다시 계산
+        if phase is None or not phase.contains(current_time):
+            try:
+                recruitment_schedule = RecruitmentScheduleService(year=self.year).get_recruitment_schedule()
+            except RecruitmentSchedule.DoesNotExist:
+                recruitment_schedule = None
+            phase = self.build(recruitment_schedule, current_time)
+            phase_cache.set(phase, timeout=self.get_timeout(phase, current_time))
+        return phase
+
+    async def aget_current(self, current_time:datetime|None=None)->RecruitmentPhase:
+        """
+        get_current의 비동기 버전
+        """
+        current_time = current_time or timezone.now()
+        phase_cache = RecruitmentPhaseCache(year=self.year)
+        phase = await phase_cache.aget()
+        if phase is None or not phase.contains(current_time):
+            try:
+                recruitment_schedule = await RecruitmentScheduleService(year=self.year).aget_recruitment_schedule()
+            except RecruitmentSchedule.DoesNotExist:
+                recruitment_schedule = None
+            phase = self.build(recruitment_schedule, current_time)
+            await phase_cache.aset(phase, timeout=self.get_timeout(phase, current_time))
+        return phase
+
+    def get_timeout(self, phase:RecruitmentPhase, current_time:datetime)->int:
+        remaining = phase.get_remaining_seconds(current_time)
+        if remaining is None:
+            return RecruitmentScheduleService.timeout
+        return max(1, min(math.ceil(remaining), RecruitmentScheduleService.timeout))
+
+    def build(self, recruitment_schedule:RecruitmentSchedule|None, current_time:datetime)->RecruitmentPhase:
+        """
+        current_time이 속한 단계와 그 단계가 끝나는 시각을 구합니다.
+        """
+        if recruitment_schedule is None:
+            timeline = [(None, RecruitmentPhaseChoices.NOT_SCHEDULED)]
+        else:
+            timeline = self.build_timeline(recruitment_schedule)
+
+        index = bisect_right([start for start, _ in timeline[1:]], current_time)
+        start, phase = timeline[index]
+        end, next_phase = timeline[index + 1] if index + 1 < len(timeline) else (None, None)
+        etag = hashlib.sha256(f"{self.year}|{phase}|{start}|{end}|{next_phase}".encode()).hexdigest()[:16]
+        return RecruitmentPhase(self.year, str(phase), start, end, next_phase and str(next_phase), f'"{etag}"')
+
+    @classmethod
+    def build_timeline(cls, recruitment_schedule:RecruitmentSchedule)->list[tuple[datetime|None, str]]:
+        """
+        (단계가 시작되는 시각, 단계) 목록을 시각 오름차순으로 반환합니다. (첫 단계의 시작 시각은 None)
+        """
+        interview_start = make_aware(datetime.combine(recruitment_schedule.interview_start, datetime.min.time()))
+        interview_end = make_aware(datetime.combine(recruitment_schedule.interview_end + timedelta(days=1), datetime.min.time()))
+        periods = (
+            (recruitment_schedule.final_result_start, recruitment_schedule.final_result_end + cls.RESOLUTION, RecruitmentPhaseChoices.FINAL_RESULT),
+            (recruitment_schedule.first_result_start, recruitment_schedule.first_result_end + cls.RESOLUTION, RecruitmentPhaseChoices.FIRST_RESULT),
+            (recruitment_schedule.application_start, recruitment_schedule.application_end + cls.RESOLUTION, RecruitmentPhaseChoices.APPLICATION),
+            (interview_start, interview_end, RecruitmentPhaseChoices.INTERVIEW),
+        )
+        first_start = min(start for start, _, _ in periods)
+        last_end = max(end for _, end, _ in periods)
+
+        def get_phase(current_time:datetime)->str:
+            for start, end, phase in periods:
+                if start <= current_time < end:
+                    return phase
+            if current_time < first_start:
+                return RecruitmentPhaseChoices.BEFORE_APPLICATION
+            if current_time >= last_end:
+                return RecruitmentPhaseChoices.CLOSED
+            return RecruitmentPhaseChoices.SCREENING
+
+        timeline = [(None, RecruitmentPhaseChoices.BEFORE_APPLICATION)]
+        for boundary in sorted({instant for start, end, _ in periods for instant in (start, end)}):
+            phase = get_phase(boundary)
+            if phase != timeline[-1][1]:
+                timeline.append((boundary, phase))
+        return timeline
+
+class ApplicationAttachmentService:
+    """
+    지원서 첨부 파일 업로드 서비스
+
+    요청 처리 중에는 파일을 로컬 디스크에 임시 저장(stage)하고 ApplicationAttachment(PENDING)만 기록합니다.
+    S3 업로드는 upload_attachments 명령어로 실행되는 워커가 큐에서 id를 꺼내 처리합니다.
+
+    presigned POST로 클라이언트가 S3에 직접 올린 파일은 발급할 때 학번과 필드에 묶은 서명 키(sign_source_key)로만
+    제출할 수 있고, stage_key로 같은 큐에 넣어 워커가 내려받은 뒤 multipart 업로드와 같은 검증을 거칩니다.
+    처리가 끝나면(DONE, REJECTED) 직접 올린 원본 파일은 삭제합니다.
+
+    이미지 필드(이수 내역)는 업로드 전에 정규화(메타데이터 제거, 축소, 재인코딩)하고 썸네일을 함께 저장합니다.
+    정규화는 CPU를 많이 쓰므로 image_executor(프로세스 풀)가 있으면 그곳에서 실행합니다.
+    PDF는 업로드 전에 구조를 검증하고, 검증 결과는 파일 내용의 해시별로 캐시합니다.
+    검증에 실패한 파일은 REJECTED로 기록하고 업로드하지 않습니다.
+    """
+    IMAGE_FIELD_PREFIXES = ("completed_prerequisite",)
+    pdf_verdict_timeout = 60*60*24*30
+    source_key_salt = "recruitments.ApplicationAttachmentService.source_key"
+
+    def __init__(self, image_executor:Executor|None=None):
+        self.image_executor = image_executor
+
+    def stage(self, field_name:str, uploaded_file:UploadedFile)->ApplicationAttachment:
+        """
+        업로드된 파일을 ATTACHMENT_STAGING_ROOT로 옮기고, 저장하지 않은 ApplicationAttachment를 반환합니다.
+        """
+        os.makedirs(settings.ATTACHMENT_STAGING_ROOT, exist_ok=True)
+        ext = os.path.splitext(uploaded_file.name)[1].lower()
+        staged_path = os.path.join(settings.ATTACHMENT_STAGING_ROOT, f"{uuid4()}{ext}")
+
+        if hasattr(uploaded_file, "temporary_file_path"):
+            # 디스크에 임시 저장된 파일은 복사 없이 이동
+            file_move_safe(uploaded_file.temporary_file_path(), staged_path)
+        else:
+            with open(staged_path, "wb") as staged_file:
+                for chunk in uploaded_file.chunks():
+                    staged_file.write(chunk)
+
+        return ApplicationAttachment(
+            field_name=field_name,
+            file_name=uploaded_file.name,
+            staged_path=staged_path,
+        )
+
+    def stage_key(self, field_name:str, source_key:str)->ApplicationAttachment:
+        """
+        presigned POST로 직접 업로드된 파일의 저장하지 않은 ApplicationAttachment를 반환합니다. (워커가 내려받음)
+        """
+        ext = os.path.splitext(source_key)[1].lower()
+        return ApplicationAttachment(
+            field_name=field_name,
+            file_name=os.path.basename(source_key),
+            staged_path=os.path.join(settings.ATTACHMENT_STAGING_ROOT, f"{uuid4()}{ext}"),
+            source_key=source_key,
+        )
+
+    def sign_source_key(self, source_key:str, student_number:str, field:str)->str:
+        """
+        발급한 presigned POST 키를 학번과 첨부 파일 필드에 묶어 서명합니다.
+        """
+        return signing.dumps(
+            {"key": source_key, "student_number": student_number, "field": field},
+            salt=self.source_key_salt,
+        )
+
+    def load_source_key(self, signed_key:str, student_number:str, field:str)->str:
+        """
+        서명된 키를 검증하고 스토리지 키를 반환합니다.
+        다른 학번이나 필드로 발급됐거나, 위조됐거나, 유효 시간이 지난 키는 signing.BadSignature를 일으킵니다.
+        """
+        payload = signing.loads(signed_key, salt=self.source_key_salt, max_age=settings.ATTACHMENT_SOURCE_KEY_MAX_AGE)
+        if payload.get("student_number") != student_number or payload.get("field") != field:
+            raise signing.BadSignature("다른 지원자 또는 필드로 발급된 키입니다.")
+        return payload["key"]
+
+    def download_source(self, attachment:ApplicationAttachment):
+        """
+        직접 업로드된 파일을 임시 저장 경로로 내려받고, 파일 시그니처가 확장자와 맞는지 확인합니다.
+        """
+        # 다 받은 뒤에 옮겨서, 중간에 실패한 파일을 재시도 때 그대로 쓰지 않게 함
+        os.makedirs(settings.ATTACHMENT_STAGING_ROOT, exist_ok=True)
+        download_path = f"{attachment.staged_path}.download"
+        try:
+            with open(download_path, "wb") as download_file:
+                default_storage.download_fileobj(attachment.source_key, download_file)
+            os.replace(download_path, attachment.staged_path)
+        finally:
+            if os.path.exists(download_path):
+                os.remove(download_path)
+
+        signatures = FILE_SIGNATURES.get(os.path.splitext(attachment.staged_path)[1].lower().lstrip("."))
+        if signatures:
+            verify_file_signature(attachment.staged_path, signatures)
+
+    def discard_source(self, attachment:ApplicationAttachment):
+        if attachment.source_key:
+            default_storage.delete(attachment.source_key)
+
+    def discard(self, attachments:list[ApplicationAttachment]):
+        for attachment in attachments:
+            if os.path.exists(attachment.staged_path):
+                os.remove(attachment.staged_path)
+
+    def enqueue(self, attachment_ids:list[int]):
+        AttachmentUploadQueue().push(*attachment_ids)
+
+    def requeue_stale(self, older_than:timedelta)->int:
+        """
+        큐 유실이나 워커 중단으로 멈춘 업로드를 다시 큐에 넣습니다.
+        UPLOADING은 클레임 후 older_than이 지난 것만 되돌리며, 토큰을 비워 이전 워커의 결과는 반영되지 않게 합니다.
+        """
+        attachment_ids = list(
+            ApplicationAttachment.objects
+            .filter(
+                status__in=[AttachmentStatusChoices.PENDING, AttachmentStatusChoices.UPLOADING],
+                updated_at__lt=timezone.now() - older_than,
+            )
+            .values_list("id", flat=True)
+        )
+        ApplicationAttachment.objects.filter(
+            id__in=attachment_ids,
+            status__in=[AttachmentStatusChoices.PENDING, AttachmentStatusChoices.UPLOADING],
+            updated_at__lt=timezone.now() - older_than,
+        ).update(
+            status=AttachmentStatusChoices.PENDING,
+            claim_token=None,
+            updated_at=timezone.now(),
+        )
+        self.enqueue(attachment_ids)
+        return len(attachment_ids)
+
+    def upload(self, attachment_id:int)->AttachmentStatusChoices|None:
+        """
+        임시 저장된 파일 하나를 S3에 업로드하고 지원서 필드에 반영합니다.
+        다른 워커가 이미 가져갔거나, 업로드 중에 requeue_stale로 클레임을 잃은 첨부 파일이면 None을 반환합니다.
+        """
+        try:
+            # PENDING -> UPLOADING 으로 바꾼 워커만 업로드를 진행
+            claim_token = uuid4()
+            claimed = (
+                ApplicationAttachment.objects
+                .filter(id=attachment_id, status=AttachmentStatusChoices.PENDING)
+                .update(status=AttachmentStatusChoices.UPLOADING, claim_token=claim_token, updated_at=timezone.now())
+            )
+            if not claimed:
+                return None
+
+            attachment = ApplicationAttachment.objects.select_related("application").get(id=attachment_id)
+            field_file = getattr(attachment.application, attachment.field_name)
+
+            try:
+                # 직접 업로드된 파일은 처음 한 번만 내려받음 (재시도 시에는 임시 파일을 다시 사용)
+                if attachment.source_key and not os.path.exists(attachment.staged_path):
+                    self.download_source(attachment)
+
+                if attachment.field_name.startswith(self.IMAGE_FIELD_PREFIXES):
+                    self.upload_image(attachment, field_file)
+                else:
+                    sha256 = None
+                    if attachment.staged_path.lower().endswith(".pdf"):
+                        _, sha256 = self.verify_pdf(attachment.staged_path)
+                    with open(attachment.staged_path, "rb") as staged_file:
+                        # 큰 파일은 AWS_S3_TRANSFER_CONFIG에 따라 멀티파트로 나누어 업로드
+                        content = set_storage_reference(File(staged_file), attachment.application, attachment.field_name)
+                        # 검증할 때 계산한 해시가 있으면 스토리지에서 다시 해시하지 않음
+                        content.sha256 = sha256
+                        field_file.save(attachment.file_name, content, save=False)
+            except InvalidFileError as e:
+                # 파일 내용 문제는 다시 시도해도 같으므로 바로 REJECTED 처리 (임시 파일도 삭제)
+                if not self.finish(attachment, claim_token, AttachmentStatusChoices.REJECTED, error=str(e)):
+                    return None
+                self.discard([attachment])
+                self.discard_source(attachment)
+                return AttachmentStatusChoices.REJECTED
+            except Exception as e:
+                if attachment.attempts + 1 < settings.ATTACHMENT_UPLOAD_MAX_ATTEMPTS:
+                    if not self.finish(attachment, claim_token, AttachmentStatusChoices.PENDING, error=str(e)):
+                        return None
+                    self.enqueue([attachment.id])
+                    return AttachmentStatusChoices.PENDING
+                # 임시 파일은 수동 재시도를 위해 남겨 둠
+                if not self.finish(attachment, claim_token, AttachmentStatusChoices.FAILED, error=str(e)):
+                    return None
+                return AttachmentStatusChoices.FAILED
+
+            with transaction.atomic():
+                if not self.finish(attachment, claim_token, AttachmentStatusChoices.DONE, thumbnail=attachment.thumbnail.name or ""):
+                    return None
+                Application.objects.filter(pk=attachment.application_id).update(**{attachment.field_name: field_file.name})
+            self.discard([attachment])
+            self.discard_source(attachment)
+
+            return AttachmentStatusChoices.DONE
+        finally:
+            # 워커 스레드마다 열린 DB 연결 정리
+            close_old_connections()
+
+    def finish(self, attachment:ApplicationAttachment, claim_token, status:AttachmentStatusChoices, error:str="", **fields)->bool:
+        """
+        클레임 토큰이 그대로인 경우에만 업로드 결과를 기록하고, 기록했는지를 반환합니다.
+        """
+        return bool(
+            ApplicationAttachment.objects
+            .filter(id=attachment.id, status=AttachmentStatusChoices.UPLOADING, claim_token=claim_token)
+            .update(
+                status=status,
+                attempts=attachment.attempts + 1,
+                error=error,
+                claim_token=None,
+                updated_at=timezone.now(),
+                **fields,
+            )
+        )
+
+    def verify_pdf(self, path:str)->tuple[int, str]:
+        """
+        PDF를 검증하고 (페이지 수, 파일 내용의 SHA-256)을 반환합니다. 같은 내용의 파일은 다시 검사하지 않습니다.
+        파일 전체를 읽는 해시는 앞뒤 부분만 보는 검사를 통과한 뒤에 계산하고, 저장할 때 다시 사용합니다.
+        """
+        verify_pdf_ends(path)
+        sha256 = get_file_sha256(path)
+
+        verdict_cache = PdfVerdictCache(sha256=sha256)
+        verdict = verdict_cache.get()
+        if verdict is None:
+            try:
+                verdict = {"page_count": verify_pdf(path), "error": None}
+            except InvalidFileError as e:
+                verdict = {"page_count": None, "error": str(e)}
+            verdict_cache.set(verdict, timeout=self.pdf_verdict_timeout)
+
+        if verdict["error"]:
+            raise InvalidFileError(verdict["error"])
+        return verdict["page_count"], sha256
+
+    def upload_image(self, attachment:ApplicationAttachment, field_file):
+        """
+        임시 저장된 이미지를 정규화해 이미지와 썸네일을 저장합니다. (원본은 저장하지 않음)
+        """
+        args = (
+            attachment.staged_path,
+            settings.IMAGE_MAX_DIMENSION,
+            settings.IMAGE_THUMBNAIL_SIZE,
+            settings.IMAGE_FORMAT,
+            settings.IMAGE_QUALITY,
+        )
+        if self.image_executor is not None:
+            image_path, thumbnail_path = self.image_executor.submit(normalize_image, *args).result()
+        else:
+            image_path, thumbnail_path = normalize_image(*args)
+
+        file_name = os.path.splitext(attachment.file_name)[0] + IMAGE_FORMAT_EXTENSIONS[settings.IMAGE_FORMAT]
+        try:
+            with open(image_path, "rb") as image_file:
+                content = set_storage_reference(File(image_file), attachment.application, attachment.field_name)
+                field_file.save(file_name, content, save=False)
+            with open(thumbnail_path, "rb") as thumbnail_file:
+                content = set_storage_reference(File(thumbnail_file), attachment, "thumbnail")
+                attachment.thumbnail.save(file_name, content, save=False)
+        finally:
+            for path in (image_path, thumbnail_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+class ApplicationResultService:
+    """
+    합격자 조회 서비스
+
+    발표 전에 publish_results 명령어(publish())로 연도별 결과를 Redis 해시에 미리 만들어 두고,
+    조회는 해시에서만 처리합니다. (조회 시 데이터베이스를 사용하지 않으며, 발표 전이면 결과가 없음)
+    지원서가 없는 연도도 발표 여부를 알 수 있도록 해시에 PUBLISHED_FIELD를 함께 기록합니다.
+    """
+    FIRST_RESULT = "FIRST"
+    FINAL_RESULT = "FINAL"
+    # 지원 코드의 HMAC(16진수)과 겹치지 않는 필드명
+    PUBLISHED_FIELD = "_published"
+
+    # 1차 발표 기간에는 최종 결과가 나왔더라도 1차 결과만 보여줌
+    FIRST_RESULT_STATUSES = {
+        StatusChoices.FIRST_PENDING:  StatusChoices.FIRST_PENDING,
+        StatusChoices.FIRST_ACCEPTED: StatusChoices.FIRST_ACCEPTED,
+        StatusChoices.FIRST_REJECTED: StatusChoices.FIRST_REJECTED,
+        StatusChoices.FINAL_ACCEPTED: StatusChoices.FIRST_ACCEPTED,
+        StatusChoices.FINAL_REJECTED: StatusChoices.FIRST_ACCEPTED,
+    }
+    RESULT_FIELDS = ("name", "part", "interview_method", "interview_at", "status")
+
+    def __init__(self, year:int):
+        self.year = year
+        self.result_hash = ApplicationResultHash(year=year)
+
+    def get_result_stage(self, phase:RecruitmentPhase)->str|None:
+        # 발표 기간이 겹치면 최종 발표 단계가 우선함 (RecruitmentPhaseService)
+        if phase.phase == RecruitmentPhaseChoices.FINAL_RESULT:
+            return self.FINAL_RESULT
+        if phase.phase == RecruitmentPhaseChoices.FIRST_RESULT:
+            return self.FIRST_RESULT
+        return None
+
+    def publish(self)->int:
+        """
+        해당 연도 지원서 전체의 결과로 해시를 새로 만듭니다.
+        """
+        applications = (
+            Application.objects
+            .filter(created_at__year=self.year)
+            .values("application_code", *self.RESULT_FIELDS)
+            .iterator(chunk_size=2000)
+        )
+        # 지원 코드는 HMAC으로 저장되어 있고, 이름은 암호문 그대로 두었다가 조회할 때 복호화
+        results = {
+            application.pop("application_code"): application
+            for application in applications
+        }
+        published = len(results)
+        results[self.PUBLISHED_FIELD] = timezone.now()
+        self.result_hash.replace(results)
+        return published
+
+    def is_published(self)->bool:
+        return self.result_hash.exists()
+
+    def refresh(self, student_numbers:list[str]):
+        """
+        이미 발표된 결과 중 일부 지원서의 결과만 갱신합니다. (발표 전이면 아무것도 하지 않음)
+        """
+        if not student_numbers or not self.is_published():
+            return
+        applications = (
+            Application.objects
+            .filter(student_number__in=student_numbers, created_at__year=self.year)
+            .values("application_code", *self.RESULT_FIELDS)
+        )
+        self.result_hash.hset_many({
+            application.pop("application_code"): application
+            for application in applications
+        })
+
+    def lookup(self, application_code:str, result_stage:str)->dict|None:
+        """
+        발표된 결과에서 지원 코드의 결과를 조회합니다. 없거나 아직 발표 전이면 None을 반환합니다. (is_published로 구분)
+        """
+        result = self.result_hash.hget(hash_application_code(application_code))
+        if result is None:
+            return None
+
+        result["name"] = Application._meta.get_field("name").decrypt(result["name"])
+        if result_stage == self.FIRST_RESULT:
+            result["status"] = self.FIRST_RESULT_STATUSES[result["status"]]
+
+        if result_stage == self.FIRST_RESULT and result["status"] == StatusChoices.FIRST_ACCEPTED:
+            result["interview_location"] = self._get_interview_location(result)
+        else:
+            result.pop("interview_at")
+
+        result.pop("interview_method")
+        return result
+
+    def _get_interview_location(self, result:dict)->str|None:
+        if result["interview_at"] is None:
+            return None
+        for interview_schedule in RecruitmentScheduleService(year=self.year).get_interview_schedules():
+            if (
+                interview_schedule.part == result["part"]
+                and interview_schedule.interview_method == result["interview_method"]
+                and interview_schedule.start <= result["interview_at"] <= interview_schedule.end
+            ):
+                return interview_schedule.interview_location
+        return None
+
+class ApplicationStatusService:
+    """
+    지원서 합불 상태 일괄 변경 서비스
+
+    목표 상태별로 UPDATE ... WHERE student_number IN (...) AND status IN (허용된 이전 상태) 한 번씩만 실행하고,
+    학번별 처리 결과를 반환합니다. 발표된 결과(Redis 해시)는 커밋 후 함께 갱신합니다.
+    """
+    # 목표 상태 -> 변경 전에 허용되는 상태 (잘못 처리한 경우를 되돌리는 변경 포함)
+    ALLOWED_TRANSITIONS = {
+        StatusChoices.FIRST_PENDING:  {StatusChoices.FIRST_ACCEPTED, StatusChoices.FIRST_REJECTED},
+        StatusChoices.FIRST_ACCEPTED: {StatusChoices.FIRST_PENDING, StatusChoices.FIRST_REJECTED},
+        StatusChoices.FIRST_REJECTED: {StatusChoices.FIRST_PENDING, StatusChoices.FIRST_ACCEPTED},
+        StatusChoices.FINAL_ACCEPTED: {StatusChoices.FIRST_ACCEPTED, StatusChoices.FINAL_REJECTED},
+        StatusChoices.FINAL_REJECTED: {StatusChoices.FIRST_ACCEPTED, StatusChoices.FINAL_ACCEPTED},
+    }
+
+    UPDATED            = "UPDATED"
+    UNCHANGED          = "UNCHANGED"
+    NOT_FOUND          = "NOT_FOUND"
+    DUPLICATED         = "DUPLICATED"
+    INVALID_TRANSITION = "INVALID_TRANSITION"
+
+    def transition(self, targets:dict[str, list[str]], dry_run:bool=False)->list[dict]:
+        """
+        targets: {목표 상태: [학번, ...]}
+        Returns: [{"student_number", "from", "to", "result"}, ...]
+        """
+        # 여러 목표 상태에 함께 들어간 학번은 변경하지 않음
+        requested:dict[str, str] = dict()
+        duplicated:set[str] = set()
+        for target, student_numbers in targets.items():
+            for student_number in student_numbers:
+                if student_number in requested and requested[student_number] != target:
+                    duplicated.add(student_number)
+                requested[student_number] = target
+
+        results = list()
+        with transaction.atomic():
+            current = {
+                student_number: (status, created_at)
+                for student_number, status, created_at in (
+                    Application.objects
+                    .select_for_update()
+                    .filter(student_number__in=list(requested))
+                    .values_list("student_number", "status", "created_at")
+                )
+            }
+
+            to_update:dict[str, list[str]] = dict()
+            for student_number, target in requested.items():
+                status = current[student_number][0] if student_number in current else None
+                if student_number in duplicated:
+                    result = self.DUPLICATED
+                elif status is None:
+                    result = self.NOT_FOUND
+                elif status == target:
+                    result = self.UNCHANGED
+                elif status not in self.ALLOWED_TRANSITIONS[target]:
+                    result = self.INVALID_TRANSITION
+                else:
+                    result = self.UPDATED
+                    to_update.setdefault(target, list()).append(student_number)
+                results.append({"student_number": student_number, "from": status, "to": target, "result": result})
+
+            if dry_run:
+                return results
+
+            for target, student_numbers in to_update.items():
+                Application.objects.filter(
+                    student_number__in=student_numbers,
+                    status__in=self.ALLOWED_TRANSITIONS[target],
+                ).update(status=target)
+
+            # 발표된 결과가 있으면 변경된 지원서만 갱신
+            updated_by_year:dict[int, list[str]] = dict()
+            for student_numbers in to_update.values():
+                for student_number in student_numbers:
+                    year = localtime(current[student_number][1]).year
+                    updated_by_year.setdefault(year, list()).append(student_number)
+            transaction.on_commit(lambda: [
+                ApplicationResultService(year=year).refresh(student_numbers)
+                for year, student_numbers in updated_by_year.items()
+            ])
+
+        return results
+
+class InterviewAssignmentService:
+    """
+    면접 시간 자동 배정 서비스
+
+    1차 합격자(왼쪽)와 파트별 30분 슬롯(오른쪽)의 용량이 있는 이분 매칭으로
+    가능한 한 많은 지원자에게 면접 가능 시간 중 하나를 배정합니다.
+    슬롯 용량은 파트·시각마다 하나이며, 그 시각에 열린 면접 방식(대면·비대면)의 지원자가 함께 나눠 씁니다.
+    """
+    def __init__(self, year:int, capacities:dict[str, int]|None=None, default_capacity:int=1):
+        self.year = year
+        self.capacities = capacities or dict()
+        self.default_capacity = default_capacity
+
+    def get_slots(self)->list[tuple[str, str, datetime]]:
+        """
+        Returns: 면접 일정에서 만든 (파트, 면접 방식, 시작 시각) 슬롯 목록 (중복 제거, 정렬)
+        """
+        slots = set()
+        for interview_schedule in RecruitmentScheduleService(year=self.year).get_interview_schedules():
+            for slot_start in iter_interview_slots(interview_schedule.start, interview_schedule.end):
+                slots.add((interview_schedule.part, interview_schedule.interview_method, slot_start))
+        return sorted(slots, key=lambda slot: (slot[2], slot[0], slot[1]))
+
+    def get_applications(self)->list[Application]:
+        return list(
+            Application.objects
+            .filter(created_at__year=self.year, status=StatusChoices.FIRST_ACCEPTED)
+            .only("student_number", "part", "interview_method", "interview_available_times", "interview_at")
+            .order_by("created_at", "student_number")
+        )
+
+    def solve(self, applications:list[Application], slots:list[tuple[str, str, datetime]], used:dict[tuple[str, datetime], int]|None=None)->dict[str, datetime|None]:
+        """
+        used: 이미 배정되어 자리를 차지한 인원 {(파트, 시작 시각): 인원}
+        Returns: {학번: 배정된 면접 시각 (배정하지 못하면 None)}
+        """
+        used = used or dict()
+        # 같은 파트·시각의 슬롯은 면접 방식과 관계없이 용량을 함께 사용
+        # (면접 방식은 그 시각에 해당 방식의 면접 일정이 있는지만 확인)
+        offered = set(slots)
+        part_slots = sorted({(part, slot_start) for part, _, slot_start in slots}, key=lambda slot: (slot[1], slot[0]))
+        slot_indexes = {slot: j for j, slot in enumerate(part_slots)}
+        capacities = [
+            max(0, self.capacities.get(part, self.default_capacity) - used.get((part, slot_start), 0))
+            for part, slot_start in part_slots
+        ]
+
+        adjacency = [
+            [
+                slot_indexes[(application.part, available_time)]
+                for available_time in sorted(application.interview_available_times)
+                if (application.part, application.interview_method, available_time) in offered
+            ]
+            for application in applications
+        ]
+
+        matching = max_bipartite_matching(adjacency, capacities)
+
+        return {
+            application.student_number: (part_slots[j][1] if j is not None else None)
+            for application, j in zip(applications, matching)
+        }
+
+    def assign(self, dry_run:bool=False, reassign:bool=False)->dict[str, datetime|None]:
+        """
+        면접 시각이 없는 1차 합격자만 배정합니다. 이미 배정된(수동 배정 포함) 지원자는 그대로 두고 그 자리를 용량에서 뺍니다.
+        reassign이면 모든 1차 합격자를 다시 배정합니다. (배정하지 못한 지원자의 면접 시각은 비움)
+        값이 바뀐 지원서만 저장하고, 발표된 결과는 커밋 후 갱신합니다.
+        Returns: {학번: 면접 시각 (배정하지 못하면 None)}
+        """
+        applications = self.get_applications()
+        if reassign:
+            assigned, pending = list(), applications
+        else:
+            assigned = [application for application in applications if application.interview_at is not None]
+            pending = [application for application in applications if application.interview_at is None]
+
+        used:dict[tuple[str, datetime], int] = dict()
+        for application in assigned:
+            key = (application.part, application.interview_at)
+            used[key] = used.get(key, 0) + 1
+
+        assignments = {application.student_number: application.interview_at for application in assigned}
+        assignments.update(self.solve(pending, self.get_slots(), used))
+
+        changed = [
+            application for application in applications
+            if application.interview_at != assignments[application.student_number]
+        ]
+        if not dry_run and changed:
+            with transaction.atomic():
+                for application in changed:
+                    application.interview_at = assignments[application.student_number]
+                # bulk_update는 post_save를 보내지 않으므로, 발표된 결과는 직접 갱신
+                Application.objects.bulk_update(changed, ["interview_at"], batch_size=500)
+                student_numbers = [application.student_number for application in changed]
+                transaction.on_commit(lambda: ApplicationResultService(year=self.year).refresh(student_numbers))
+
+        return assignments
+
+class SlotDemandService:
+    """
+    면접 슬롯별·파트별 선택 인원(수요) 집계 서비스
+
+    interview_available_times를 unnest해 GROUP BY 하는 집계 쿼리 한 번으로 계산하고,
+    일정 버전별로 잠시 캐시합니다.
+    해당 연도의 지원서를 모두 읽는 쿼리이므로 GIN 인덱스(application_times_gin_idx)는 쓰지 않습니다.
+    (순차 스캔 또는 created_at 인덱스, 비용은 지원서 수에 비례하며 캐시로 줄임)
+    """
+    timeout = 60
+
+    def __init__(self, year:int, status:str|None=None):
+        self.year = year
+        self.status = status
+
+    def get_demand(self)->list[dict]:
+        """
+        Returns: [{"start": 슬롯 시작 시각, "counts": {파트: 인원}, "total": 인원}, ...] (시작 시각 오름차순)
+        """
+        version = RecruitmentScheduleService(year=self.year).get_version()
+        slot_demand_cache = SlotDemandCache(year=self.year, status=self.status, version=version)
+
+        demand = slot_demand_cache.get()
+        if demand is None:
+            demand = self._aggregate()
+            slot_demand_cache.set(demand, timeout=self.timeout)
+        return demand
+
+    def _aggregate(self)->list[dict]:
+        table = Application._meta.db_table
+        sql = f"""
+            SELECT slot, part, COUNT(*)
+            FROM {table} CROSS JOIN LATERAL unnest(interview_available_times) AS slot
+            WHERE created_at >= %s AND created_at < %s {"AND status = %s" if self.status else ""}
+            GROUP BY slot, part
+            ORDER BY slot
+        """
+        params = [make_aware(datetime(self.year, 1, 1)), make_aware(datetime(self.year + 1, 1, 1))]
+        if self.status:
+            params.append(self.status)
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+
+        demand:dict[datetime, dict] = dict()
+        for slot, part, count in rows:
+            slot_demand = demand.setdefault(slot, {"start": slot, "counts": dict(), "total": 0})
+            slot_demand["counts"][part] = count
+            slot_demand["total"] += count
+        return list(demand.values())
+
+class InterviewSlotCapacityService:
+    """
+    면접 슬롯별 선택 인원·남은 자리 서비스
+
+    슬롯별 선택 인원은 Redis 카운터(InterviewSlotCounter)에 두고, 지원서를 제출할 때 reserve()로 원자적으로 늘립니다.
+    면접 일정에 slot_capacity가 있으면 그 슬롯을 고른 지원자 수를 제한합니다.
+    (같은 슬롯에 면접 일정이 여러 개면 합계, 하나라도 비어 있으면 제한 없음)
+    조회는 카운터와 캐시된 한도만 읽으므로 지원서 수와 관계없이 슬롯 수에 비례합니다.
+
+    관리자 페이지에서 지원서를 수정하는 등으로 카운터가 어긋나면 rebuild()로 데이터베이스에서 다시 만듭니다.
+    """
+    def __init__(self, year:int):
+        self.year = year
+        self.counter = InterviewSlotCounter(year=year)
+
+    @staticmethod
+    def get_field(slot_start:datetime)->str:
+        return str(int(slot_start.timestamp()))
+
+    def get_limits(self)->dict[str, int|None]:
+        """
+        면접 일정이 바뀔 때마다(캐시 무효화 후) 한 번만 만들어 캐시에 저장합니다.
+        """
+        def build_limits():
+            limits:dict[str, int|None] = dict()
+            for interview_schedule in RecruitmentScheduleService(year=self.year).get_interview_schedules():
+                for slot_start in iter_interview_slots(interview_schedule.start, interview_schedule.end):
+                    field = self.get_field(slot_start)
+                    if interview_schedule.slot_capacity is None or (field in limits and limits[field] is None):
+                        limits[field] = None
+                    else:
+                        limits[field] = limits.get(field, 0) + interview_schedule.slot_capacity
+            return limits
+
+        return InterviewSlotLimitsCache(year=self.year).get_or_set(build_limits, timeout=RecruitmentScheduleService.timeout)
+
+    def reserve(self, slot_starts:list[datetime])->list[datetime]:
+        """
+        선택한 슬롯에 모두 자리가 있으면 카운터를 늘리고 빈 목록을,
+        자리가 없는 슬롯이 있으면 카운터를 늘리지 않고 그 슬롯 목록을 반환합니다.
+        """
+        limits = self.get_limits()
+        fields = {self.get_field(slot_start): slot_start for slot_start in slot_starts}
+        full = self.counter.reserve({field: limits.get(field) for field in fields})
+        return [fields[field] for field in full]
+
+    def release(self, slot_starts:list[datetime]):
+        self.counter.incr_many([self.get_field(slot_start) for slot_start in slot_starts], delta=-1)
+
+    def get_capacity(self)->list[dict]:
+        """
+        Returns: [{"start": 슬롯 시작 시각, "count": 선택 인원, "capacity": 한도, "remaining": 남은 자리}, ...]
+        (시작 시각 오름차순, 한도가 없으면 capacity와 remaining은 None)
+        """
+        counts = self.counter.get_all()
+        return [
+            {
+                "start": datetime.fromtimestamp(int(field), tz=timezone.get_current_timezone()),
+                "count": counts.get(field, 0),
+                "capacity": limit,
+                "remaining": None if limit is None else max(0, limit - counts.get(field, 0)),
+            }
+            for field, limit in sorted(self.get_limits().items(), key=lambda item: int(item[0]))
+        ]
+
+    def rebuild(self)->int:
+        """
+        해당 연도 지원서의 interview_available_times를 unnest해 GROUP BY 하는 쿼리 한 번으로 카운터를 다시 만듭니다.
+        집계와 교체 사이에 제출된 지원서는 반영되지 않을 수 있으므로 제출이 적은 시간에 실행합니다.
+        """
+        sql = f"""
+            SELECT slot, COUNT(*)
+            FROM {Application._meta.db_table} CROSS JOIN LATERAL unnest(interview_available_times) AS slot
+            WHERE created_at >= %s AND created_at < %s
+            GROUP BY slot
+        """
+        params = [make_aware(datetime(self.year, 1, 1)), make_aware(datetime(self.year + 1, 1, 1))]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            counts = {self.get_field(slot_start): count for slot_start, count in cursor.fetchall()}
+
+        self.counter.replace(counts)
+        return len(counts)
+
+class SubmittedStudentNumberService:
+    """
+    연도별 제출 학번 집합 서비스
+
+    지원서를 제출하면 커밋 후 add(), 삭제하면 remove()로 반영하고, 중복 제출은 contains()로 데이터베이스 없이 거릅니다.
+    (연도는 지원서 created_at의 현지 연도)
+    Redis가 비워지면 rebuild()로 데이터베이스에서 다시 만듭니다. 집합에 없더라도 기본 키 제약이 중복 저장을 막습니다.
+    """
+    def __init__(self, year:int):
+        self.year = year
+        self.student_numbers = SubmittedStudentNumberSet(year=year)
+
+    def contains(self, student_number:str)->bool:
+        return self.student_numbers.contains(student_number)
+
+    def add(self, student_number:str):
+        self.student_numbers.add(student_number)
+
+    def remove(self, student_number:str):
+        self.student_numbers.remove(student_number)
+
+    def rebuild(self)->int:
+        """
+        Returns: 해당 연도에 제출된 학번 수
+        """
+        student_numbers = list(
+            Application.objects
+            .filter(
+                created_at__gte=make_aware(datetime(self.year, 1, 1)),
+                created_at__lt=make_aware(datetime(self.year + 1, 1, 1)),
+            )
+            .values_list("student_number", flat=True)
+        )
+        self.student_numbers.replace(student_numbers)
+        return len(student_numbers)
+
+class ReviewService:
+    """
+    서류 평가 저장과 지원서별 평가 집계(ApplicationScoreSummary) 서비스
+
+    평가자마다 점수를 후하게·박하게 주는 경향이 다르므로, 평가자별 총점의 평균과 표준편차로
+    표준화한 점수(z-score)의 평균을 calibrated_score로 저장합니다.
+    평가 하나가 바뀌면 그 평가자의 평균·표준편차가 바뀌므로, 그 평가자가 평가한 지원서의 집계만 다시 계산합니다.
+    """
+    lock_timeout = 60
+
+    def __init__(self, year:int):
+        self.year = year
+        self.max_total = len(ReviewCriterionChoices) * REVIEW_SCORE_MAX
+
+    def submit(self, reviewer, application:Application, scores:dict[str, int], comment:str="")->Review:
+        """
+        평가를 추가하거나 같은 평가자의 기존 평가를 덮어쓰고, 커밋 후 집계를 갱신합니다.
+        """
+        with transaction.atomic():
+            review, _ = Review.objects.update_or_create(
+                reviewer=reviewer,
+                application=application,
+                defaults={"scores": scores, "total": sum(scores.values()), "comment": comment},
+            )
+            transaction.on_commit(lambda: self.refresh(reviewer_ids=[review.reviewer_id]))
+        return review
+
+    def refresh(self, reviewer_ids:list[int]|None=None)->int:
+        """
+        reviewer_ids가 평가한 지원서의 집계를 다시 계산합니다. (None이면 해당 연도 전체)
+        동시에 갱신해도 나중에 실행된 갱신이 최신 평가를 모두 반영하도록 연도별 잠금 안에서 계산합니다.
+        Returns: 갱신한 지원서 수
+        """
+        with cache.lock(f"{CacheKey.REVIEW_SCORE_SUMMARY.format(year=self.year)}:lock", timeout=self.lock_timeout):
+            rows = self._aggregate(reviewer_ids)
+            summaries = [
+                ApplicationScoreSummary(
+                    application_id=application_id,
+                    year=self.year,
+                    part=part,
+                    review_count=review_count,
+                    mean_score=mean_score,
+                    normalized_score=mean_score / self.max_total * 100,
+                    calibrated_score=calibrated_score,
+                )
+                for application_id, part, review_count, mean_score, calibrated_score in rows
+            ]
+            with transaction.atomic():
+                if reviewer_ids is None:
+                    ApplicationScoreSummary.objects.filter(year=self.year).exclude(
+                        application_id__in=[summary.application_id for summary in summaries]
+                    ).delete()
+                ApplicationScoreSummary.objects.bulk_create(
+                    summaries,
+                    update_conflicts=True,
+                    unique_fields=["application"],
+                    update_fields=["year", "part", "review_count", "mean_score", "normalized_score", "calibrated_score", "updated_at"],
+                    batch_size=500,
+                )
+        return len(summaries)
+
+    def _aggregate(self, reviewer_ids:list[int]|None)->list[tuple]:
+        """
+        평가자별 평균·표준편차와 지원서별 평균·표준화 점수를 집계 쿼리 한 번으로 계산합니다.
+        (표준편차가 0인 평가자, 즉 모든 지원서에 같은 점수를 준 평가자의 표준화 점수는 0)
+        Returns: [(학번, 파트, 평가 수, 총점 평균, 표준화 점수 평균), ...]
+        """
+        review_table = Review._meta.db_table
+        application_table = Application._meta.db_table
+        affected = "SELECT application_id FROM year_reviews"
+        if reviewer_ids is not None:
+            affected += " WHERE reviewer_id = ANY(%s)"
+        sql = f"""
+            WITH year_reviews AS (
+                SELECT r.application_id, r.reviewer_id, r.total, a.part
+                FROM {review_table} r JOIN {application_table} a ON a.student_number = r.application_id
+                WHERE a.created_at >= %s AND a.created_at < %s
+            ),
+            affected AS ({affected}),
+            reviewer_stats AS (
+                SELECT reviewer_id, AVG(total) AS mean, STDDEV_POP(total) AS std
+                FROM year_reviews
+                WHERE reviewer_id IN (
+                    SELECT reviewer_id FROM year_reviews WHERE application_id IN (SELECT application_id FROM affected)
+                )
+                GROUP BY reviewer_id
+            )
+            SELECT y.application_id, y.part, COUNT(*), AVG(y.total),
+                   AVG(COALESCE((y.total - s.mean) / NULLIF(s.std, 0), 0))
+            FROM year_reviews y JOIN reviewer_stats s ON s.reviewer_id = y.reviewer_id
+            WHERE y.application_id IN (SELECT application_id FROM affected)
+            GROUP BY y.application_id, y.part
+        """
+        params = [make_aware(datetime(self.year, 1, 1)), make_aware(datetime(self.year + 1, 1, 1))]
+        if reviewer_ids is not None:
+            params.append(list(reviewer_ids))
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [
+                (application_id, part, review_count, float(mean_score), float(calibrated_score))
+                for application_id, part, review_count, mean_score, calibrated_score in cursor.fetchall()
+            ]
+
+    def get_ranking(self, part:str|None=None)->dict:
+        """
+        집계 테이블만 읽어 파트별 순위를 반환합니다. (표준화 점수 내림차순)
+        Returns: {"parts": {파트: {"count", "mean_score", "normalized_score"}}, "rankings": {파트: [...]}}
+        """
+        summaries = ApplicationScoreSummary.objects.filter(year=self.year)
+        if part:
+            summaries = summaries.filter(part=part)
+
+        parts = {
+            row["part"]: {
+                "count": row["count"],
+                "mean_score": row["mean_score"],
+                "normalized_score": row["normalized_score"],
+            }
+            for row in summaries.values("part").annotate(
+                count=Count("application"),
+                mean_score=Avg("mean_score"),
+                normalized_score=Avg("normalized_score"),
+            ).order_by("part")
+        }
+
+        rankings:dict[str, list[dict]] = {part: list() for part in parts}
+        for summary in (
+            summaries
+            .select_related("application")
+            .only("part", "review_count", "mean_score", "normalized_score", "calibrated_score", "application__name")
+            .order_by("part", "-calibrated_score", "application_id")
+        ):
+            ranking = rankings[summary.part]
+            ranking.append({
+                "rank": len(ranking) + 1,
+                "student_number": summary.application_id,
+                "name": summary.application.name,
+                "review_count": summary.review_count,
+                "mean_score": summary.mean_score,
+                "normalized_score": summary.normalized_score,
+                "calibrated_score": summary.calibrated_score,
+            })
+
+        return {"parts": parts, "rankings": rankings}
+
+class _Echo:
+    """
+    csv.writer가 쓴 한 줄을 그대로 반환하는 의사 버퍼
+    """
+    def write(self, value:str)->str:
+        return value
+
+class _ZipStream:
+    """
+    ZipFile이 쓴 바이트를 모아 두었다가 pop()으로 꺼내는 쓰기 전용 스트림
+    (tell/seek가 없으므로 ZipFile은 데이터 디스크립터를 사용해 앞으로만 씀)
+    """
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def write(self, data:bytes)->int:
+        self.buffer += data
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self)->bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+class ApplicationExportService:
+    """
+    지원서 일괄 내보내기 서비스 (CSV, 첨부 파일을 포함한 ZIP)
+
+    지원서는 서버 측 커서(iterator)로 chunk_size개씩 읽고 결과는 생성기로 조금씩 내보내므로,
+    지원서 수와 관계없이 메모리 사용량이 일정합니다.
+    ZIP의 첨부 파일은 download_workers개의 스레드가 S3에서 임시 파일로 미리 받아 두고, 받은 순서대로 압축 파일에 씁니다.
+    """
+    EXPORT_FIELDS = (
+        "student_number","name","phone_number","birthday","department","grade",
+        "part","interview_method","interview_available_times","interview_at","status",
+        "personal_statement_1","personal_statement_2","personal_statement_3","personal_statement_4","personal_statement_5",
+        "created_at",
+    )
+    ATTACHMENT_FIELDS = (
+        "completed_prerequisite_1","completed_prerequisite_2","completed_prerequisite_3",
+        "portfolio_1","portfolio_2","portfolio_3",
+    )
+    CHOICE_LABELS = {
+        "part": dict(PartChoices.choices),
+        "interview_method": dict(InterviewMethodChoices.choices),
+        "status": dict(StatusChoices.choices),
+    }
+    chunk_size = 500
+    copy_chunk_size = 1024*1024
+
+    def __init__(self, year:int, download_workers:int=4):
+        self.year = year
+        self.download_workers = download_workers
+
+    def get_applications(self, *fields:str)->Iterator[dict]:
+        """
+        요청한 필드만 읽고, 그중 암호화된 필드만 복호화합니다. (행마다 데이터 키는 한 번만 풂)
+        """
+        encrypted_fields = [
+            Application._meta.get_field(field) for field in fields
+            if isinstance(Application._meta.get_field(field), EncryptedFieldMixin)
+        ]
+        applications = (
+            Application.objects
+            .filter(
+                created_at__gte=make_aware(datetime(self.year, 1, 1)),
+                created_at__lt=make_aware(datetime(self.year + 1, 1, 1)),
+            )
+            .order_by("created_at", "student_number")
+            .values(*fields)
+            .iterator(chunk_size=self.chunk_size)
+        )
+        for application in applications:
+            for field in encrypted_fields:
+                application[field.name] = field.decrypt(application[field.name])
+            yield application
+
+    def iter_csv(self)->Iterator[bytes]:
+        """
+        엑셀에서 바로 열 수 있도록 UTF-8 BOM으로 시작하는 CSV를 한 줄씩 반환합니다.
+        """
+        writer = csv.writer(_Echo())
+        yield "\ufeff".encode()
+        yield writer.writerow(
+            [Application._meta.get_field(field).help_text for field in self.EXPORT_FIELDS]
+            + [f"{Application._meta.get_field(field).help_text} {field.rsplit('_', 1)[1]}" for field in self.ATTACHMENT_FIELDS]
+        ).encode()
+        for application in self.get_applications(*self.EXPORT_FIELDS, *self.ATTACHMENT_FIELDS):
+            yield writer.writerow(
+                [self.format_value(field, application[field]) for field in self.EXPORT_FIELDS + self.ATTACHMENT_FIELDS]
+            ).encode()
+
+    def iter_zip(self)->Iterator[bytes]:
+        """
+        applications.csv와 첨부 파일("학번_이름/필드명.확장자")을 담은 ZIP을 조금씩 반환합니다.
+        """
+        stream = _ZipStream()
+        errors = list()
+        with zipfile.ZipFile(stream, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+            with archive.open("applications.csv", mode="w") as entry:
+                for chunk in self.iter_csv():
+                    entry.write(chunk)
+                    if len(stream.buffer) >= self.copy_chunk_size:
+                        yield stream.pop()
+            yield stream.pop()
+
+            with ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+                # 미리 받아 두는 파일 수를 제한해 디스크 사용량도 제한
+                pending = deque()
+                for arcname, name in self.iter_attachments():
+                    pending.append((arcname, name, executor.submit(self.download, name)))
+                    if len(pending) >= self.download_workers * 2:
+                        yield from self.write_attachment(archive, stream, errors, *pending.popleft())
+                while pending:
+                    yield from self.write_attachment(archive, stream, errors, *pending.popleft())
+
+            if errors:
+                archive.writestr("errors.txt", "\n".join(errors))
+        yield stream.pop()
+
+    def iter_attachments(self)->Iterator[tuple[str, str]]:
+        """
+        Returns: (압축 파일 안의 경로, 스토리지 파일명)
+        """
+        for application in self.get_applications("student_number", "name", *self.ATTACHMENT_FIELDS):
+            for field in self.ATTACHMENT_FIELDS:
+                name = application[field]
+                if name:
+                    ext = os.path.splitext(name)[1].lower()
+                    yield f"{application['student_number']}_{application['name']}/{field}{ext}", name
+
+    def download(self, name:str):
+        temp_file = TemporaryFile()
+        try:
+            default_storage.download_fileobj(name, temp_file)
+        except Exception:
+            temp_file.close()
+            raise
+        temp_file.seek(0)
+        return temp_file
+
+    def write_attachment(self, archive:zipfile.ZipFile, stream:_ZipStream, errors:list[str], arcname:str, name:str, future)->Iterator[bytes]:
+        try:
+            temp_file = future.result()
+        except Exception as e:
+            errors.append(f"{arcname}\t{name}\t{e}")
+            return
+
+        with temp_file:
+            # 이미지와 PDF는 이미 압축되어 있으므로 압축하지 않고 저장
+            info = zipfile.ZipInfo(arcname, date_time=localtime().timetuple()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            with archive.open(info, mode="w") as entry:
+                while chunk := temp_file.read(self.copy_chunk_size):
+                    entry.write(chunk)
+                    yield stream.pop()
+        yield stream.pop()
+
+    def format_value(self, field:str, value)->str:
+        if value is None:
+            return ""
+        if field in self.CHOICE_LABELS:
+            return self.CHOICE_LABELS[field].get(value, value)
+        if isinstance(value, datetime):
+            return localtime(value).strftime("%Y-%m-%d %H:%M")
+        if isinstance(value, list):
+            return ", ".join(self.format_value(field, item) for item in value)
+        return str(value)
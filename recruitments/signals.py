@@ -0,0 +1,39 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils.timezone import localtime
+from .models import RecruitmentSchedule, InterviewSchedule, Application
+from .services import RecruitmentScheduleService, ApplicationResultService, InterviewSlotCapacityService, SubmittedStudentNumberService
+
+# 커밋 전에 무효화하면 다른 요청이 이전 값을 다시 캐시에 채울 수 있으므로 커밋 후에 무효화
+
+@receiver([post_save, post_delete], sender=RecruitmentSchedule)
+def invalidate_recruitment_schedule_cache(sender, instance:RecruitmentSchedule, **kwargs):
+    transaction.on_commit(RecruitmentScheduleService(year=instance.year).invalidate)
+
+@receiver([post_save, post_delete], sender=InterviewSchedule)
+def invalidate_interview_schedule_cache(sender, instance:InterviewSchedule, **kwargs):
+    transaction.on_commit(RecruitmentScheduleService(year=instance.recruitment_schedule_id).invalidate)
+
+@receiver(post_save, sender=Application)
+def refresh_application_result(sender, instance:Application, created:bool, **kwargs):
+    # 관리자 페이지 등에서 지원서를 수정하면, 이미 발표된 결과에도 반영
+    if created:
+        return
+    transaction.on_commit(
+        lambda: ApplicationResultService(year=localtime(instance.created_at).year).refresh([instance.student_number])
+    )
+
+@receiver(post_delete, sender=Application)
+def release_interview_slots(sender, instance:Application, **kwargs):
+    # 삭제된 지원서가 고른 면접 슬롯의 자리를 돌려줌
+    transaction.on_commit(
+        lambda: InterviewSlotCapacityService(year=localtime(instance.created_at).year).release(instance.interview_available_times)
+    )
+
+@receiver(post_delete, sender=Application)
+def remove_submitted_student_number(sender, instance:Application, **kwargs):
+    # 삭제된 지원서의 학번은 다시 제출할 수 있도록 집합에서 뺌
+    # (삭제 후 instance의 기본 키는 None이 되므로 커밋 전에 값을 읽어 둠)
+    service, student_number = SubmittedStudentNumberService(year=localtime(instance.created_at).year), instance.student_number
+    transaction.on_commit(lambda: service.remove(student_number))
@@ -1,3 +1,745 @@
-from django.test import TestCase
+from datetime import date, datetime, timedelta
+from io import BytesIO
+import csv
+import os
+from tempfile import TemporaryDirectory
+from unittest import mock
+from uuid import uuid4
+import statistics
+from types import SimpleNamespace
+import zipfile
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache, caches
+from django.core.files.storage import default_storage
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from django.utils import timezone
+from django.utils.timezone import make_aware
+from accounts.models import User
+from utils.choices import AttachmentStatusChoices, InterviewMethodChoices, PartChoices, RecruitmentPhaseChoices, ReviewCriterionChoices, StatusChoices
+from utils.encryption import TOKEN_PREFIX, DecryptionError
+from utils.files import InvalidFileError
+from utils.helpers import hash_application_code
+from .models import Application, ApplicationAttachment, ApplicationScoreSummary, InterviewSchedule, RecruitmentSchedule, Review
+from .serializers import ApplicationCreateSerializer, get_attachment_upload_to
+from .services import (
+    ApplicationAttachmentService, ApplicationExportService, ApplicationResultService, ApplicationStatusService,
+    InterviewAssignmentService, InterviewSlotCapacityService, RecruitmentPhaseService, RecruitmentScheduleService, ReviewService,
+    SlotDemandService, SubmittedStudentNumberService,
+)
+from .views import ApplicationListPagination, InterviewSlotView, RecruitmentScheduleView
 
-# Create your tests here.
+class InterviewAssignmentServiceTest(SimpleTestCase):
+    start = make_aware(datetime(2026, 3, 2, 10))
+    later = start + timedelta(minutes=30)
+
+    def make_application(self, student_number:str, part:str, interview_method:str, times:list[datetime]):
+        return SimpleNamespace(
+            student_number=student_number,
+            part=part,
+            interview_method=interview_method,
+            interview_available_times=times,
+        )
+
+    def test_methods_share_slot_capacity(self):
+        slots = [
+            (PartChoices.BACKEND, InterviewMethodChoices.ONLINE, self.start),
+            (PartChoices.BACKEND, InterviewMethodChoices.OFFLINE, self.start),
+        ]
+        applications = [
+            self.make_application("1", PartChoices.BACKEND, InterviewMethodChoices.ONLINE, [self.start]),
+            self.make_application("2", PartChoices.BACKEND, InterviewMethodChoices.OFFLINE, [self.start]),
+        ]
+        assignments = InterviewAssignmentService(year=2026).solve(applications, slots)
+        self.assertEqual(sorted(assignments.values(), key=lambda value: value is None), [self.start, None])
+
+        assignments = InterviewAssignmentService(year=2026, default_capacity=2).solve(applications, slots)
+        self.assertEqual(assignments, {"1": self.start, "2": self.start})
+
+    def test_only_offered_method_and_part(self):
+        slots = [
+            (PartChoices.BACKEND, InterviewMethodChoices.OFFLINE, self.start),
+            (PartChoices.FRONTEND, InterviewMethodChoices.ONLINE, self.later),
+        ]
+        applications = [
+            self.make_application("1", PartChoices.BACKEND, InterviewMethodChoices.ONLINE, [self.start]),
+            self.make_application("2", PartChoices.BACKEND, InterviewMethodChoices.OFFLINE, [self.later]),
+            self.make_application("3", PartChoices.FRONTEND, InterviewMethodChoices.ONLINE, [self.start, self.later]),
+        ]
+        assignments = InterviewAssignmentService(year=2026).solve(applications, slots)
+        self.assertEqual(assignments, {"1": None, "2": None, "3": self.later})
+
+    def test_part_capacities(self):
+        slots = [(PartChoices.BACKEND, InterviewMethodChoices.OFFLINE, self.start)]
+        applications = [
+            self.make_application(str(i), PartChoices.BACKEND, InterviewMethodChoices.OFFLINE, [self.start])
+            for i in range(3)
+        ]
+        service = InterviewAssignmentService(year=2026, capacities={PartChoices.BACKEND: 2})
+        assignments = service.solve(applications, slots)
+        self.assertEqual(sum(interview_at is not None for interview_at in assignments.values()), 2)
+
+def make_application(student_number:str, part:str=PartChoices.BACKEND, **kwargs)->Application:
+    # 지원 코드는 학번과 같게 함
+    kwargs.setdefault("application_code", hash_application_code(student_number))
+    return Application.objects.create(
+        student_number=student_number,
+        name=f"지원자{student_number}",
+        phone_number="010-0000-0000",
+        birthday=date(2004, 1, 1),
+        department="컴퓨터공학과",
+        grade="2",
+        part=part,
+        interview_method=InterviewMethodChoices.OFFLINE,
+        personal_statement_1="a",
+        personal_statement_2="b",
+        personal_statement_3="c",
+        personal_statement_4="d",
+        personal_statement_5="e",
+        **kwargs,
+    )
+
+class ReviewServiceTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.service = ReviewService(year=timezone.localdate().year)
+        self.reviewers = [User.objects.create(email=f"reviewer{i}@example.com", is_staff=True) for i in range(3)]
+        self.applications = [
+            make_application("2500000", PartChoices.BACKEND),
+            make_application("2500001", PartChoices.BACKEND),
+            make_application("2500002", PartChoices.BACKEND),
+            make_application("2500003", PartChoices.FRONTEND),
+        ]
+
+    def submit(self, reviewer:User, application:Application, total:int)->Review:
+        # 총점을 평가 항목에 고르게 나눔
+        criteria = list(ReviewCriterionChoices.values)
+        scores = {criterion: total // len(criteria) + (i < total % len(criteria)) for i, criterion in enumerate(criteria)}
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.service.submit(reviewer, application, scores)
+
+    def test_calibrated_score_is_mean_of_reviewer_z_scores(self):
+        totals = {
+            # 후한 평가자와 박한 평가자
+            self.reviewers[0]: {"2500000": 20, "2500001": 12, "2500002": 16},
+            self.reviewers[1]: {"2500000": 8, "2500001": 4},
+        }
+        applications = {application.student_number: application for application in self.applications}
+        for reviewer, reviewer_totals in totals.items():
+            for student_number, total in reviewer_totals.items():
+                self.submit(reviewer, applications[student_number], total)
+
+        z_scores = dict()
+        for reviewer, reviewer_totals in totals.items():
+            mean, std = statistics.fmean(reviewer_totals.values()), statistics.pstdev(reviewer_totals.values())
+            for student_number, total in reviewer_totals.items():
+                z_scores.setdefault(student_number, []).append((total - mean) / std)
+
+        summaries = {summary.application_id: summary for summary in ApplicationScoreSummary.objects.all()}
+        self.assertEqual(set(summaries), set(z_scores))
+        for student_number, scores in z_scores.items():
+            summary = summaries[student_number]
+            reviewer_totals = [reviewer_totals[student_number] for reviewer_totals in totals.values() if student_number in reviewer_totals]
+            self.assertEqual(summary.review_count, len(scores))
+            self.assertAlmostEqual(summary.mean_score, statistics.fmean(reviewer_totals))
+            self.assertAlmostEqual(summary.normalized_score, statistics.fmean(reviewer_totals) / self.service.max_total * 100)
+            self.assertAlmostEqual(summary.calibrated_score, statistics.fmean(scores))
+
+        # 부분 갱신 결과가 전체 재계산과 같아야 함
+        snapshot = {pk: (summary.mean_score, summary.calibrated_score) for pk, summary in summaries.items()}
+        self.service.refresh()
+        for summary in ApplicationScoreSummary.objects.all():
+            self.assertAlmostEqual(summary.mean_score, snapshot[summary.application_id][0])
+            self.assertAlmostEqual(summary.calibrated_score, snapshot[summary.application_id][1])
+
+    def test_reviewer_with_constant_scores_is_neutral(self):
+        for application in self.applications[:3]:
+            self.submit(self.reviewers[0], application, 12)
+        for summary in ApplicationScoreSummary.objects.all():
+            self.assertEqual(summary.calibrated_score, 0)
+            self.assertAlmostEqual(summary.mean_score, 12)
+
+    def test_resubmitting_overwrites_review(self):
+        self.submit(self.reviewers[0], self.applications[0], 20)
+        self.submit(self.reviewers[0], self.applications[1], 10)
+        self.submit(self.reviewers[0], self.applications[0], 5)
+
+        self.assertEqual(Review.objects.filter(reviewer=self.reviewers[0], application=self.applications[0]).count(), 1)
+        summary = ApplicationScoreSummary.objects.get(application=self.applications[0])
+        self.assertEqual(summary.review_count, 1)
+        self.assertAlmostEqual(summary.mean_score, 5)
+        self.assertLess(summary.calibrated_score, 0)
+
+    def test_ranking_breaks_ties_by_student_number_per_part(self):
+        # 2500002와 2500001은 같은 점수 -> 학번 순
+        self.submit(self.reviewers[0], self.applications[2], 16)
+        self.submit(self.reviewers[0], self.applications[1], 16)
+        self.submit(self.reviewers[0], self.applications[0], 8)
+        self.submit(self.reviewers[0], self.applications[3], 20)
+
+        ranking = self.service.get_ranking()
+        backend = ranking["rankings"][PartChoices.BACKEND]
+        self.assertEqual([row["student_number"] for row in backend], ["2500001", "2500002", "2500000"])
+        self.assertEqual([row["rank"] for row in backend], [1, 2, 3])
+        self.assertEqual(backend[0]["calibrated_score"], backend[1]["calibrated_score"])
+        self.assertEqual(backend[0]["name"], "지원자2500001")
+
+        frontend = ranking["rankings"][PartChoices.FRONTEND]
+        self.assertEqual([(row["student_number"], row["rank"]) for row in frontend], [("2500003", 1)])
+        self.assertEqual(ranking["parts"][PartChoices.BACKEND]["count"], 3)
+        self.assertAlmostEqual(ranking["parts"][PartChoices.BACKEND]["mean_score"], (16 + 16 + 8) / 3)
+
+        self.assertEqual(list(self.service.get_ranking(part=PartChoices.FRONTEND)["rankings"]), [PartChoices.FRONTEND])
+
+class SubmittedStudentNumberServiceTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.year = timezone.localdate().year
+        self.service = SubmittedStudentNumberService(year=self.year)
+
+    def test_sets_are_scoped_by_year(self):
+        self.service.add("2500000")
+        self.assertTrue(self.service.contains("2500000"))
+        self.assertFalse(SubmittedStudentNumberService(year=self.year + 1).contains("2500000"))
+
+    def test_deleting_application_removes_student_number(self):
+        application = make_application("2500000")
+        self.service.add("2500000")
+        with self.captureOnCommitCallbacks(execute=True):
+            application.delete()
+        self.assertFalse(self.service.contains("2500000"))
+
+    def test_rebuild_from_database(self):
+        make_application("2500000")
+        make_application("2500001")
+        self.service.add("2599999")
+        self.assertEqual(self.service.rebuild(), 2)
+        self.assertTrue(self.service.contains("2500000"))
+        self.assertTrue(self.service.contains("2500001"))
+        self.assertFalse(self.service.contains("2599999"))
+
+        Application.objects.all().delete()
+        self.assertEqual(self.service.rebuild(), 0)
+        self.assertFalse(self.service.contains("2500000"))
+
+def make_recruitment_schedule(year:int)->RecruitmentSchedule:
+    """
+    1월 1일부터 1년 내내 서류 접수 중인 모집 일정 (면접은 다음 해 2월)
+    """
+    def at(days:int, hours:int=0)->datetime:
+        return make_aware(datetime(year, 1, 1)) + timedelta(days=days, hours=hours)
+    return RecruitmentSchedule.objects.create(
+        year=year,
+        application_start=at(0),
+        application_end=at(400),
+        first_result_start=at(401),
+        first_result_end=at(403),
+        interview_start=(at(402)).date(),
+        interview_end=(at(404)).date(),
+        final_result_start=at(406),
+        final_result_end=at(408),
+    )
+
+class InterviewAssignmentTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.year = timezone.localdate().year
+        schedule = make_recruitment_schedule(self.year)
+        self.start = make_aware(datetime(self.year, 1, 1)) + timedelta(days=402, hours=10)
+        self.later = self.start + timedelta(minutes=30)
+        InterviewSchedule.objects.create(
+            recruitment_schedule=schedule,
+            part=PartChoices.BACKEND,
+            start=self.start,
+            end=self.start + timedelta(hours=1),
+            interview_method=InterviewMethodChoices.OFFLINE,
+        )
+        kwargs = dict(status="FIRST_ACCEPTED", interview_available_times=[self.start, self.later])
+        self.manual = make_application("2500000", interview_at=self.start, **kwargs)
+        self.pending = make_application("2500001", **kwargs)
+        self.unmatched = make_application("2500002", interview_available_times=[self.start], status="FIRST_ACCEPTED")
+
+    def assign(self, **kwargs)->tuple[dict, mock.Mock]:
+        with mock.patch.object(ApplicationResultService, "refresh") as refresh:
+            with self.captureOnCommitCallbacks(execute=True):
+                assignments = InterviewAssignmentService(year=self.year).assign(**kwargs)
+        return assignments, refresh
+
+    def test_keeps_existing_assignments_and_writes_only_changes(self):
+        assignments, refresh = self.assign()
+        self.assertEqual(assignments, {"2500000": self.start, "2500001": self.later, "2500002": None})
+        self.manual.refresh_from_db()
+        self.pending.refresh_from_db()
+        self.assertEqual(self.manual.interview_at, self.start)
+        self.assertEqual(self.pending.interview_at, self.later)
+        refresh.assert_called_once_with(["2500001"])
+
+        # 다시 실행해도 바뀐 지원서가 없으면 저장·갱신하지 않음
+        _, refresh = self.assign()
+        refresh.assert_not_called()
+
+    def test_reassign(self):
+        # 기존 배정도 무시하므로 슬롯 2개에 3명 중 2명이 배정됨
+        before = {"2500000": self.start, "2500001": None, "2500002": None}
+        assignments, refresh = self.assign(reassign=True)
+        self.assertEqual(sum(interview_at is not None for interview_at in assignments.values()), 2)
+        changed = sorted(student_number for student_number, interview_at in assignments.items() if interview_at != before[student_number])
+        self.assertEqual(sorted(refresh.call_args.args[0]), changed)
+        for application in Application.objects.all():
+            self.assertEqual(application.interview_at, assignments[application.student_number])
+
+    def test_dry_run(self):
+        _, refresh = self.assign(dry_run=True)
+        self.pending.refresh_from_db()
+        self.assertIsNone(self.pending.interview_at)
+        refresh.assert_not_called()
+
+class ApplicationAttachmentSourceKeyTest(TestCase):
+    def setUp(self):
+        staging_root = TemporaryDirectory()
+        self.addCleanup(staging_root.cleanup)
+        settings_override = override_settings(ATTACHMENT_STAGING_ROOT=staging_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.service = ApplicationAttachmentService()
+        self.key = f"{get_attachment_upload_to('portfolios')}/{uuid4()}.pdf"
+
+    def test_signed_key_is_bound_to_student_number_and_field(self):
+        signed_key = self.service.sign_source_key(self.key, "2500000", "portfolios")
+        self.assertEqual(self.service.load_source_key(signed_key, "2500000", "portfolios"), self.key)
+
+        for student_number, field in [("2500001", "portfolios"), ("2500000", "completed_prerequisites")]:
+            with self.assertRaises(signing.BadSignature):
+                self.service.load_source_key(signed_key, student_number, field)
+        with self.assertRaises(signing.BadSignature):
+            self.service.load_source_key(self.key, "2500000", "portfolios")
+
+    def test_serializer_accepts_only_keys_issued_for_the_applicant(self):
+        serializer = ApplicationCreateSerializer()
+        signed_key = self.service.sign_source_key(self.key, "2500000", "portfolios")
+        with mock.patch.object(default_storage, "size", return_value=1024):
+            self.assertEqual(serializer._validate_attachment_keys("portfolios", [signed_key], "2500000"), [self.key])
+            with self.assertRaises(serializers.ValidationError):
+                serializer._validate_attachment_keys("portfolios", [signed_key], "2500001")
+            with self.assertRaises(serializers.ValidationError):
+                serializer._validate_attachment_keys("portfolios", [self.key], "2500000")
+
+    def test_verify_pdf_hashes_only_after_cheap_checks(self):
+        path = os.path.join(settings.ATTACHMENT_STAGING_ROOT, "truncated.pdf")
+        with open(path, "wb") as f:
+            f.write(b"%PDF-1.7\n" + b"0" * 1024)
+
+        with mock.patch("recruitments.services.get_file_sha256") as get_file_sha256:
+            with self.assertRaisesMessage(InvalidFileError, "PDF 파일의 끝부분이 잘렸습니다."):
+                self.service.verify_pdf(path)
+        get_file_sha256.assert_not_called()
+
+    def test_worker_downloads_and_verifies_source_file(self):
+        application = make_application("2500000")
+        attachment = self.service.stage_key("portfolio_1", self.key)
+        attachment.application = application
+        attachment.save()
+
+        def download_fileobj(name, fileobj):
+            fileobj.write(b"<html>not a pdf</html>")
+
+        # 워커 스레드용 DB 연결 정리는 테스트 트랜잭션의 연결을 닫으므로 생략
+        with (
+            mock.patch("recruitments.services.close_old_connections"),
+            mock.patch.object(default_storage, "download_fileobj", side_effect=download_fileobj, create=True) as download,
+            mock.patch.object(default_storage, "delete") as delete,
+        ):
+            self.assertEqual(self.service.upload(attachment.id), AttachmentStatusChoices.REJECTED)
+
+        download.assert_called_once_with(self.key, mock.ANY)
+        delete.assert_called_once_with(self.key)
+        attachment.refresh_from_db()
+        self.assertEqual(attachment.error, "파일의 내용이 확장자와 맞지 않습니다.")
+        self.assertFalse(os.path.exists(attachment.staged_path))
+        application.refresh_from_db()
+        self.assertFalse(application.portfolio_1)
+
+class ApplicationResultServiceTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.service = ApplicationResultService(year=timezone.localdate().year)
+
+    def test_lookup_before_publish_does_not_publish(self):
+        make_application("2500000")
+        self.assertIsNone(self.service.lookup("2500000", ApplicationResultService.FINAL_RESULT))
+        self.assertFalse(self.service.is_published())
+
+    def test_empty_publish_is_remembered(self):
+        self.assertEqual(self.service.publish(), 0)
+        self.assertTrue(self.service.is_published())
+        self.assertIsNone(self.service.lookup("2500000", ApplicationResultService.FINAL_RESULT))
+
+    def test_lookup_by_result_stage(self):
+        make_application("2500000", status=StatusChoices.FINAL_REJECTED)
+        self.assertEqual(self.service.publish(), 1)
+
+        first = self.service.lookup("2500000", ApplicationResultService.FIRST_RESULT)
+        self.assertEqual(first["name"], "지원자2500000")
+        self.assertEqual(first["status"], StatusChoices.FIRST_ACCEPTED)
+        self.assertIsNone(first["interview_location"])
+        self.assertNotIn("interview_method", first)
+
+        final = self.service.lookup("2500000", ApplicationResultService.FINAL_RESULT)
+        self.assertEqual(final["status"], StatusChoices.FINAL_REJECTED)
+        self.assertNotIn("interview_at", final)
+        self.assertIsNone(self.service.lookup("2599999", ApplicationResultService.FINAL_RESULT))
+
+    def test_refresh_updates_only_published_results(self):
+        make_application("2500000")
+        self.service.refresh(["2500000"])
+        self.assertFalse(self.service.is_published())
+
+        self.service.publish()
+        Application.objects.filter(pk="2500000").update(status=StatusChoices.FIRST_REJECTED)
+        self.assertEqual(self.service.lookup("2500000", ApplicationResultService.FIRST_RESULT)["status"], StatusChoices.FIRST_PENDING)
+        self.service.refresh(["2500000"])
+        self.assertEqual(self.service.lookup("2500000", ApplicationResultService.FIRST_RESULT)["status"], StatusChoices.FIRST_REJECTED)
+
+class ApplicationEncryptionTest(TestCase):
+    def test_fields_are_stored_encrypted_and_read_back(self):
+        make_application("2500000")
+        raw = Application.objects.filter(pk="2500000").values("name", "birthday", "personal_statement_1").get()
+        for value in raw.values():
+            self.assertTrue(value.startswith(f"{TOKEN_PREFIX}$"))
+
+        application = Application.objects.get(pk="2500000")
+        self.assertEqual(application.name, "지원자2500000")
+        self.assertEqual(application.birthday, date(2004, 1, 1))
+        self.assertEqual(application.personal_statement_1, "a")
+
+    def test_ciphertext_is_bound_to_its_field(self):
+        name_field = Application._meta.get_field("name")
+        ciphertext = name_field.encrypt("홍길동")
+        self.assertNotEqual(ciphertext, name_field.encrypt("홍길동"))
+        self.assertEqual(name_field.decrypt(ciphertext), "홍길동")
+        with self.assertRaises(DecryptionError):
+            Application._meta.get_field("phone_number").decrypt(ciphertext)
+
+        birthday_field = Application._meta.get_field("birthday")
+        self.assertEqual(birthday_field.decrypt(birthday_field.encrypt(date(2004, 2, 29))), date(2004, 2, 29))
+
+    def test_hash_application_code(self):
+        code_hash = hash_application_code("ABCDE12345")
+        self.assertEqual(len(code_hash), 64)
+        self.assertNotIn("ABCDE12345", code_hash)
+        self.assertEqual(hash_application_code(" abcde12345 "), code_hash)
+        self.assertNotEqual(hash_application_code("ABCDE12346"), code_hash)
+
+class KeysetPaginationTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        # 같은 created_at이 여러 개면 학번으로 순서를 정함
+        for student_number, minutes in [("2500003", 0), ("2500001", 0), ("2500002", 0), ("2500000", 1), ("2400000", 2)]:
+            make_application(student_number)
+            Application.objects.filter(pk=student_number).update(created_at=now + timedelta(minutes=minutes))
+
+    def paginate(self, url:str)->tuple[list[str], str|None]:
+        paginator = ApplicationListPagination()
+        page = paginator.paginate_queryset(Application.objects.all(), Request(APIRequestFactory().get(url)))
+        return [application.student_number for application in page], paginator.get_next_link()
+
+    def test_cursor_round_trip_and_ties(self):
+        student_numbers, url = list(), "/recruitments/?page_size=2"
+        pages = 0
+        while url:
+            page, url = self.paginate(url)
+            student_numbers += page
+            pages += 1
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(student_numbers, ["2500001", "2500002", "2500003", "2500000", "2400000"])
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(NotFound):
+            self.paginate("/recruitments/?cursor=invalid")
+
+class ApplicationExportServiceTest(TestCase):
+    def setUp(self):
+        self.service = ApplicationExportService(year=timezone.localdate().year, download_workers=2)
+        self.service.copy_chunk_size = 16
+        make_application("2500000", portfolio_1="portfolio/a.pdf")
+        make_application("2500001", portfolio_1="portfolio/missing.pdf")
+
+    def test_csv_streams_one_row_at_a_time(self):
+        chunks = list(self.service.iter_csv())
+        self.assertEqual(chunks[0], "\ufeff".encode())
+        self.assertEqual(len(chunks), 4) # BOM, 헤더, 지원서 2개
+
+        rows = list(csv.reader(b"".join(chunks).decode("utf-8-sig").splitlines()))
+        self.assertEqual([row[0] for row in rows[1:]], ["2500000", "2500001"])
+        self.assertEqual(rows[1][1], "지원자2500000")
+
+    def test_zip_streams_valid_archive(self):
+        def download_fileobj(name, fileobj):
+            if name == "portfolio/missing.pdf":
+                raise FileNotFoundError(name)
+            fileobj.write(b"%PDF-1.7 " + b"0" * 100)
+
+        with mock.patch.object(default_storage, "download_fileobj", side_effect=download_fileobj, create=True):
+            chunks = list(self.service.iter_zip())
+
+        self.assertGreater(len([chunk for chunk in chunks if chunk]), 3)
+        with zipfile.ZipFile(BytesIO(b"".join(chunks))) as archive:
+            self.assertIsNone(archive.testzip())
+            self.assertEqual(
+                archive.namelist(),
+                ["applications.csv", "2500000_지원자2500000/portfolio_1.pdf", "errors.txt"],
+            )
+            self.assertEqual(archive.read("2500000_지원자2500000/portfolio_1.pdf"), b"%PDF-1.7 " + b"0" * 100)
+            self.assertIn("portfolio/missing.pdf", archive.read("errors.txt").decode())
+
+class ApplicationStatusServiceTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.result_service = ApplicationResultService(year=timezone.localdate().year)
+        make_application("2500000")
+        make_application("2500001")
+        make_application("2500002", status=StatusChoices.FIRST_ACCEPTED)
+        self.result_service.publish()
+
+    def transition(self, targets:dict[str, list[str]], dry_run:bool=False)->dict[str, str]:
+        with self.captureOnCommitCallbacks(execute=True):
+            results = ApplicationStatusService().transition(targets, dry_run=dry_run)
+        return {result["student_number"]: result["result"] for result in results}
+
+    def get_status(self, student_number:str)->str:
+        return Application.objects.get(pk=student_number).status
+
+    def test_allowed_and_forbidden_transitions(self):
+        results = self.transition({
+            StatusChoices.FIRST_ACCEPTED: ["2500000", "2500002", "2599999", "2500001"],
+            StatusChoices.FINAL_ACCEPTED: ["2500001"],
+        })
+        self.assertEqual(results, {
+            "2500000": ApplicationStatusService.UPDATED,
+            "2500002": ApplicationStatusService.UNCHANGED,
+            "2599999": ApplicationStatusService.NOT_FOUND,
+            "2500001": ApplicationStatusService.DUPLICATED,
+        })
+        self.assertEqual(self.get_status("2500000"), StatusChoices.FIRST_ACCEPTED)
+        self.assertEqual(self.get_status("2500001"), StatusChoices.FIRST_PENDING)
+
+        # 1차 심사 중인 지원서는 바로 최종 합격으로 바꿀 수 없음
+        results = self.transition({StatusChoices.FINAL_ACCEPTED: ["2500001", "2500002"]})
+        self.assertEqual(results, {
+            "2500001": ApplicationStatusService.INVALID_TRANSITION,
+            "2500002": ApplicationStatusService.UPDATED,
+        })
+        self.assertEqual(self.get_status("2500001"), StatusChoices.FIRST_PENDING)
+        self.assertEqual(self.get_status("2500002"), StatusChoices.FINAL_ACCEPTED)
+
+    def test_refreshes_published_results(self):
+        self.transition({StatusChoices.FIRST_REJECTED: ["2500000"]})
+        result = self.result_service.lookup("2500000", ApplicationResultService.FIRST_RESULT)
+        self.assertEqual(result["status"], StatusChoices.FIRST_REJECTED)
+
+    def test_dry_run(self):
+        results = self.transition({StatusChoices.FIRST_REJECTED: ["2500000"]}, dry_run=True)
+        self.assertEqual(results, {"2500000": ApplicationStatusService.UPDATED})
+        self.assertEqual(self.get_status("2500000"), StatusChoices.FIRST_PENDING)
+        result = self.result_service.lookup("2500000", ApplicationResultService.FIRST_RESULT)
+        self.assertEqual(result["status"], StatusChoices.FIRST_PENDING)
+
+class InterviewSlotCapacityServiceTest(TestCase):
+    def setUp(self):
+        # 다른 테스트에서 프로세스 메모리에 남긴 면접 일정·한도 캐시도 비움
+        cache.clear()
+        caches["local"].clear()
+        self.year = timezone.localdate().year
+        schedule = make_recruitment_schedule(self.year)
+        self.start = make_aware(datetime(self.year, 1, 1)) + timedelta(days=402, hours=10)
+        self.later = self.start + timedelta(minutes=30)
+        InterviewSchedule.objects.create(
+            recruitment_schedule=schedule,
+            part=PartChoices.BACKEND,
+            start=self.start,
+            end=self.start + timedelta(hours=1),
+            interview_method=InterviewMethodChoices.OFFLINE,
+            slot_capacity=1,
+        )
+        self.service = InterviewSlotCapacityService(year=self.year)
+
+    def get_counts(self)->dict[datetime, int]:
+        return {slot["start"]: slot["count"] for slot in self.service.get_capacity()}
+
+    def test_reserve_when_full_and_release(self):
+        self.assertEqual(self.service.reserve([self.start]), [])
+        # 자리가 없는 슬롯이 하나라도 있으면 다른 슬롯도 늘리지 않음
+        self.assertEqual(self.service.reserve([self.start, self.later]), [self.start])
+        self.assertEqual(self.get_counts(), {self.start: 1, self.later: 0})
+
+        self.service.release([self.start])
+        self.assertEqual(self.service.reserve([self.start, self.later]), [])
+        self.assertEqual(self.get_counts(), {self.start: 1, self.later: 1})
+        remaining = {slot["start"]: slot["remaining"] for slot in self.service.get_capacity()}
+        self.assertEqual(remaining, {self.start: 0, self.later: 0})
+
+    def test_rebuild_from_database(self):
+        self.service.reserve([self.start])
+        make_application("2500000", interview_available_times=[self.later])
+        make_application("2500001", interview_available_times=[self.start, self.later])
+
+        self.assertEqual(self.service.rebuild(), 2)
+        self.assertEqual(self.get_counts(), {self.start: 1, self.later: 2})
+
+class RecruitmentPhaseServiceTest(TestCase):
+    year = 2026
+
+    def setUp(self):
+        cache.clear()
+        caches["local"].clear()
+        self.service = RecruitmentPhaseService(year=self.year)
+
+    def at(self, month:int, day:int, hour:int=0, minute:int=0, second:int=0)->datetime:
+        return make_aware(datetime(self.year, month, day, hour, minute, second))
+
+    def make_schedule(self)->RecruitmentSchedule:
+        # 1차 발표 기간과 면접 기간이 겹침 (3월 15~16일)
+        return RecruitmentSchedule(
+            year=self.year,
+            application_start=self.at(3, 1),
+            application_end=self.at(3, 10, 23, 59, 59),
+            first_result_start=self.at(3, 14, 10),
+            first_result_end=self.at(3, 16, 23, 59),
+            interview_start=date(self.year, 3, 15),
+            interview_end=date(self.year, 3, 17),
+            final_result_start=self.at(3, 20, 10),
+            final_result_end=self.at(3, 22, 23, 59),
+        )
+
+    def get_phase(self, current_time:datetime)->str:
+        return self.service.build(self.make_schedule(), current_time).phase
+
+    def test_timeline(self):
+        resolution = RecruitmentPhaseService.RESOLUTION
+        self.assertEqual(RecruitmentPhaseService.build_timeline(self.make_schedule()), [
+            (None, RecruitmentPhaseChoices.BEFORE_APPLICATION),
+            (self.at(3, 1), RecruitmentPhaseChoices.APPLICATION),
+            (self.at(3, 10, 23, 59, 59) + resolution, RecruitmentPhaseChoices.SCREENING),
+            (self.at(3, 14, 10), RecruitmentPhaseChoices.FIRST_RESULT),
+            (self.at(3, 16, 23, 59) + resolution, RecruitmentPhaseChoices.INTERVIEW),
+            (self.at(3, 18), RecruitmentPhaseChoices.SCREENING),
+            (self.at(3, 20, 10), RecruitmentPhaseChoices.FINAL_RESULT),
+            (self.at(3, 22, 23, 59) + resolution, RecruitmentPhaseChoices.CLOSED),
+        ])
+
+    def test_boundaries(self):
+        application_end = self.at(3, 10, 23, 59, 59)
+        self.assertEqual(self.get_phase(self.at(3, 1) - RecruitmentPhaseService.RESOLUTION), RecruitmentPhaseChoices.BEFORE_APPLICATION)
+        self.assertEqual(self.get_phase(self.at(3, 1)), RecruitmentPhaseChoices.APPLICATION)
+        # 끝 시각까지 기간에 포함
+        self.assertEqual(self.get_phase(application_end), RecruitmentPhaseChoices.APPLICATION)
+        self.assertEqual(self.get_phase(application_end + RecruitmentPhaseService.RESOLUTION), RecruitmentPhaseChoices.SCREENING)
+        # 발표 기간과 면접 기간이 겹치면 발표
+        self.assertEqual(self.get_phase(self.at(3, 15, 12)), RecruitmentPhaseChoices.FIRST_RESULT)
+        self.assertEqual(self.get_phase(self.at(3, 17, 23, 59, 59)), RecruitmentPhaseChoices.INTERVIEW)
+        self.assertEqual(self.get_phase(self.at(3, 18)), RecruitmentPhaseChoices.SCREENING)
+
+        phase = self.service.build(self.make_schedule(), self.at(4, 1))
+        self.assertEqual(phase.phase, RecruitmentPhaseChoices.CLOSED)
+        self.assertIsNone(phase.end)
+        self.assertIsNone(phase.next_phase)
+
+    def test_not_scheduled(self):
+        phase = self.service.build(None, self.at(3, 1))
+        self.assertEqual(phase.phase, RecruitmentPhaseChoices.NOT_SCHEDULED)
+        self.assertEqual((phase.start, phase.end), (None, None))
+
+    def test_current_phase_recomputed_after_end(self):
+        self.make_schedule().save()
+        phase = self.service.get_current(self.at(3, 5))
+        self.assertEqual((phase.phase, phase.next_phase), (RecruitmentPhaseChoices.APPLICATION, RecruitmentPhaseChoices.SCREENING))
+        self.assertEqual(phase.end, self.at(3, 10, 23, 59, 59) + RecruitmentPhaseService.RESOLUTION)
+
+        # 캐시에 남아 있어도 끝 시각이 지나면 다시 계산
+        with self.assertNumQueries(0):
+            self.assertEqual(self.service.get_current(self.at(3, 6)), phase)
+        self.assertEqual(self.service.get_current(phase.end).phase, RecruitmentPhaseChoices.SCREENING)
+
+class PublicScheduleETagTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        caches["local"].clear()
+        self.year = timezone.localdate().year
+        self.schedule = make_recruitment_schedule(self.year)
+        start = make_aware(datetime(self.year, 1, 1)) + timedelta(days=402, hours=10)
+        InterviewSchedule.objects.create(
+            recruitment_schedule=self.schedule,
+            part=PartChoices.BACKEND,
+            start=start,
+            end=start + timedelta(hours=1),
+            interview_method=InterviewMethodChoices.OFFLINE,
+        )
+
+    def get(self, view, etag:str|None=None):
+        # 미들웨어(요청 로그)를 거치지 않도록 뷰를 직접 호출
+        headers = {"If-None-Match": etag} if etag else {}
+        return view.as_view()(APIRequestFactory().get("/", {"year": self.year}, headers=headers))
+
+    def assert_not_modified_until_schedule_changes(self, view):
+        response = self.get(view)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        response = self.get(view, etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertFalse(response.content)
+
+        # 일정을 저장하면 커밋 후 버전이 올라가 이전 ETag로는 304를 받지 않음
+        self.schedule.application_end += timedelta(days=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.schedule.save()
+
+        response = self.get(view, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(self.get(view, response["ETag"]).status_code, 304)
+
+    def test_schedule(self):
+        self.assert_not_modified_until_schedule_changes(RecruitmentScheduleView)
+
+    def test_interview_slots(self):
+        self.assert_not_modified_until_schedule_changes(InterviewSlotView)
+
+class SlotDemandServiceTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        caches["local"].clear()
+        self.year = timezone.localdate().year
+        self.start = make_aware(datetime(self.year, 1, 1)) + timedelta(days=402, hours=10)
+        self.later = self.start + timedelta(minutes=30)
+        make_application("2500000", interview_available_times=[self.later, self.start])
+        make_application("2500001", interview_available_times=[self.start])
+        make_application("2500002", PartChoices.FRONTEND, interview_available_times=[self.start], status=StatusChoices.FIRST_ACCEPTED)
+        make_application("2500003")
+
+    def test_counts_per_slot_and_part(self):
+        self.assertEqual(SlotDemandService(year=self.year).get_demand(), [
+            {"start": self.start, "counts": {PartChoices.BACKEND: 2, PartChoices.FRONTEND: 1}, "total": 3},
+            {"start": self.later, "counts": {PartChoices.BACKEND: 1}, "total": 1},
+        ])
+        self.assertEqual(SlotDemandService(year=self.year, status=StatusChoices.FIRST_ACCEPTED).get_demand(), [
+            {"start": self.start, "counts": {PartChoices.FRONTEND: 1}, "total": 1},
+        ])
+        self.assertEqual(SlotDemandService(year=self.year - 1).get_demand(), [])
+
+    def test_cached_until_schedule_version_changes(self):
+        service = SlotDemandService(year=self.year)
+        service.get_demand()
+        make_application("2500004", interview_available_times=[self.later])
+        with self.assertNumQueries(0):
+            self.assertEqual(service.get_demand()[1]["total"], 1)
+
+        RecruitmentScheduleService(year=self.year).invalidate()
+        self.assertEqual(service.get_demand()[1]["total"], 2)
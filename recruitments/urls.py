@@ -1,8 +1,20 @@
+from django.conf import settings
 from django.urls import path
 from .views import *
 
 app_name = 'recruitments'
 
 urlpatterns = [
-    path("application/", ApplicationView.as_view())
+    path("phase/", RecruitmentPhaseView.as_view()),
+    path("schedule/", RecruitmentScheduleView.as_view()),
+    path("interview/slots/", InterviewSlotView.as_view()),
+    path("application/", (AsyncApplicationView if settings.APPLICATION_VIEW_ASYNC else ApplicationView).as_view()),
+    path("application/upload/", ApplicationUploadView.as_view()),
+    path("application/result/", ApplicationResultView.as_view()),
+    path("application/status/", ApplicationStatusView.as_view()),
+    path("application/export/", ApplicationExportView.as_view()),
+    path("interview/demand/", SlotDemandView.as_view()),
+    path("interview/capacity/", InterviewSlotCapacityView.as_view()),
+    path("reviews/", ReviewView.as_view()),
+    path("reviews/ranking/", ReviewRankingView.as_view()),
 ]
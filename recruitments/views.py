@@ -1,40 +1,180 @@
-from django.http import HttpRequest
+import json
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpRequest, JsonResponse, StreamingHttpResponse
 from django.utils import timezone
+from django.utils.timezone import localtime
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
-from rest_framework.exceptions import APIException, ValidationError, PermissionDenied
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.exceptions import APIException, ValidationError, PermissionDenied, NotFound
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from .models import RecruitmentSchedule, InterviewSchedule
-from .serializers import ApplicationCreateSerializer
+from utils.choices import RecruitmentPhaseChoices
+from utils.constants import INTERVIEW_SLOT_CAPACITY_MAX_AGE, PUBLIC_SCHEDULE_MAX_AGE, RECRUITMENT_PHASE_MAX_AGE
+from utils.decorators.view import idempotent, rate_limit
+from utils.helpers import get_cacheable_response
+from utils.paginations import KeysetPagination
+from utils.upload_handlers import FileUploadRuleHandler
+from .models import Application
+from .serializers import get_application_file_upload_rules, ApplicationCreateSerializer, ApplicationUploadSerializer, ApplicationListQuerySerializer, ApplicationListSerializer, ApplicationResultSerializer, ApplicationStatusSerializer, SlotDemandQuerySerializer, PublicScheduleQuerySerializer, ApplicationExportQuerySerializer, ReviewSerializer, ReviewRankingQuerySerializer
+from .services import RecruitmentPhase, RecruitmentPhaseService, RecruitmentScheduleService, ApplicationResultService, ApplicationStatusService, SlotDemandService, InterviewSlotCapacityService, ApplicationExportService, ReviewService, SubmittedStudentNumberService
+
+def get_application_period_service()->RecruitmentScheduleService:
+    """
+    서류 접수 기간이면 올해의 모집 일정 서비스를 반환합니다.
+    """
+    current_time = timezone.now()
+    year = timezone.localdate(current_time).year
+    check_application_period(RecruitmentPhaseService(year=year).get_current(current_time))
+    return RecruitmentScheduleService(year=year)
+
+async def aget_application_period_service()->RecruitmentScheduleService:
+    """
+    get_application_period_service의 비동기 버전
+    """
+    current_time = timezone.now()
+    year = timezone.localdate(current_time).year
+    check_application_period(await RecruitmentPhaseService(year=year).aget_current(current_time))
+    return RecruitmentScheduleService(year=year)
+
+def check_application_period(phase:RecruitmentPhase):
+    if phase.phase == RecruitmentPhaseChoices.NOT_SCHEDULED:
+        raise APIException(detail="모집 일정이 준비되지 않았습니다.")
+    if phase.phase != RecruitmentPhaseChoices.APPLICATION:
+        raise PermissionDenied(detail="서류 접수 기간이 아닙니다.")
+
+class RecruitmentPhaseView(APIView):
+    """
+    현재 모집 단계 조회 (공개)
+
+    프론트엔드가 계속 조회하므로 데이터베이스 없이 캐시된 단계로 응답하고,
+    브라우저·CDN이 다음 단계가 시작될 때까지(최대 RECRUITMENT_PHASE_MAX_AGE초) 재사용하도록 합니다.
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = [] # 인증(사용자 조회)을 하지 않음
+
+    def get(self, request:HttpRequest, format=None):
+        current_time = timezone.now()
+        phase = RecruitmentPhaseService(year=timezone.localdate(current_time).year).get_current(current_time)
+
+        remaining = phase.get_remaining_seconds(current_time)
+        max_age = RECRUITMENT_PHASE_MAX_AGE if remaining is None else min(RECRUITMENT_PHASE_MAX_AGE, remaining)
+        return get_cacheable_response(request, phase.as_dict(), phase.etag, max_age)
+
+class RecruitmentScheduleView(APIView):
+    """
+    모집 일정 조회 (공개)
+
+    ETag는 일정 버전(모집·면접 일정을 저장할 때마다 증가)이므로, 일정이 바뀌지 않았으면 304로 응답합니다.
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request:HttpRequest, format=None):
+        serializer = PublicScheduleQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            raise ValidationError(detail=serializer.errors)
+
+        year = serializer.validated_data.get("year", timezone.localdate().year)
+        data, etag = RecruitmentScheduleService(year=year).get_public_schedule()
+        if data is None:
+            raise NotFound(detail="모집 일정이 준비되지 않았습니다.")
+        return get_cacheable_response(request, data, etag, PUBLIC_SCHEDULE_MAX_AGE)
+
+class InterviewSlotView(APIView):
+    """
+    지원서에서 선택할 수 있는 면접 슬롯 목록 조회 (공개, ETag는 RecruitmentScheduleView와 같은 방식)
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request:HttpRequest, format=None):
+        serializer = PublicScheduleQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            raise ValidationError(detail=serializer.errors)
+
+        year = serializer.validated_data.get("year", timezone.localdate().year)
+        data, etag = RecruitmentScheduleService(year=year).get_public_interview_slots()
+        if data is None:
+            raise NotFound(detail="모집 일정이 준비되지 않았습니다.")
+        return get_cacheable_response(request, data, etag, PUBLIC_SCHEDULE_MAX_AGE)
+
+# 지원서 제출 요청의 학번 헤더 (본문을 파싱하기 전에 중복 제출을 거르고, Idempotency-Key를 요청자에 묶는 데 사용)
+STUDENT_NUMBER_HEADER = "Student-Number"
+
+def check_submitted_student_number(request:HttpRequest):
+    """
+    Student-Number 헤더의 학번으로 이미 지원서를 제출했으면, 본문을 파싱하기 전에 거절합니다.
+    """
+    student_number = request.headers.get(STUDENT_NUMBER_HEADER)
+    if student_number and SubmittedStudentNumberService(year=timezone.localdate().year).contains(student_number):
+        raise ValidationError(detail={"student_number": ["이미 지원서를 제출한 학번입니다."]})
+
+class ApplicationListPagination(KeysetPagination):
+    ordering = ("created_at", "student_number")
 
 class ApplicationView(APIView):
     def get_permissions(self):
         if self.request.method == 'POST':
             return [AllowAny()]
         else:
-            return [IsAuthenticated()]
+            return [IsAdminUser()]
+
+    def get(self, request:HttpRequest, format=None):
+        query_serializer = ApplicationListQuerySerializer(data=request.query_params)
+        if not query_serializer.is_valid():
+            raise ValidationError(detail=query_serializer.errors)
+        filters:dict = query_serializer.validated_data
+
+        if "year" in filters:
+            filters["created_at__year"] = filters.pop("year")
+        if "available_at" in filters:
+            filters["interview_available_times__contains"] = [filters.pop("available_at")]
+
+        queryset = (
+            Application.objects
+            .filter(**filters)
+            .only(*ApplicationListSerializer.Meta.fields)
+        )
 
+        paginator = ApplicationListPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = ApplicationListSerializer(page, many=True)
+
+        return paginator.get_paginated_response(serializer.data)
+
+    @rate_limit(
+        rate=settings.APPLICATION_RATE_LIMIT,
+        concurrency_per_ip=settings.APPLICATION_CONCURRENCY_PER_IP,
+        concurrency=settings.APPLICATION_CONCURRENCY,
+    )
+    @idempotent(fingerprint_headers=(STUDENT_NUMBER_HEADER,))
     def post(self, request:HttpRequest, format=None):
         # 서류 접수 기간 검증
-        current_time = timezone.now()
-        try:
-            recruitment_schedule = RecruitmentSchedule.objects.get(year=current_time.year)
-        except:
-            raise APIException(detail="모집 일정이 준비되지 않았습니다.")
+        recruitment_schedule_service = get_application_period_service()
+
+        # 중복 제출 검증 (본문 파싱 전)
+        check_submitted_student_number(request)
 
-        if not recruitment_schedule.application_start <= current_time <= recruitment_schedule.application_end:
-            raise PermissionDenied(detail="서류 접수 기간이 아닙니다.")
+        # 첨부 파일은 본문을 받는 동안 검사하고, 규칙에 어긋나면 나머지 본문을 읽지 않음
+        upload_rule_handler = FileUploadRuleHandler(request, get_application_file_upload_rules())
+        request.upload_handlers.insert(0, upload_rule_handler)
+        data = request.data
+        if upload_rule_handler.errors:
+            raise ValidationError(detail=upload_rule_handler.errors)
 
         # 요청값 검증
-        interview_schedules = list(
-            InterviewSchedule.objects
-            .filter(recruitment_schedule__year=current_time.year)
-            .order_by("start")
-        )
+        interview_interval_index = recruitment_schedule_service.get_interview_interval_index()
         serializer = ApplicationCreateSerializer(
-            data=request.data,
-            context={"interview_schedules": interview_schedules}
+            data=data,
+            context={
+                "interview_interval_index": interview_interval_index,
+                "student_number": request.headers.get(STUDENT_NUMBER_HEADER),
+            }
         )
         if not serializer.is_valid():
             raise ValidationError(detail=serializer.errors)
@@ -45,3 +185,268 @@ class ApplicationView(APIView):
             status=status.HTTP_201_CREATED,
             data={"application_code":application_code},
         )
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncApplicationView(View):
+    """
+    ApplicationView의 비동기 버전 (ASGI 서버에서 APPLICATION_VIEW_ASYNC=True일 때 사용)
+
+    지원서 제출(POST)의 대기 시간은 대부분 Redis, 데이터베이스 I/O이므로 이벤트 루프에서 처리합니다.
+    모집 일정은 비동기 캐시와 비동기 ORM으로 조회하고, 동기 코드만 있는 단계
+    (본문 파싱, 시리얼라이저 검증과 트랜잭션 저장)는 요청별 스레드에서 실행합니다.
+    첨부 파일의 S3 업로드는 ApplicationView와 같이 업로드 워커가 처리합니다.
+    관리자용 목록 조회(GET)는 ApplicationView에 위임합니다.
+    """
+    async def get(self, request:HttpRequest, *args, **kwargs):
+        return await sync_to_async(ApplicationView.as_view())(request, *args, **kwargs)
+
+    @rate_limit(
+        rate=settings.APPLICATION_RATE_LIMIT,
+        concurrency_per_ip=settings.APPLICATION_CONCURRENCY_PER_IP,
+        concurrency=settings.APPLICATION_CONCURRENCY,
+    )
+    @idempotent(fingerprint_headers=(STUDENT_NUMBER_HEADER,))
+    async def post(self, request:HttpRequest, *args, **kwargs):
+        try:
+            # 서류 접수 기간 검증
+            recruitment_schedule_service = await aget_application_period_service()
+
+            # 중복 제출 검증 (본문 파싱 전)
+            await sync_to_async(check_submitted_student_number, thread_sensitive=False)(request)
+            interview_interval_index = await recruitment_schedule_service.aget_interview_interval_index()
+
+            application_code = await sync_to_async(self.create)(request, interview_interval_index)
+        except APIException as e:
+            data = e.detail if isinstance(e.detail, (list, dict)) else {"detail": e.detail}
+            return JsonResponse(data, status=e.status_code, safe=False, json_dumps_params={"ensure_ascii": False})
+
+        return JsonResponse(
+            status=status.HTTP_201_CREATED,
+            data={"application_code":application_code},
+        )
+
+    def create(self, request:HttpRequest, interview_interval_index)->str:
+        # 첨부 파일은 본문을 파싱하는 동안 검사하고, 규칙에 어긋나면 나머지 본문을 파싱하지 않음
+        upload_rule_handler = FileUploadRuleHandler(request, get_application_file_upload_rules())
+        request.upload_handlers.insert(0, upload_rule_handler)
+        if request.content_type == "application/json":
+            try:
+                data = json.loads(request.body)
+            except ValueError:
+                raise ValidationError(detail="JSON 형식이 올바르지 않습니다.")
+        else:
+            data = request.POST.copy()
+            data.update(request.FILES)
+        if upload_rule_handler.errors:
+            raise ValidationError(detail=upload_rule_handler.errors)
+
+        # 요청값 검증
+        serializer = ApplicationCreateSerializer(
+            data=data,
+            context={
+                "interview_interval_index": interview_interval_index,
+                "student_number": request.headers.get(STUDENT_NUMBER_HEADER),
+            }
+        )
+        if not serializer.is_valid():
+            raise ValidationError(detail=serializer.errors)
+
+        return serializer.save()
+
+class ApplicationUploadView(APIView):
+    """
+    지원서 첨부 파일을 S3에 직접 업로드하기 위한 presigned POST 정책 발급
+    """
+    permission_classes = [AllowAny]
+
+    def post(self, request:HttpRequest, format=None):
+        # 서류 접수 기간 검증
+        get_application_period_service()
+
+        # 중복 제출 검증 (발급한 키는 Student-Number 헤더의 학번에 묶임)
+        check_submitted_student_number(request)
+
+        serializer = ApplicationUploadSerializer(
+            data=request.data,
+            context={"student_number": request.headers.get(STUDENT_NUMBER_HEADER)},
+        )
+        if not serializer.is_valid():
+            raise ValidationError(detail=serializer.errors)
+
+        presigned_post = serializer.save()
+
+        return Response(
+            status=status.HTTP_201_CREATED,
+            data=presigned_post,
+        )
+
+class ApplicationResultView(APIView):
+    """
+    합격자 조회 (발표 기간에만, Redis에 발표된 결과에서 조회)
+    """
+    permission_classes = [AllowAny]
+
+    def post(self, request:HttpRequest, format=None):
+        # 발표 기간 검증
+        current_time = timezone.now()
+        year = timezone.localdate(current_time).year
+        phase = RecruitmentPhaseService(year=year).get_current(current_time)
+        if phase.phase == RecruitmentPhaseChoices.NOT_SCHEDULED:
+            raise APIException(detail="모집 일정이 준비되지 않았습니다.")
+
+        application_result_service = ApplicationResultService(year=year)
+        result_stage = application_result_service.get_result_stage(phase)
+        if result_stage is None:
+            raise PermissionDenied(detail="결과 발표 기간이 아닙니다.")
+
+        # 요청값 검증
+        serializer = ApplicationResultSerializer(data=request.data)
+        if not serializer.is_valid():
+            raise ValidationError(detail=serializer.errors)
+
+        result = application_result_service.lookup(serializer.validated_data["application_code"], result_stage)
+        if result is None:
+            # 조회 실패 시에만 발표 여부를 확인 (발표는 publish_results 명령어로만 함)
+            if not application_result_service.is_published():
+                raise NotFound(detail="결과가 아직 발표되지 않았습니다.")
+            raise NotFound(detail="지원 내역을 찾을 수 없습니다.")
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=result,
+        )
+
+class ApplicationStatusView(APIView):
+    """
+    지원서 합불 상태 일괄 변경
+    """
+    permission_classes = [IsAdminUser]
+
+    def post(self, request:HttpRequest, format=None):
+        serializer = ApplicationStatusSerializer(data=request.data)
+        if not serializer.is_valid():
+            raise ValidationError(detail=serializer.errors)
+
+        results = ApplicationStatusService().transition(
+            targets=serializer.validated_data["transitions"],
+            dry_run=serializer.validated_data["dry_run"],
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data={
+                "updated": sum(result["result"] == ApplicationStatusService.UPDATED for result in results),
+                "results": results,
+            },
+        )
+
+class SlotDemandView(APIView):
+    """
+    면접 슬롯별·파트별 선택 인원 집계 (면접관 배치용)
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request:HttpRequest, format=None):
+        serializer = SlotDemandQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            raise ValidationError(detail=serializer.errors)
+
+        demand = SlotDemandService(
+            year=serializer.validated_data.get("year", timezone.localdate().year),
+            status=serializer.validated_data.get("status"),
+        ).get_demand()
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data={"slots": demand},
+        )
+
+class InterviewSlotCapacityView(APIView):
+    """
+    면접 슬롯별 선택 인원과 남은 자리 조회 (공개, Redis 카운터에서만 조회)
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request:HttpRequest, format=None):
+        serializer = PublicScheduleQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            raise ValidationError(detail=serializer.errors)
+
+        capacity = InterviewSlotCapacityService(year=serializer.validated_data.get("year", timezone.localdate().year)).get_capacity()
+
+        response = Response(
+            status=status.HTTP_200_OK,
+            data={"slots": capacity},
+        )
+        patch_cache_control(response, public=True, max_age=INTERVIEW_SLOT_CAPACITY_MAX_AGE)
+        return response
+
+class ApplicationExportView(APIView):
+    """
+    지원서 일괄 내보내기 (CSV 또는 첨부 파일을 포함한 ZIP)
+
+    응답을 스트리밍하므로 지원서 수와 관계없이 메모리를 일정하게 사용합니다.
+    지원서가 많아 응답이 오래 걸리면 export_applications 명령어를 사용하세요.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request:HttpRequest, format=None):
+        serializer = ApplicationExportQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            raise ValidationError(detail=serializer.errors)
+
+        year = serializer.validated_data.get("year", timezone.localdate().year)
+        export_service = ApplicationExportService(year=year)
+
+        if serializer.validated_data["mode"] == ApplicationExportQuerySerializer.ZIP:
+            response = StreamingHttpResponse(export_service.iter_zip(), content_type="application/zip")
+            response["Content-Disposition"] = f'attachment; filename="applications_{year}.zip"'
+        else:
+            response = StreamingHttpResponse(export_service.iter_csv(), content_type="text/csv; charset=utf-8")
+            response["Content-Disposition"] = f'attachment; filename="applications_{year}.csv"'
+        return response
+
+class ReviewView(APIView):
+    """
+    서류 평가 추가·수정 (평가자마다 지원서 하나에 평가 하나)
+    """
+    permission_classes = [IsAdminUser]
+
+    def post(self, request:HttpRequest, format=None):
+        serializer = ReviewSerializer(data=request.data)
+        if not serializer.is_valid():
+            raise ValidationError(detail=serializer.errors)
+
+        application = serializer.validated_data["application"]
+        review = ReviewService(year=localtime(application.created_at).year).submit(
+            reviewer=request.user,
+            application=application,
+            scores=serializer.validated_data["scores"],
+            comment=serializer.validated_data.get("comment", ""),
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=ReviewSerializer(review).data,
+        )
+
+class ReviewRankingView(APIView):
+    """
+    파트별 서류 평가 순위 (집계 테이블만 조회)
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request:HttpRequest, format=None):
+        serializer = ReviewRankingQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            raise ValidationError(detail=serializer.errors)
+
+        ranking = ReviewService(year=serializer.validated_data.get("year", timezone.localdate().year)).get_ranking(
+            part=serializer.validated_data.get("part"),
+        )
+
+        return Response(
+            status=status.HTTP_200_OK,
+            data=ranking,
+        )
@@ -1,5 +1,11 @@
-from django.core.cache import cache
+import time
+from typing import Iterable
+from uuid import uuid4
+from django.core.cache import cache, caches
 from .constants import CacheKey
+from .metrics import record_cache
+
+_MISSING = object()
 
 class AbstractCache:
     def __init__(self, key):
@@ -9,20 +15,368 @@ class AbstractCache:
         cache.set(self.key, value, timeout, version)
 
     def get(self, default=None, version:int|None=None):
-        return cache.get(self.key, default, version)
+        value = cache.get(self.key, _MISSING, version)
+        record_cache(value is not _MISSING)
+        return default if value is _MISSING else value
+
+    async def aset(self, value, timeout:int|None=None, version:int|None=None):
+        await cache.aset(self.key, value, timeout, version)
+
+    async def aget(self, default=None, version:int|None=None):
+        value = await cache.aget(self.key, _MISSING, version)
+        record_cache(value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def add(self, value, timeout:int|None=None, version:int|None=None)->bool:
+        """
+        키가 없을 때만 저장하고, 저장했는지 여부를 반환합니다.
+        """
+        return cache.add(self.key, value, timeout, version)
+
+    def delete(self, version:int|None=None):
+        cache.delete(self.key, version)
+
+    def incr(self, delta:int=1, version:int|None=None)->int:
+        """
+        값이 없으면 0에서 시작해 delta만큼 증가시킵니다. (만료 없음)
+        """
+        try:
+            return cache.incr(self.key, delta, version)
+        except ValueError:
+            cache.add(self.key, 0, None, version)
+            return cache.incr(self.key, delta, version)
+
+class AbstractTwoTierCache(AbstractCache):
+    """
+    프로세스 메모리 캐시(LRU, 짧은 TTL)를 Redis 캐시 앞에 둔 2단계 캐시
+
+    로컬 캐시는 프로세스마다 따로 존재하므로, 다른 프로세스에서 삭제한 값은
+    최대 local_timeout초 동안 남아 있을 수 있습니다.
+    """
+    local_timeout:int = 5
+
+    def set(self, value, timeout:int|None=None, version:int|None=None):
+        super().set(value, timeout, version)
+        caches["local"].set(self.key, value, self.local_timeout, version)
+
+    def get(self, default=None, version:int|None=None):
+        value = caches["local"].get(self.key, _MISSING, version)
+        if value is not _MISSING:
+            record_cache(True)
+            return value
+
+        value = super().get(_MISSING, version)
+        if value is _MISSING:
+            return default
+
+        caches["local"].set(self.key, value, self.local_timeout, version)
+        return value
+
+    def get_or_set(self, default_func, timeout:int|None=None, version:int|None=None):
+        """
+        캐시에 값이 없으면 default_func()의 결과를 두 계층 모두에 저장한 뒤 반환합니다.
+        """
+        value = self.get(_MISSING, version)
+        if value is _MISSING:
+            value = default_func()
+            self.set(value, timeout, version)
+        return value
+
+    async def aset(self, value, timeout:int|None=None, version:int|None=None):
+        await super().aset(value, timeout, version)
+        caches["local"].set(self.key, value, self.local_timeout, version)
+
+    async def aget(self, default=None, version:int|None=None):
+        # 로컬 캐시는 프로세스 메모리이므로 바로 조회 (이벤트 루프를 막지 않음)
+        value = caches["local"].get(self.key, _MISSING, version)
+        if value is not _MISSING:
+            record_cache(True)
+            return value
+
+        value = await super().aget(_MISSING, version)
+        if value is _MISSING:
+            return default
+
+        caches["local"].set(self.key, value, self.local_timeout, version)
+        return value
+
+    async def aget_or_set(self, default_func, timeout:int|None=None, version:int|None=None):
+        """
+        get_or_set의 비동기 버전 (default_func는 코루틴 함수)
+        """
+        value = await self.aget(_MISSING, version)
+        if value is _MISSING:
+            value = await default_func()
+            await self.aset(value, timeout, version)
+        return value
+
+    def delete(self, version:int|None=None):
+        super().delete(version)
+        caches["local"].delete(self.key, version)
+
+class AbstractRedisHash(AbstractCache):
+    """
+    Redis 해시 (field -> value)
+
+    값은 django-redis의 직렬화 방식으로 저장되며, 키 전체는 AbstractCache.get/set/delete로도 다룰 수 있습니다.
+    """
+    def hget(self, field:str, default=None):
+        value = cache.client.get_client(write=False).hget(cache.make_key(self.key), field)
+        record_cache(value is not None)
+        if value is None:
+            return default
+        return cache.client.decode(value)
+
+    def hset(self, field:str, value):
+        cache.client.get_client(write=True).hset(cache.make_key(self.key), field, cache.client.encode(value))
+
+    def hset_many(self, mapping:dict):
+        if not mapping:
+            return
+        cache.client.get_client(write=True).hset(
+            cache.make_key(self.key),
+            mapping={field: cache.client.encode(value) for field, value in mapping.items()},
+        )
+
+    def hdel(self, *fields:str):
+        if not fields:
+            return
+        cache.client.get_client(write=True).hdel(cache.make_key(self.key), *fields)
+
+    def hlen(self)->int:
+        return cache.client.get_client(write=False).hlen(cache.make_key(self.key))
+
+    def exists(self)->bool:
+        return bool(cache.client.get_client(write=False).exists(cache.make_key(self.key)))
+
+    def replace(self, mapping:dict, batch_size:int=1000):
+        """
+        임시 키에 해시 전체를 만든 뒤 RENAME으로 한 번에 교체합니다.
+        교체 전까지는 기존 해시가 그대로 조회됩니다.
+        """
+        client = cache.client.get_client(write=True)
+        key = cache.make_key(self.key)
+        temp_key = f"{key}:building"
+
+        client.delete(temp_key)
+        items = list(mapping.items())
+        for i in range(0, len(items), batch_size):
+            client.hset(
+                temp_key,
+                mapping={field: cache.client.encode(value) for field, value in items[i:i+batch_size]},
+            )
+
+        if items:
+            client.rename(temp_key, key)
+        else:
+            client.delete(key)
 
 class AbstractRedisSet:
     def __init__(self, key):
         self.key = key
 
-    def add(self, value):
-        cache.sadd(self.key, value)
+    def add(self, *values)->int:
+        """
+        새로 추가된 값의 수를 반환합니다.
+        """
+        return cache.sadd(self.key, *values)
 
-    def remove(self, value):
-        cache.srem(self.key, value)
+    def remove(self, *values)->int:
+        return cache.srem(self.key, *values)
 
     def count(self)->int:
         return cache.scard(self.key)
 
     def contains(self, value)->bool:
         return bool(cache.sismember(self.key, value))
+
+    def delete(self):
+        cache.delete(self.key)
+
+    def replace(self, values:Iterable):
+        """
+        임시 키에 집합 전체를 만든 뒤 RENAME으로 한 번에 교체합니다.
+        """
+        values = list(values)
+        temp_key = f"{self.key}:building"
+        cache.delete(temp_key)
+        if values:
+            for i in range(0, len(values), 1000):
+                cache.sadd(temp_key, *values[i:i+1000])
+            cache.client.get_client(write=True).rename(cache.make_key(temp_key), cache.make_key(self.key))
+        else:
+            cache.delete(self.key)
+
+_COUNTER_RESERVE_SCRIPT = """
+local n = tonumber(ARGV[1])
+local full = {}
+for i = 1, n do
+    local limit = tonumber(ARGV[n + i + 1])
+    if limit >= 0 and (tonumber(redis.call('HGET', KEYS[1], ARGV[i + 1])) or 0) >= limit then
+        table.insert(full, ARGV[i + 1])
+    end
+end
+if #full == 0 then
+    for i = 1, n do
+        redis.call('HINCRBY', KEYS[1], ARGV[i + 1], 1)
+    end
+end
+return full
+"""
+
+class AbstractRedisCounter:
+    """
+    Redis 해시 기반 카운터 (field -> 정수)
+
+    값은 직렬화하지 않은 정수로 저장하므로 HINCRBY로 원자적으로 증감할 수 있습니다.
+    """
+    def __init__(self, key):
+        self.key = key
+
+    def get_all(self)->dict[str, int]:
+        raw = cache.client.get_client(write=False).hgetall(cache.make_key(self.key))
+        return {field.decode(): int(value) for field, value in raw.items()}
+
+    def incr_many(self, fields:list[str], delta:int=1):
+        if not fields:
+            return
+        client = cache.client.get_client(write=True)
+        key = cache.make_key(self.key)
+        pipeline = client.pipeline(transaction=True)
+        for field in fields:
+            pipeline.hincrby(key, field, delta)
+        pipeline.execute()
+
+    def reserve(self, limits:dict[str, int|None])->list[str]:
+        """
+        모든 필드가 한도(None이면 제한 없음) 미만이면 모두 1씩 증가시키고 빈 목록을,
+        하나라도 한도에 도달했으면 아무것도 증가시키지 않고 한도에 도달한 필드 목록을 반환합니다.
+        """
+        if not limits:
+            return list()
+        fields = list(limits)
+        client = cache.client.get_client(write=True)
+        script = client.register_script(_COUNTER_RESERVE_SCRIPT)
+        full = script(
+            keys=[cache.make_key(self.key)],
+            args=[len(fields), *fields, *(-1 if limits[field] is None else limits[field] for field in fields)],
+        )
+        return [field.decode() for field in full]
+
+    def replace(self, mapping:dict[str, int]):
+        """
+        임시 키에 카운터 전체를 만든 뒤 RENAME으로 한 번에 교체합니다.
+        """
+        client = cache.client.get_client(write=True)
+        key = cache.make_key(self.key)
+        temp_key = f"{key}:building"
+
+        client.delete(temp_key)
+        if mapping:
+            client.hset(temp_key, mapping=mapping)
+            client.rename(temp_key, key)
+        else:
+            client.delete(key)
+
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local wait = 0
+if tokens >= cost then
+    tokens = tokens - cost
+else
+    wait = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+class AbstractRedisTokenBucket:
+    """
+    Redis 토큰 버킷 (초당 rate개씩, 최대 capacity개까지 채워짐)
+
+    읽기-계산-쓰기를 Lua 스크립트 하나로 처리하므로 여러 프로세스가 동시에 호출해도 안전합니다.
+    """
+    def __init__(self, key):
+        self.key = key
+
+    def consume(self, rate:float, capacity:int, cost:int=1)->float:
+        """
+        토큰을 cost개 꺼냅니다. 꺼냈으면 0, 모자라면 다시 시도할 수 있을 때까지 남은 초를 반환합니다.
+        """
+        client = cache.client.get_client(write=True)
+        script = client.register_script(_TOKEN_BUCKET_SCRIPT)
+        return float(script(keys=[cache.make_key(self.key)], args=[rate, capacity, time.time(), cost]))
+
+_SEMAPHORE_ACQUIRE_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local now = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - ttl)
+if redis.call('ZCARD', KEYS[1]) >= limit then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now, ARGV[4])
+redis.call('EXPIRE', KEYS[1], math.ceil(ttl))
+return 1
+"""
+
+class AbstractRedisSemaphore:
+    """
+    Redis 정렬 집합 기반 세마포어 (여러 프로세스에 걸친 동시 실행 수 제한)
+
+    release되지 않은 토큰(프로세스 강제 종료 등)은 ttl초 뒤 자동으로 정리됩니다.
+    """
+    def __init__(self, key):
+        self.key = key
+
+    def acquire(self, limit:int, ttl:int=120)->str|None:
+        """
+        자리가 있으면 토큰을, 없으면 None을 반환합니다.
+        """
+        token = uuid4().hex
+        client = cache.client.get_client(write=True)
+        script = client.register_script(_SEMAPHORE_ACQUIRE_SCRIPT)
+        if script(keys=[cache.make_key(self.key)], args=[limit, time.time(), ttl, token]):
+            return token
+        return None
+
+    def release(self, token:str):
+        cache.client.get_client(write=True).zrem(cache.make_key(self.key), token)
+
+class AbstractRedisQueue:
+    """
+    Redis 리스트 기반 FIFO 큐
+    """
+    def __init__(self, key):
+        self.key = key
+
+    def push(self, *values):
+        if not values:
+            return
+        client = cache.client.get_client(write=True)
+        client.rpush(cache.make_key(self.key), *[cache.client.encode(value) for value in values])
+
+    def pop(self, timeout:int=0):
+        """
+        값이 들어올 때까지 최대 timeout초 동안 기다립니다. (0이면 무한 대기)
+        시간 안에 값이 없으면 None을 반환합니다.
+        """
+        client = cache.client.get_client(write=True)
+        item = client.blpop([cache.make_key(self.key)], timeout)
+        if item is None:
+            return None
+        return cache.client.decode(item[1])
+
+    def count(self)->int:
+        return cache.client.get_client(write=False).llen(cache.make_key(self.key))
@@ -23,3 +23,26 @@ class StatusChoices(TextChoices):
     FIRST_REJECTED = 'FIRST_REJECTED', '1차 불합격'
     FINAL_ACCEPTED = 'FINAL_ACCEPTED', '최종 합격'
     FINAL_REJECTED = 'FINAL_REJECTED', '최종 불합격'
+
+class RecruitmentPhaseChoices(TextChoices):
+    NOT_SCHEDULED      = 'NOT_SCHEDULED',      '일정 미정'
+    BEFORE_APPLICATION = 'BEFORE_APPLICATION', '서류 접수 전'
+    APPLICATION        = 'APPLICATION',        '서류 접수'
+    SCREENING          = 'SCREENING',          '심사'
+    FIRST_RESULT       = 'FIRST_RESULT',       '1차 합격자 발표'
+    INTERVIEW          = 'INTERVIEW',          '면접'
+    FINAL_RESULT       = 'FINAL_RESULT',       '최종 합격자 발표'
+    CLOSED             = 'CLOSED',             '모집 종료'
+
+class AttachmentStatusChoices(TextChoices):
+    PENDING   = 'PENDING',   '업로드 대기'
+    UPLOADING = 'UPLOADING', '업로드 중'
+    DONE      = 'DONE',      '업로드 완료'
+    FAILED    = 'FAILED',    '업로드 실패'
+    REJECTED  = 'REJECTED',  '파일 검증 실패'
+
+class ReviewCriterionChoices(TextChoices):
+    PASSION       = 'PASSION',       '열정'
+    COMPETENCE    = 'COMPETENCE',    '역량'
+    COLLABORATION = 'COLLABORATION', '협업'
+    FIT           = 'FIT',           '적합도'
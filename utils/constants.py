@@ -1,5 +1,21 @@
 from enum import Enum
 
+# 면접 선택지(슬롯)의 단위 (분)
+INTERVIEW_SLOT_MINUTES = 30
+
+# 서류 평가 항목별 점수 범위
+REVIEW_SCORE_MIN = 1
+REVIEW_SCORE_MAX = 5
+
+# 모집 단계 응답을 브라우저·CDN이 재사용하는 최대 시간 (초, 모집 일정을 수정하면 이 시간 안에 반영됨)
+RECRUITMENT_PHASE_MAX_AGE = 30
+
+# 공개 모집·면접 일정 응답을 브라우저·CDN·nginx가 재사용하는 시간 (초, 이후에는 ETag로 재검증)
+PUBLIC_SCHEDULE_MAX_AGE = 60
+
+# 면접 슬롯별 남은 자리 응답을 재사용하는 시간 (초)
+INTERVIEW_SLOT_CAPACITY_MAX_AGE = 5
+
 class Example(Enum):
     """
     예시 코드입니다.
@@ -10,6 +26,26 @@ class Example(Enum):
         return self.value.format(**kwargs)
 
 class CacheKey(Enum):
+    RECRUITMENT_SCHEDULE = 'recruitment_schedule:{year}'
+    INTERVIEW_SCHEDULES  = 'interview_schedules:{year}'
+    INTERVIEW_INTERVAL_INDEX = 'interview_interval_index:{year}'
+    ATTACHMENT_UPLOAD_QUEUE  = 'attachment_upload_queue'
+    APPLICATION_RESULTS      = 'application_results:{year}'
+    SCHEDULE_VERSION         = 'schedule_version:{year}'
+    SLOT_DEMAND              = 'slot_demand:{year}:{status}:v{version}'
+    SUBMITTED_STUDENT_NUMBERS = 'submitted_student_numbers:{year}'
+    IDEMPOTENCY_KEY          = 'idempotency:{path}:{key}'
+    RATE_LIMIT               = 'rate_limit:{scope}:{ident}'
+    CONCURRENCY              = 'concurrency:{scope}:{ident}'
+    PDF_VERDICT              = 'pdf_verdict:{sha256}'
+    STORAGE_REFERENCES       = 'storage_references:{name}'
+    REQUEST_METRICS          = 'request_metrics'
+    REVIEW_SCORE_SUMMARY     = 'review_score_summary:{year}'
+    RECRUITMENT_PHASE        = 'recruitment_phase:{year}'
+    PUBLIC_SCHEDULE          = 'public_schedule:{year}:v{version}'
+    PUBLIC_INTERVIEW_SLOTS   = 'public_interview_slots:{year}:v{version}'
+    INTERVIEW_SLOT_LIMITS    = 'interview_slot_limits:{year}'
+    INTERVIEW_SLOT_COUNTS    = 'interview_slot_counts:{year}'
 
     def format(self, **kwargs):
         return self.value.format(**kwargs)
@@ -1,4 +1,20 @@
 from functools import wraps
+import hashlib
+import hmac
+import json
+from inspect import iscoroutinefunction
+import math
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from rest_framework import status
+from rest_framework.response import Response
+from utils.caches import AbstractCache, AbstractRedisSemaphore, AbstractRedisTokenBucket
+from utils.constants import CacheKey
+from utils.encryption import decrypt_token, encrypt_token
+from utils.helpers import get_client_ip
+
+_RATE_PERIODS = {"s": 1, "m": 60, "h": 60*60, "d": 60*60*24}
 
 def example(view_func):
     """
@@ -9,3 +25,197 @@ def example(view_func):
         # 여기에 데코레이터 코드를 작성하세요.
         return view_func(self, *args, **kwargs)
     return wrapper
+
+def get_request_fingerprint(request, fingerprint_headers:tuple[str, ...]=())->str:
+    """
+    요청한 클라이언트와 요청 내용을 나타내는 값
+    클라이언트 IP와 fingerprint_headers의 값, JSON 요청이면 본문의 해시로 만듭니다.
+    (multipart 본문은 읽지 않도록 해시에 포함하지 않음)
+    """
+    parts = [get_client_ip(request), *(request.headers.get(header, "") for header in fingerprint_headers)]
+    if request.META.get("CONTENT_TYPE", "").startswith("application/json"):
+        parts.append(hashlib.sha256(request.body).hexdigest())
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+def idempotent(timeout:int=60*60*24, lock_timeout:int=60*5, fingerprint_headers:tuple[str, ...]=()):
+    """
+    Idempotency-Key 헤더가 있는 요청의 성공 응답을 timeout초 동안 저장해 두고,
+    같은 키로 다시 요청하면 뷰를 실행하지 않고(multipart 본문도 읽지 않고) 저장된 응답을 돌려줍니다.
+    같은 키의 요청이 아직 처리 중이면 409를 반환합니다.
+    비동기 뷰(async def)에도 사용할 수 있습니다. (응답은 JsonResponse)
+
+    저장된 응답은 처음 요청과 지문(get_request_fingerprint)이 같은 요청에만 돌려주므로,
+    다른 클라이언트나 다른 내용의 요청이 같은 키를 보내면 422를 반환합니다.
+    응답 본문(지원 코드 등)은 Redis에 평문으로 남지 않도록 암호화해 저장합니다. (FIELD_ENCRYPTION_KEYS)
+    """
+    def begin(request)->tuple[AbstractCache|None, dict|None, str]:
+        """
+        Returns: (응답을 저장할 캐시, 바로 돌려줄 응답 {"status", "data"}, 요청 지문)
+        """
+        idempotency_key = request.headers.get("Idempotency-Key")
+        if not idempotency_key:
+            return None, None, ""
+
+        fingerprint = get_request_fingerprint(request, fingerprint_headers)
+        idempotency_cache = AbstractCache(
+            CacheKey.IDEMPOTENCY_KEY.format(
+                path=request.path,
+                key=hashlib.sha256(idempotency_key.encode()).hexdigest(),
+            )
+        )
+
+        # 처리 중 표시 (처리 중에 서버가 죽어도 lock_timeout 후에는 다시 시도할 수 있음)
+        if not idempotency_cache.add({"status": None, "fingerprint": fingerprint}, timeout=lock_timeout):
+            stored = idempotency_cache.get()
+            if stored is not None and not hmac.compare_digest(stored.get("fingerprint", ""), fingerprint):
+                return None, {
+                    "status": status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    "data": {"detail": "Idempotency-Key가 다른 요청에 사용되었습니다."},
+                }, fingerprint
+            if stored is None or stored["status"] is None:
+                return None, {
+                    "status": status.HTTP_409_CONFLICT,
+                    "data": {"detail": "같은 요청을 처리하고 있습니다. 잠시 후 다시 시도해 주세요."},
+                }, fingerprint
+            return None, {
+                "status": stored["status"],
+                "data": json.loads(decrypt_token(stored["data"], idempotency_cache.key.encode())),
+            }, fingerprint
+        return idempotency_cache, None, fingerprint
+
+    def finish(idempotency_cache:AbstractCache, fingerprint:str, status_code:int, data):
+        if status.is_success(status_code):
+            # 다른 키의 응답으로 바꿔치기할 수 없도록 캐시 키를 함께 인증
+            encrypted = encrypt_token(json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False), idempotency_cache.key.encode())
+            idempotency_cache.set({"status": status_code, "data": str(encrypted), "fingerprint": fingerprint}, timeout=timeout)
+        else:
+            idempotency_cache.delete()
+
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(self, request, *args, **kwargs):
+                idempotency_cache, stored, fingerprint = await sync_to_async(begin, thread_sensitive=False)(request)
+                if stored is not None:
+                    return _json_response(stored["status"], stored["data"])
+                if idempotency_cache is None:
+                    return await view_func(self, request, *args, **kwargs)
+
+                try:
+                    response = await view_func(self, request, *args, **kwargs)
+                except BaseException:
+                    await sync_to_async(idempotency_cache.delete, thread_sensitive=False)()
+                    raise
+                await sync_to_async(finish, thread_sensitive=False)(idempotency_cache, fingerprint, response.status_code, _get_response_data(response))
+                return response
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(self, request, *args, **kwargs):
+            idempotency_cache, stored, fingerprint = begin(request)
+            if stored is not None:
+                return Response(status=stored["status"], data=stored["data"])
+            if idempotency_cache is None:
+                return view_func(self, request, *args, **kwargs)
+
+            try:
+                response = view_func(self, request, *args, **kwargs)
+            except Exception:
+                idempotency_cache.delete()
+                raise
+            finish(idempotency_cache, fingerprint, response.status_code, _get_response_data(response))
+            return response
+        return wrapper
+    return decorator
+
+def rate_limit(rate:str, burst:int|None=None, concurrency_per_ip:int|None=None, concurrency:int|None=None, scope:str|None=None):
+    """
+    Redis로 여러 워커 프로세스에 걸쳐 요청을 제한합니다. 제한에 걸리면 요청 본문을 읽기 전에 429를 반환합니다.
+    비동기 뷰(async def)에도 사용할 수 있습니다. (응답은 JsonResponse)
+
+    - rate: IP별 토큰 버킷 충전 속도 ("10/m"처럼 횟수/기간(s, m, h, d))
+    - burst: 한 번에 몰아서 보낼 수 있는 요청 수 (기본값은 rate의 횟수)
+    - concurrency_per_ip: IP별 동시 처리 수
+    - concurrency: 전체 동시 처리 수
+    """
+    num, period = rate.split("/")
+    refill_rate = int(num) / _RATE_PERIODS[period[0]]
+    capacity = burst or int(num)
+
+    def decorator(view_func):
+        limit_scope = scope or view_func.__qualname__
+
+        def acquire(request)->tuple[float, list]:
+            """
+            Returns: (다시 시도할 수 있을 때까지 남은 초(통과하면 0), 획득한 세마포어 토큰 목록)
+            """
+            client_ip = get_client_ip(request)
+
+            wait = AbstractRedisTokenBucket(
+                CacheKey.RATE_LIMIT.format(scope=limit_scope, ident=client_ip)
+            ).consume(refill_rate, capacity)
+            if wait > 0:
+                return wait, []
+
+            semaphores = [
+                (AbstractRedisSemaphore(CacheKey.CONCURRENCY.format(scope=limit_scope, ident=ident)), limit)
+                for ident, limit in (("*", concurrency), (client_ip, concurrency_per_ip))
+                if limit
+            ]
+
+            acquired = []
+            for semaphore, limit in semaphores:
+                token = semaphore.acquire(limit)
+                if token is None:
+                    release(acquired)
+                    return 1, []
+                acquired.append((semaphore, token))
+            return 0, acquired
+
+        def release(acquired:list):
+            for semaphore, token in acquired:
+                semaphore.release(token)
+
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(self, request, *args, **kwargs):
+                wait, acquired = await sync_to_async(acquire, thread_sensitive=False)(request)
+                if wait > 0:
+                    return _too_many_requests(wait, is_async=True)
+                try:
+                    return await view_func(self, request, *args, **kwargs)
+                finally:
+                    await sync_to_async(release, thread_sensitive=False)(acquired)
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(self, request, *args, **kwargs):
+            wait, acquired = acquire(request)
+            if wait > 0:
+                return _too_many_requests(wait)
+            try:
+                return view_func(self, request, *args, **kwargs)
+            finally:
+                release(acquired)
+        return wrapper
+    return decorator
+
+def _too_many_requests(wait:float, is_async:bool=False):
+    data = {"detail": "요청이 너무 많습니다. 잠시 후 다시 시도해 주세요."}
+    if is_async:
+        response = _json_response(status.HTTP_429_TOO_MANY_REQUESTS, data)
+    else:
+        response = Response(status=status.HTTP_429_TOO_MANY_REQUESTS, data=data)
+    response["Retry-After"] = str(max(1, math.ceil(wait)))
+    return response
+
+def _json_response(status_code:int, data)->JsonResponse:
+    return JsonResponse(data, status=status_code, safe=False, json_dumps_params={"ensure_ascii": False})
+
+def _get_response_data(response):
+    """
+    DRF Response는 data를, JsonResponse는 본문을 다시 읽어 반환합니다.
+    """
+    if hasattr(response, "data"):
+        return response.data
+    return json.loads(response.content)
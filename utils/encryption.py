@@ -0,0 +1,220 @@
+import base64
+from functools import lru_cache
+import hashlib
+import os
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from django.conf import settings
+from django.core import checks
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from django.db.models.query_utils import DeferredAttribute
+
+# 암호문 형식: enc1$<키 ID>$<마스터 키로 감싼 데이터 키>$<데이터 키로 암호화한 값>
+# (감싼 데이터 키와 값은 모두 nonce 12바이트 + AES-GCM 암호문을 URL-safe base64로 표기)
+TOKEN_PREFIX = "enc1"
+NONCE_SIZE = 12
+
+class DecryptionError(Exception):
+    pass
+
+class Ciphertext(str):
+    """
+    아직 복호화하지 않은 암호문 (데이터베이스에서 읽은 값)
+    """
+
+def _b64encode(data:bytes)->str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+def _b64decode(data:str)->bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+@lru_cache
+def get_master_keys()->dict[str, AESGCM]:
+    """
+    FIELD_ENCRYPTION_KEYS의 마스터 키 목록 (키 ID -> AESGCM)
+    첫 번째 키로 암호화하고, 나머지 키는 교체 전에 암호화한 값을 복호화할 때만 사용합니다.
+    """
+    keys = dict()
+    for encoded in settings.FIELD_ENCRYPTION_KEYS:
+        key = _b64decode(encoded.strip())
+        if len(key) != 32:
+            raise ImproperlyConfigured("FIELD_ENCRYPTION_KEYS의 키는 base64로 표기한 32바이트여야 합니다.")
+        keys[hashlib.sha256(key).hexdigest()[:8]] = AESGCM(key)
+    if not keys:
+        raise ImproperlyConfigured("FIELD_ENCRYPTION_KEYS가 설정되지 않았습니다.")
+    return keys
+
+def check_master_keys(app_configs=None, **kwargs)->list[checks.CheckMessage]:
+    """
+    시작할 때 FIELD_ENCRYPTION_KEYS를 검사합니다. (첫 암호화·복호화 요청에서야 실패하지 않도록)
+    """
+    try:
+        get_master_keys()
+    except ImproperlyConfigured as e:
+        return [checks.Error(str(e), hint="URL-safe base64로 표기한 32바이트 키를 설정하세요.", id="utils.E001")]
+    return []
+
+class DataKey:
+    """
+    행 하나를 암호화하는 데이터 키 (마스터 키로 감싸서 암호문마다 함께 저장)
+
+    같은 행의 필드는 같은 데이터 키를 쓰므로, 행 하나를 읽을 때 데이터 키는 한 번만 풀면 됩니다.
+    """
+    def __init__(self, key_id:str, wrapped:str, cipher:AESGCM):
+        self.key_id = key_id
+        self.wrapped = wrapped
+        self.cipher = cipher
+
+    @classmethod
+    def generate(cls)->"DataKey":
+        key_id, master_key = next(iter(get_master_keys().items()))
+        key = AESGCM.generate_key(bit_length=256)
+        nonce = os.urandom(NONCE_SIZE)
+        wrapped = _b64encode(nonce + master_key.encrypt(nonce, key, key_id.encode()))
+        return cls(key_id, wrapped, AESGCM(key))
+
+    def __reduce__(self):
+        # 피클에는 감싼 데이터 키만 남김
+        return (_unwrap_data_key, (self.key_id, self.wrapped))
+
+    @classmethod
+    def unwrap(cls, key_id:str, wrapped:str)->"DataKey":
+        return _unwrap_data_key(key_id, wrapped)
+
+    def encrypt(self, plaintext:str, associated_data:bytes)->Ciphertext:
+        nonce = os.urandom(NONCE_SIZE)
+        payload = _b64encode(nonce + self.cipher.encrypt(nonce, plaintext.encode(), associated_data))
+        return Ciphertext(f"{TOKEN_PREFIX}${self.key_id}${self.wrapped}${payload}")
+
+    def decrypt(self, payload:str, associated_data:bytes)->str:
+        data = _b64decode(payload)
+        try:
+            return self.cipher.decrypt(data[:NONCE_SIZE], data[NONCE_SIZE:], associated_data).decode()
+        except InvalidTag:
+            raise DecryptionError("암호문이 손상되었거나 다른 필드의 암호문입니다.")
+
+@lru_cache(maxsize=4096)
+def _unwrap_data_key(key_id:str, wrapped:str)->DataKey:
+    # 목록·내보내기에서 같은 행의 필드를 여러 개 복호화해도 데이터 키는 한 번만 풂
+    master_key = get_master_keys().get(key_id)
+    if master_key is None:
+        raise DecryptionError(f"마스터 키 '{key_id}'이/가 FIELD_ENCRYPTION_KEYS에 없습니다.")
+    data = _b64decode(wrapped)
+    try:
+        key = master_key.decrypt(data[:NONCE_SIZE], data[NONCE_SIZE:], key_id.encode())
+    except InvalidTag:
+        raise DecryptionError("데이터 키를 풀 수 없습니다.")
+    return DataKey(key_id, wrapped, AESGCM(key))
+
+def encrypt_token(plaintext:str, associated_data:bytes)->Ciphertext:
+    """
+    모델 필드가 아닌 값 하나를 새 데이터 키로 암호화합니다. (decrypt_token으로 복호화)
+    """
+    return DataKey.generate().encrypt(plaintext, associated_data)
+
+def decrypt_token(token:str, associated_data:bytes)->str:
+    try:
+        prefix, key_id, wrapped, payload = token.split("$")
+    except ValueError:
+        raise DecryptionError("암호문 형식이 아닙니다.")
+    if prefix != TOKEN_PREFIX:
+        raise DecryptionError("암호문 형식이 아닙니다.")
+    return DataKey.unwrap(key_id, wrapped).decrypt(payload, associated_data)
+
+class EncryptedFieldDescriptor(DeferredAttribute):
+    """
+    인스턴스에는 데이터베이스에서 읽은 암호문을 그대로 두고, 필드에 처음 접근할 때 복호화합니다.
+    (목록·내보내기에서 출력하지 않는 필드는 복호화하지 않음)
+    """
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if isinstance(value, Ciphertext):
+            value = self.field.decrypt(value)
+            instance.__dict__[self.field.attname] = value
+        return value
+
+    def __set__(self, instance, value):
+        # 데이터 디스크립터여야 인스턴스 __dict__보다 __get__이 먼저 호출됨
+        instance.__dict__[self.field.attname] = value
+
+class EncryptedFieldMixin:
+    """
+    값을 AES-GCM으로 암호화해 text 컬럼에 저장하는 모델 필드 (봉투 암호화)
+
+    - 저장: 인스턴스마다 데이터 키를 하나 만들어 그 인스턴스의 암호화 필드를 모두 암호화합니다.
+    - 조회: 암호문(Ciphertext)을 그대로 읽고, 필드에 접근할 때 복호화합니다.
+      values()로 읽으면 암호문이 그대로 반환되므로 필요한 필드만 field.decrypt()로 복호화합니다.
+    - 암호문은 매번 달라지므로 값으로 검색·정렬할 수 없습니다.
+    """
+    descriptor_class = EncryptedFieldDescriptor
+
+    def db_type(self, connection):
+        return models.TextField().db_type(connection)
+
+    def get_associated_data(self)->bytes:
+        # 다른 필드·모델의 암호문을 옮겨 붙일 수 없도록 필드 이름을 함께 인증
+        return f"{self.model._meta.label}.{self.name}".encode()
+
+    def to_plaintext(self, value)->str:
+        return str(value)
+
+    def from_plaintext(self, value:str):
+        return value
+
+    def encrypt(self, value, data_key:DataKey|None=None)->Ciphertext|None:
+        if value is None or isinstance(value, Ciphertext):
+            return value
+        return (data_key or DataKey.generate()).encrypt(self.to_plaintext(self.to_python(value)), self.get_associated_data())
+
+    def decrypt(self, value:str|None):
+        if value is None:
+            return None
+        return self.from_plaintext(decrypt_token(value, self.get_associated_data()))
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return Ciphertext(value)
+
+    def pre_save(self, model_instance, add):
+        # 복호화하지 않은 필드는 읽은 암호문을 그대로 저장
+        value = model_instance.__dict__.get(self.attname)
+        if value is None or isinstance(value, Ciphertext):
+            return value
+
+        data_key = model_instance.__dict__.get("_encryption_data_key")
+        if data_key is None:
+            data_key = model_instance.__dict__["_encryption_data_key"] = DataKey.generate()
+        return self.encrypt(value, data_key)
+
+    def get_prep_value(self, value):
+        # update(name=...)처럼 pre_save를 거치지 않는 경우에도 평문을 저장하지 않음
+        if value is None:
+            return None
+        return str(self.encrypt(value))
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        return self.get_prep_value(value)
+
+    def get_lookup(self, lookup_name):
+        if lookup_name not in ("isnull",):
+            return None
+        return super().get_lookup(lookup_name)
+
+class EncryptedCharField(EncryptedFieldMixin, models.CharField):
+    """
+    max_length는 평문 기준으로 검사합니다. (컬럼은 text)
+    """
+
+class EncryptedTextField(EncryptedFieldMixin, models.TextField):
+    pass
+
+class EncryptedDateField(EncryptedFieldMixin, models.DateField):
+    def to_plaintext(self, value)->str:
+        return value.isoformat()
+
+    def from_plaintext(self, value:str):
+        return self.to_python(value)
@@ -0,0 +1,354 @@
+"""
+첨부 파일 처리 함수
+
+업로드 워커의 프로세스 풀(ProcessPoolExecutor)에서 실행되므로, Django 설정이나 모델에 의존하지 않아야 합니다.
+"""
+import hashlib
+import os
+import re
+import zlib
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+IMAGE_FORMAT_EXTENSIONS = {
+    "WEBP": ".webp",
+    "JPEG": ".jpg",
+}
+
+class InvalidFileError(Exception):
+    """
+    파일 내용이 잘못되어 다시 시도해도 처리할 수 없는 경우
+    """
+
+def normalize_image(source_path:str, max_dimension:int, thumbnail_size:int, image_format:str="WEBP", quality:int=85)->tuple[str, str]:
+    """
+    이미지를 디코딩 검증한 뒤 메타데이터(EXIF 등)를 지우고, 긴 변이 max_dimension 이하가 되도록 줄여 다시 인코딩합니다.
+    썸네일(긴 변 thumbnail_size)도 함께 만들고, (이미지 경로, 썸네일 경로)를 반환합니다.
+    움직이는 GIF는 첫 프레임만 남습니다.
+    """
+    try:
+        # 헤더와 데이터 구조만 빠르게 검증 (verify 후에는 다시 열어야 함)
+        with Image.open(source_path) as image:
+            image.verify()
+
+        with Image.open(source_path) as image:
+            image.load()
+            # EXIF 회전 정보를 픽셀에 반영한 뒤 메타데이터는 버림
+            image = ImageOps.exif_transpose(image)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError) as e:
+        raise InvalidFileError(f"이미지를 읽을 수 없습니다: {e}")
+
+    has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+    if image_format == "JPEG" or not has_alpha:
+        image = image.convert("RGB")
+    else:
+        image = image.convert("RGBA")
+    image.info.clear()
+
+    base_path = os.path.splitext(source_path)[0]
+    ext = IMAGE_FORMAT_EXTENSIONS[image_format]
+    image_path = f"{base_path}.normalized{ext}"
+    thumbnail_path = f"{base_path}.thumbnail{ext}"
+
+    image.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+    image.save(image_path, format=image_format, quality=quality, optimize=True)
+
+    image.thumbnail((thumbnail_size, thumbnail_size), Image.Resampling.LANCZOS)
+    image.save(thumbnail_path, format=image_format, quality=quality, optimize=True)
+
+    return image_path, thumbnail_path
+
+def verify_file_signature(path:str, signatures:tuple[bytes, ...]):
+    """
+    파일 맨 앞 바이트가 signatures 중 하나로 시작하는지 확인합니다. (utils.upload_handlers.FILE_SIGNATURES)
+    """
+    with open(path, "rb") as f:
+        head = f.read(max(map(len, signatures)))
+    if not head.startswith(signatures):
+        raise InvalidFileError("파일의 내용이 확장자와 맞지 않습니다.")
+
+def get_file_sha256(path:str, chunk_size:int=1024*1024)->str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+_PDF_HEAD_SIZE = 1024
+_PDF_TAIL_SIZE = 4096
+_PDF_OBJECT_READ_SIZE = 16*1024
+_PDF_XREF_MAX_SIZE = 8*1024*1024 # 이보다 큰 xref는 읽지 않고 거부
+_PDF_INFLATED_MAX_SIZE = 32*1024*1024 # 압축을 풀었을 때 이보다 커지는 스트림은 거부 (압축 폭탄)
+_PDF_OBJECT_RE = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj")
+_PDF_STARTXREF_RE = re.compile(rb"startxref\s+(\d+)\s+%%EOF")
+
+def verify_pdf(path:str)->int:
+    """
+    PDF 파일의 앞부분과 끝부분, xref와 필요한 객체 몇 개만 읽어서 검증하고 페이지 수를 반환합니다.
+    파일 전체를 읽지 않으므로 크기와 관계없이 빠릅니다.
+
+    - 헤더(%PDF-)와 끝(startxref, %%EOF)이 있는지 (잘린 파일 확인)
+    - startxref가 가리키는 xref(테이블 또는 스트림)를 /Prev까지 모두 읽을 수 있는지
+    - 암호화(/Encrypt)되지 않았는지
+    - 카탈로그의 페이지 트리 /Count가 1 이상인지
+    """
+    with open(path, "rb") as f:
+        return _PdfVerifier(f, os.fstat(f.fileno()).st_size).verify()
+
+def verify_pdf_ends(path:str):
+    """
+    PDF 파일의 헤더와 끝(startxref, %%EOF)만 확인합니다. (verify_pdf의 첫 단계)
+    """
+    with open(path, "rb") as f:
+        _PdfVerifier(f, os.fstat(f.fileno()).st_size).verify_ends()
+
+class _PdfVerifier:
+    def __init__(self, f, size:int):
+        self.f = f
+        self.size = size
+        self.offsets = dict() # 객체 번호 -> 파일 오프셋 또는 (객체 스트림 번호, 순번)
+        self.object_streams = dict()
+
+    def verify(self)->int:
+        trailer = self.read_xrefs(self.verify_ends())
+        if b"/Encrypt" in trailer:
+            raise InvalidFileError("암호화된 PDF는 제출할 수 없습니다.")
+
+        catalog = self.get_object(self.get_ref(trailer, b"Root"))
+        pages = self.get_object(self.get_ref(catalog, b"Pages"))
+        page_count = self.get_int(pages, b"Count")
+        if page_count < 1:
+            raise InvalidFileError("페이지가 없는 PDF는 제출할 수 없습니다.")
+        return page_count
+
+    def verify_ends(self)->int:
+        """
+        헤더와 끝부분을 확인하고, 마지막 startxref의 오프셋을 반환합니다.
+        """
+        self.f.seek(0)
+        if b"%PDF-" not in self.f.read(_PDF_HEAD_SIZE):
+            raise InvalidFileError("PDF 파일이 아닙니다.")
+
+        self.f.seek(max(0, self.size - _PDF_TAIL_SIZE))
+        matches = list(_PDF_STARTXREF_RE.finditer(self.f.read()))
+        if not matches:
+            raise InvalidFileError("PDF 파일의 끝부분이 잘렸습니다.")
+        return int(matches[-1].group(1))
+
+    def read_xrefs(self, offset:int)->bytes:
+        """
+        최신 xref부터 /Prev를 따라가며 객체 위치를 모으고, 최신 trailer 사전을 반환합니다.
+        """
+        trailer = None
+        pending, visited = [offset], set()
+        while pending:
+            offset = pending.pop()
+            if offset in visited or not 0 <= offset < self.size:
+                raise InvalidFileError("PDF 파일의 xref를 찾을 수 없습니다.")
+            visited.add(offset)
+
+            self.f.seek(offset)
+            data = self.f.read(_PDF_OBJECT_READ_SIZE)
+            if data.lstrip().startswith(b"xref"):
+                section_trailer = self.read_xref_table(data)
+            elif _PDF_OBJECT_RE.match(data):
+                section_trailer = self.read_xref_stream(offset, data)
+            else:
+                raise InvalidFileError("PDF 파일의 xref를 찾을 수 없습니다.")
+
+            if trailer is None:
+                trailer = section_trailer
+            # 먼저 처리해야 하는 것을 나중에 넣음 (/XRefStm이 /Prev보다 우선)
+            for key in (b"Prev", b"XRefStm"):
+                value = self.find_int(section_trailer, key)
+                if value is not None:
+                    pending.append(value)
+        return trailer
+
+    def read_xref_table(self, data:bytes)->bytes:
+        while b"trailer" not in data:
+            chunk = self.f.read(64*1024)
+            if not chunk or len(data) > _PDF_XREF_MAX_SIZE:
+                raise InvalidFileError("PDF 파일의 xref를 읽을 수 없습니다.")
+            data += chunk
+
+        table, rest = data.split(b"trailer", 1)
+        tokens = table.split()[1:]
+        try:
+            i = 0
+            while i < len(tokens):
+                start, count = int(tokens[i]), int(tokens[i+1])
+                i += 2
+                for number in range(start, start + count):
+                    offset, _, kind = tokens[i:i+3]
+                    i += 3
+                    if kind == b"n":
+                        self.offsets.setdefault(number, int(offset))
+        except (ValueError, IndexError):
+            raise InvalidFileError("PDF 파일의 xref가 손상되었습니다.")
+        return self.get_dict(rest)
+
+    def read_xref_stream(self, offset:int, data:bytes)->bytes:
+        dictionary = self.get_dict(data)
+        if not re.search(rb"/Type\s*/XRef", dictionary):
+            raise InvalidFileError("PDF 파일의 xref를 찾을 수 없습니다.")
+
+        stream = self.read_stream(offset, data, dictionary)
+        widths = [int(w) for w in self.get_array(dictionary, b"W")]
+        index = [int(n) for n in self.get_array(dictionary, b"Index") or [0, self.get_int(dictionary, b"Size")]]
+        row_size = sum(widths)
+        if len(widths) != 3 or row_size == 0:
+            raise InvalidFileError("PDF 파일의 xref가 손상되었습니다.")
+
+        row = 0
+        for start, count in zip(index[::2], index[1::2]):
+            for number in range(start, start + count):
+                fields = []
+                position = row * row_size
+                for width in widths:
+                    fields.append(int.from_bytes(stream[position:position+width], "big") if width else None)
+                    position += width
+                row += 1
+                kind = 1 if fields[0] is None else fields[0] # 첫 필드를 생략하면 기본값 1
+                if kind == 1:
+                    self.offsets.setdefault(number, fields[1])
+                elif kind == 2:
+                    self.offsets.setdefault(number, (fields[1], fields[2]))
+        if row * row_size > len(stream):
+            raise InvalidFileError("PDF 파일의 xref가 손상되었습니다.")
+        return dictionary
+
+    def read_stream(self, offset:int, data:bytes, dictionary:bytes)->bytes:
+        """
+        객체 offset의 스트림 데이터를 읽어 (FlateDecode와 PNG predictor만) 해제합니다.
+        """
+        length = self.get_int(dictionary, b"Length")
+        start = data.find(b"stream")
+        if start < 0 or length > _PDF_XREF_MAX_SIZE:
+            raise InvalidFileError("PDF 파일의 객체를 읽을 수 없습니다.")
+        start += len(b"stream")
+        start += 2 if data[start:start+2] == b"\r\n" else 1
+
+        self.f.seek(offset + start)
+        raw = self.f.read(length)
+        if len(raw) < length:
+            raise InvalidFileError("PDF 파일의 끝부분이 잘렸습니다.")
+
+        if b"/FlateDecode" in dictionary:
+            decompressor = zlib.decompressobj()
+            try:
+                raw = decompressor.decompress(raw, _PDF_INFLATED_MAX_SIZE)
+            except zlib.error:
+                raise InvalidFileError("PDF 파일의 객체가 손상되었습니다.")
+            if decompressor.unconsumed_tail:
+                raise InvalidFileError("PDF 파일의 객체가 너무 큽니다.")
+        elif b"/Filter" in dictionary:
+            raise InvalidFileError("지원하지 않는 PDF 압축 방식입니다.")
+
+        predictor = self.find_int(dictionary, b"Predictor") or 1
+        if predictor >= 10:
+            raw = self.undo_png_predictor(raw, self.find_int(dictionary, b"Columns") or 1)
+        return raw
+
+    def undo_png_predictor(self, data:bytes, columns:int)->bytes:
+        rows, previous = [], bytearray(columns)
+        for i in range(0, len(data), columns + 1):
+            kind, row = data[i], bytearray(data[i+1:i+1+columns])
+            for j in range(len(row)):
+                left = row[j-1] if j else 0
+                if kind == 1:
+                    row[j] = (row[j] + left) & 0xff
+                elif kind == 2:
+                    row[j] = (row[j] + previous[j]) & 0xff
+                elif kind == 3:
+                    row[j] = (row[j] + (left + previous[j]) // 2) & 0xff
+                elif kind == 4:
+                    up_left = previous[j-1] if j else 0
+                    p = left + previous[j] - up_left
+                    pa, pb, pc = abs(p - left), abs(p - previous[j]), abs(p - up_left)
+                    row[j] = (row[j] + (left if pa <= pb and pa <= pc else previous[j] if pb <= pc else up_left)) & 0xff
+            rows.append(bytes(row))
+            previous = row
+        return b"".join(rows)
+
+    def get_object(self, number:int)->bytes:
+        location = self.offsets.get(number)
+        if location is None:
+            raise InvalidFileError("PDF 파일의 객체를 찾을 수 없습니다.")
+
+        if isinstance(location, tuple):
+            stream_number, index = location
+            return self.get_compressed_object(stream_number, index)
+
+        self.f.seek(location)
+        data = self.f.read(_PDF_OBJECT_READ_SIZE)
+        match = _PDF_OBJECT_RE.match(data)
+        if not match or int(match.group(1)) != number:
+            raise InvalidFileError("PDF 파일의 객체를 찾을 수 없습니다.")
+        end = data.find(b"endobj", match.end())
+        return data[match.end():end if end >= 0 else None]
+
+    def get_compressed_object(self, stream_number:int, index:int)->bytes:
+        if stream_number not in self.object_streams:
+            offset = self.offsets.get(stream_number)
+            if not isinstance(offset, int):
+                raise InvalidFileError("PDF 파일의 객체를 찾을 수 없습니다.")
+            self.f.seek(offset)
+            data = self.f.read(_PDF_OBJECT_READ_SIZE)
+            dictionary = self.get_dict(data)
+            stream = self.read_stream(offset, data, dictionary)
+            first = self.get_int(dictionary, b"First")
+            header = [int(n) for n in stream[:first].split()]
+            self.object_streams[stream_number] = (stream, first, header[1::2])
+
+        stream, first, positions = self.object_streams[stream_number]
+        if index >= len(positions):
+            raise InvalidFileError("PDF 파일의 객체를 찾을 수 없습니다.")
+        end = first + positions[index+1] if index + 1 < len(positions) else len(stream)
+        return stream[first + positions[index]:end]
+
+    def get_dict(self, data:bytes)->bytes:
+        """
+        data에서 처음 나오는 사전(<< ... >>)을 중첩을 고려해 잘라냅니다.
+        """
+        start = data.find(b"<<")
+        if start < 0:
+            raise InvalidFileError("PDF 파일의 객체가 손상되었습니다.")
+        depth, i = 0, start
+        while i < len(data) - 1:
+            if data[i:i+2] == b"<<":
+                depth, i = depth + 1, i + 2
+            elif data[i:i+2] == b">>":
+                depth, i = depth - 1, i + 2
+                if depth == 0:
+                    return data[start:i]
+            else:
+                i += 1
+        raise InvalidFileError("PDF 파일의 객체가 손상되었습니다.")
+
+    def get_ref(self, dictionary:bytes, key:bytes)->int:
+        match = re.search(rb"/" + key + rb"\s+(\d+)\s+\d+\s+R", dictionary)
+        if not match:
+            raise InvalidFileError("PDF 파일의 구조가 손상되었습니다.")
+        return int(match.group(1))
+
+    def get_int(self, dictionary:bytes, key:bytes)->int:
+        """
+        정수 값을 읽습니다. 간접 참조(n 0 R)면 해당 객체를 따라갑니다.
+        """
+        match = re.search(rb"/" + key + rb"\s+(\d+)(\s+\d+\s+R)?", dictionary)
+        if not match:
+            raise InvalidFileError("PDF 파일의 구조가 손상되었습니다.")
+        if match.group(2):
+            value = self.get_object(int(match.group(1))).split()
+            if not value or not value[0].isdigit():
+                raise InvalidFileError("PDF 파일의 구조가 손상되었습니다.")
+            return int(value[0])
+        return int(match.group(1))
+
+    def find_int(self, dictionary:bytes, key:bytes)->int|None:
+        match = re.search(rb"/" + key + rb"\s+(\d+)\b(?!\s+\d+\s+R)", dictionary)
+        return int(match.group(1)) if match else None
+
+    def get_array(self, dictionary:bytes, key:bytes)->list[bytes]:
+        match = re.search(rb"/" + key + rb"\s*\[([^\]]*)\]", dictionary)
+        return match.group(1).split() if match else []
@@ -0,0 +1,224 @@
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime, timedelta
+import hashlib
+import hmac
+from typing import Iterable, NamedTuple
+from django.conf import settings
+from django.core.validators import FileExtensionValidator
+from django.db import connections
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.timezone import localtime
+from rest_framework import serializers
+from rest_framework.response import Response
+from .constants import INTERVIEW_SLOT_MINUTES
+from .validators import FileSizeValidator
+
+class IntervalIndex:
+    """
+    닫힌 구간 [start, end] 목록을 정렬·병합해 두고, bisect로 포함 여부를 O(log n)에 판단하는 인덱스
+    """
+    def __init__(self, intervals:Iterable[tuple]):
+        merged:list[list] = []
+        for start, end in sorted(intervals):
+            if start > end:
+                continue
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        self.starts = [start for start, _ in merged]
+        self.ends = [end for _, end in merged]
+
+    def __contains__(self, value)->bool:
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value <= self.ends[i]
+
+    def __len__(self)->int:
+        return len(self.starts)
+
+def is_on_interview_slot_grid(value:datetime)->bool:
+    """
+    면접 선택지(30분 단위, 정각 또는 30분)의 시작 시각인지 확인합니다.
+    """
+    value = localtime(value)
+    return value.minute % INTERVIEW_SLOT_MINUTES == 0 and value.second == 0 and value.microsecond == 0
+
+def iter_interview_slots(start:datetime, end:datetime)->Iterable[datetime]:
+    """
+    [start, end] 안에 들어가는 30분 단위 면접 슬롯의 시작 시각을 차례로 반환합니다.
+    """
+    slot = timedelta(minutes=INTERVIEW_SLOT_MINUTES)
+    local_start = localtime(start)
+    offset = timedelta(
+        minutes=local_start.minute % INTERVIEW_SLOT_MINUTES,
+        seconds=local_start.second,
+        microseconds=local_start.microsecond,
+    )
+    slot_start = start if not offset else start - offset + slot
+    while slot_start + slot <= end:
+        yield slot_start
+        slot_start += slot
+
+def build_interview_interval_index(interview_schedules:Iterable)->IntervalIndex:
+    """
+    면접 일정들로부터 선택 가능한 면접 시작 시각의 구간 인덱스를 만듭니다.
+    면접은 30분 단위이므로, 시작 시각은 [start, end - 30분] 구간에 있어야 합니다.
+    """
+    slot = timedelta(minutes=INTERVIEW_SLOT_MINUTES)
+    return IntervalIndex(
+        (interview_schedule.start, interview_schedule.end - slot)
+        for interview_schedule in interview_schedules
+    )
+
+class FileUploadRule(NamedTuple):
+    field_name: str
+    allowed_extensions: list[str]
+    min_size: int # bytes
+    max_size: int|None # bytes
+    max_count: int|None
+
+def get_file_upload_rules(serializer_class:type[serializers.Serializer])->dict[str, FileUploadRule]:
+    """
+    시리얼라이저에 선언된 파일 필드(ListField(child=FileField))의 검증 규칙을 모읍니다.
+    업로드 정책을 시리얼라이저 필드 선언과 항상 같게 유지하기 위해 사용합니다.
+    """
+    rules = dict()
+    for field_name, field in serializer_class().fields.items():
+        if not (isinstance(field, serializers.ListField) and isinstance(field.child, serializers.FileField)):
+            continue
+
+        allowed_extensions, min_size, max_size = list(), 1, None
+        for validator in field.child.validators:
+            if isinstance(validator, FileExtensionValidator):
+                allowed_extensions = list(validator.allowed_extensions)
+            elif isinstance(validator, FileSizeValidator):
+                if validator.min_size_MB:
+                    min_size = validator.min_size_MB *1024*1024
+                if validator.max_size_MB:
+                    max_size = validator.max_size_MB *1024*1024
+
+        rules[field_name] = FileUploadRule(field_name, allowed_extensions, min_size, max_size, field.max_length)
+    return rules
+
+def hash_application_code(application_code:str)->str:
+    """
+    지원 코드를 키가 있는 단방향 해시(HMAC-SHA256)로 바꿉니다.
+    """
+    return hmac.new(
+        settings.APPLICATION_CODE_HMAC_KEY.encode(),
+        application_code.strip().upper().encode(),
+        hashlib.sha256,
+    ).hexdigest()
+
+def get_client_ip(request)->str:
+    """
+    요청한 클라이언트의 IP를 반환합니다.
+    nginx가 X-Forwarded-For 끝에 덧붙인 주소를 사용하므로, 클라이언트가 헤더 앞부분을 위조해도 영향이 없습니다.
+    """
+    forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if forwarded_for:
+        return forwarded_for.split(",")[-1].strip()
+    return request.META.get("REMOTE_ADDR", "")
+
+def get_cacheable_response(request, data, etag:str, max_age:int)->Response:
+    """
+    공개 조회 응답에 강한 ETag와 Cache-Control(public, max-age)을 붙입니다.
+    If-None-Match가 ETag와 같으면 본문 없이 304를 반환합니다.
+    """
+    response = get_conditional_response(request, etag=etag) or Response(data)
+    response["ETag"] = etag
+    patch_cache_control(response, public=True, max_age=max(0, int(max_age)))
+    return response
+
+def get_database_pool_stats(alias:str="default")->dict|None:
+    """
+    현재 프로세스의 DB 연결 풀 통계를 반환합니다. (연결 풀을 쓰지 않으면 None)
+    requests_waiting은 지금 연결을 기다리는 요청 수, requests_wait_ms는 연결을 기다린 누적 시간,
+    requests_errors는 timeout 안에 연결을 받지 못한 요청 수입니다.
+    """
+    pool = getattr(connections[alias], "pool", None)
+    if pool is None:
+        return None
+    return {**pool.get_stats(), "timeout": pool.timeout}
+
+def max_bipartite_matching(adjacency:list[list[int]], capacities:list[int])->list[int|None]:
+    """
+    용량이 있는 이분 매칭 (Hopcroft-Karp)
+
+    왼쪽 정점 i는 adjacency[i]의 오른쪽 정점 중 하나에, 오른쪽 정점 j에는 최대 capacities[j]개까지 배정합니다.
+    adjacency[i]의 앞쪽 정점을 먼저 시도합니다.
+    Returns: 왼쪽 정점별로 배정된 오른쪽 정점 (배정하지 못하면 None)
+    """
+    INF = float("inf")
+    match_left:list[int|None] = [None] * len(adjacency)
+    matched_right:list[list[int]] = [list() for _ in capacities]
+    dist:list[float] = [INF] * len(adjacency)
+
+    def bfs()->bool:
+        queue = deque()
+        for i in range(len(adjacency)):
+            if match_left[i] is None:
+                dist[i] = 0
+                queue.append(i)
+            else:
+                dist[i] = INF
+
+        found = False
+        while queue:
+            i = queue.popleft()
+            for j in adjacency[i]:
+                if len(matched_right[j]) < capacities[j]:
+                    found = True
+                    continue
+                for k in matched_right[j]:
+                    if dist[k] == INF:
+                        dist[k] = dist[i] + 1
+                        queue.append(k)
+        return found
+
+    def candidates(i:int):
+        # (오른쪽 정점, 밀어낼 왼쪽 정점) - 남는 자리가 있으면 밀어낼 정점은 None
+        for j in adjacency[i]:
+            if len(matched_right[j]) < capacities[j]:
+                yield j, None
+            else:
+                for k in list(matched_right[j]):
+                    if dist[k] == dist[i] + 1:
+                        yield j, k
+
+    def augment(root:int)->bool:
+        # 재귀 대신 스택으로 증가 경로를 찾음
+        stack = [(root, candidates(root))]
+        via:list[tuple[int, int|None]] = list()
+        while stack:
+            i, edges = stack[-1]
+            for j, k in edges:
+                if k is None:
+                    via.append((j, None))
+                    for (left, _), (right, displaced) in zip(stack, via):
+                        if displaced is not None:
+                            matched_right[right].remove(displaced)
+                        matched_right[right].append(left)
+                        match_left[left] = right
+                    return True
+                via.append((j, k))
+                stack.append((k, candidates(k)))
+                break
+            else:
+                dist[i] = INF
+                stack.pop()
+                if via:
+                    via.pop()
+        return False
+
+    while bfs():
+        augmented = False
+        for i in range(len(adjacency)):
+            if match_left[i] is None and augment(i):
+                augmented = True
+        if not augmented:
+            break
+
+    return match_left
@@ -0,0 +1,179 @@
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar, Token
+import logging
+import threading
+import time
+from django.core.cache import cache
+from .constants import CacheKey
+
+logger = logging.getLogger(__name__)
+
+# 요청 처리 시간 히스토그램 구간 (초)
+DURATION_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class RequestMetrics:
+    """
+    요청 하나를 처리하는 동안 사용한 DB, 캐시, S3 통계
+    """
+    __slots__ = ("started", "db_queries", "db_time", "cache_hits", "cache_misses", "s3_bytes", "s3_time")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.s3_bytes = 0
+        self.s3_time = 0.0
+
+    def elapsed(self)->float:
+        return time.perf_counter() - self.started
+
+# sync_to_async로 넘어간 스레드에도 컨텍스트가 복사되므로, 비동기 뷰에서도 같은 객체에 기록됨
+_current_metrics:ContextVar[RequestMetrics|None] = ContextVar("request_metrics", default=None)
+
+def start_request_metrics()->tuple[RequestMetrics, Token]:
+    metrics = RequestMetrics()
+    return metrics, _current_metrics.set(metrics)
+
+def finish_request_metrics(token:Token):
+    _current_metrics.reset(token)
+
+def record_cache(hit:bool):
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return
+    if hit:
+        metrics.cache_hits += 1
+    else:
+        metrics.cache_misses += 1
+
+def record_s3(size:int, seconds:float):
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return
+    metrics.s3_bytes += size
+    metrics.s3_time += seconds
+
+def _db_execute_wrapper(execute, sql, params, many, context):
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_queries += 1
+        metrics.db_time += time.perf_counter() - started
+
+def install_db_execute_wrapper(sender, connection, **kwargs):
+    """
+    connection_created 시그널 수신자
+    DB 연결마다 쿼리 수와 시간을 기록하는 execute wrapper를 한 번만 붙입니다. (요청 밖의 쿼리는 기록하지 않음)
+    """
+    if _db_execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_db_execute_wrapper)
+
+class RequestMetricsRegistry:
+    """
+    URL 패턴별 요청 통계를 프로세스 메모리에 모았다가 flush_interval초마다 Redis 해시에 더합니다.
+    모든 워커의 합계가 Redis에 쌓이므로 /metrics는 어느 워커가 응답해도 같은 값을 보여 줍니다.
+
+    해시 필드는 "route|method|status|이름"이고, 처리 시간 히스토그램은 구간별 개수(누적 아님)로 저장합니다.
+    """
+    flush_interval:float = 10
+
+    COUNTERS = (
+        ("db_queries", "http_request_db_queries_total", "요청 처리 중 실행한 DB 쿼리 수"),
+        ("db_seconds", "http_request_db_seconds_total", "요청 처리 중 DB 쿼리에 쓴 시간 (초)"),
+        ("cache_hits", "http_request_cache_hits_total", "요청 처리 중 캐시 적중 수"),
+        ("cache_misses", "http_request_cache_misses_total", "요청 처리 중 캐시 미스 수"),
+        ("s3_bytes", "http_request_s3_bytes_total", "요청 처리 중 S3에 올린 바이트 수"),
+        ("s3_seconds", "http_request_s3_seconds_total", "요청 처리 중 S3 업로드에 쓴 시간 (초)"),
+    )
+
+    def __init__(self, key:str=CacheKey.REQUEST_METRICS.value):
+        self.key = key
+        self.lock = threading.Lock()
+        self.pending:defaultdict[str, float] = defaultdict(float)
+        self.flushed_at = time.monotonic()
+
+    def observe(self, route:str, method:str, status_code:int, metrics:RequestMetrics, duration:float)->bool:
+        """
+        요청 하나의 통계를 더하고, Redis에 반영할 때가 되었는지 반환합니다.
+        """
+        labels = f"{route}|{method}|{status_code // 100}xx"
+        index = bisect_left(DURATION_BUCKETS, duration)
+        le = DURATION_BUCKETS[index] if index < len(DURATION_BUCKETS) else "+Inf"
+
+        with self.lock:
+            pending = self.pending
+            pending[f"{labels}|bucket:{le}"] += 1
+            pending[f"{labels}|count"] += 1
+            pending[f"{labels}|sum"] += duration
+            pending[f"{labels}|db_queries"] += metrics.db_queries
+            pending[f"{labels}|db_seconds"] += metrics.db_time
+            pending[f"{labels}|cache_hits"] += metrics.cache_hits
+            pending[f"{labels}|cache_misses"] += metrics.cache_misses
+            pending[f"{labels}|s3_bytes"] += metrics.s3_bytes
+            pending[f"{labels}|s3_seconds"] += metrics.s3_time
+            return time.monotonic() - self.flushed_at >= self.flush_interval
+
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, defaultdict(float)
+            self.flushed_at = time.monotonic()
+        if not pending:
+            return
+
+        try:
+            client = cache.client.get_client(write=True)
+            key = cache.make_key(self.key)
+            pipeline = client.pipeline(transaction=False)
+            for field, delta in pending.items():
+                if delta:
+                    pipeline.hincrbyfloat(key, field, delta)
+            pipeline.execute()
+        except Exception:
+            # 통계 때문에 요청이 실패하면 안 되므로 버림
+            logger.warning("요청 통계를 Redis에 반영하지 못했습니다.", exc_info=True)
+
+    def render(self)->str:
+        """
+        Redis에 쌓인 통계를 Prometheus 텍스트 형식으로 반환합니다.
+        """
+        raw = cache.client.get_client(write=False).hgetall(cache.make_key(self.key))
+        series:defaultdict[tuple, dict[str, float]] = defaultdict(dict)
+        for field, value in raw.items():
+            route, method, status, name = field.decode().split("|", 3)
+            series[(route, method, status)][name] = float(value)
+
+        lines = [
+            "# HELP http_request_duration_seconds 요청 처리 시간 (초)",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (route, method, status), values in sorted(series.items()):
+            labels = f'route="{route}",method="{method}",status="{status}"'
+            cumulative = 0.0
+            for le in (*DURATION_BUCKETS, "+Inf"):
+                cumulative += values.get(f"bucket:{le}", 0)
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{le}"}} {_format_number(cumulative)}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {_format_number(values.get('sum', 0))}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {_format_number(values.get('count', 0))}")
+
+        for name, metric, description in self.COUNTERS:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for (route, method, status), values in sorted(series.items()):
+                labels = f'route="{route}",method="{method}",status="{status}"'
+                lines.append(f"{metric}{{{labels}}} {_format_number(values.get(name, 0))}")
+
+        return "\n".join(lines) + "\n"
+
+def _format_number(value:float)->str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() else f"{value:.6f}"
+
+request_metrics_registry = RequestMetricsRegistry()
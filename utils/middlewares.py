@@ -0,0 +1,99 @@
+import json
+import logging
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from .metrics import (
+    RequestMetrics,
+    finish_request_metrics,
+    install_db_execute_wrapper,
+    request_metrics_registry,
+    start_request_metrics,
+)
+
+logger = logging.getLogger("performance")
+
+class PerformanceMiddleware:
+    """
+    요청마다 처리 시간, DB 쿼리 수·시간, 캐시 적중·미스 수, S3 업로드 바이트·시간을 기록합니다.
+
+    - 응답의 Server-Timing 헤더 (PERFORMANCE_SERVER_TIMING)
+    - "performance" 로거에 요청마다 JSON 한 줄
+    - METRICS_ENABLED이면 URL 패턴별 통계를 모아 /metrics에 노출 (utils.metrics.RequestMetricsRegistry)
+
+    요청마다 하는 일은 카운터 증가와 시간 측정뿐이고, Redis 반영은 워커마다 몇 초에 한 번만 합니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        connection_created.connect(install_db_execute_wrapper, dispatch_uid="performance_db_execute_wrapper")
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        metrics, token = start_request_metrics()
+        try:
+            response = self.get_response(request)
+        finally:
+            finish_request_metrics(token)
+        if self.finish(request, response, metrics):
+            request_metrics_registry.flush()
+        return response
+
+    async def __acall__(self, request):
+        metrics, token = start_request_metrics()
+        try:
+            response = await self.get_response(request)
+        finally:
+            finish_request_metrics(token)
+        if self.finish(request, response, metrics):
+            await sync_to_async(request_metrics_registry.flush, thread_sensitive=False)()
+        return response
+
+    def finish(self, request, response, metrics:RequestMetrics)->bool:
+        """
+        헤더와 로그를 남기고, 통계를 Redis에 반영할 때가 되었는지 반환합니다.
+        (스트리밍 응답은 본문을 보내기 전까지의 시간만 기록됨)
+        """
+        duration = metrics.elapsed()
+        route = self.get_route(request)
+
+        if settings.PERFORMANCE_SERVER_TIMING:
+            response["Server-Timing"] = ", ".join((
+                f"total;dur={duration * 1000:.1f}",
+                f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.db_queries} queries"',
+                f'cache;desc="{metrics.cache_hits} hits, {metrics.cache_misses} misses"',
+                f's3;dur={metrics.s3_time * 1000:.1f};desc="{metrics.s3_bytes} bytes"',
+            ))
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps({
+                "method": request.method,
+                "path": request.path,
+                "route": route,
+                "status": response.status_code,
+                "duration_ms": round(duration * 1000, 1),
+                "db_queries": metrics.db_queries,
+                "db_ms": round(metrics.db_time * 1000, 1),
+                "cache_hits": metrics.cache_hits,
+                "cache_misses": metrics.cache_misses,
+                "s3_bytes": metrics.s3_bytes,
+                "s3_ms": round(metrics.s3_time * 1000, 1),
+            }, ensure_ascii=False))
+
+        if not settings.METRICS_ENABLED:
+            return False
+        return request_metrics_registry.observe(route, request.method, response.status_code, metrics, duration)
+
+    def get_route(self, request)->str:
+        # 요청 경로 대신 URL 패턴을 사용해 통계의 종류 수가 늘어나지 않게 함
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            return "unmatched"
+        return match.route or match.view_name
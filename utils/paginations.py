@@ -0,0 +1,83 @@
+import base64
+import json
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+class KeysetPagination(BasePagination):
+    """
+    여러 컬럼(예: created_at, student_number) 기준 오름차순 키셋 페이지네이션
+
+    OFFSET 없이 마지막 행의 키 다음부터 조회하므로, 페이지 위치와 관계없이
+    ordering 컬럼의 복합 인덱스로 한 페이지만큼만 읽습니다.
+    """
+    ordering:tuple[str, ...] = ("created_at", "id") # 마지막 컬럼은 유일해야 함
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 50
+    max_page_size = 200
+
+    def paginate_queryset(self, queryset:QuerySet, request, view=None)->list:
+        self.request = request
+        self.model = queryset.model
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        cursor = self.decode_cursor(request.query_params.get(self.cursor_query_param))
+        if cursor is not None:
+            queryset = self.filter_after(queryset, cursor)
+
+        rows = list(queryset[:page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.page = rows[:page_size]
+        return self.page
+
+    def get_paginated_response(self, data)->Response:
+        return Response(data={
+            "next": self.get_next_link(),
+            "results": data,
+        })
+
+    def get_page_size(self, request)->int:
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except ValueError:
+            page_size = self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_next_link(self)->str|None:
+        if not (self.has_next and self.page):
+            return None
+        last = self.page[-1]
+        values = [self.model._meta.get_field(field).value_to_string(last) for field in self.ordering]
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.encode_cursor(values))
+
+    def filter_after(self, queryset:QuerySet, cursor:list)->QuerySet:
+        """
+        (a, b, ...) > (x, y, ...) 조건을 OR로 풀어 씁니다.
+        첫 컬럼의 범위 조건(a >= x)을 함께 걸어 인덱스 범위 스캔이 가능하게 합니다.
+        """
+        condition = Q()
+        for i, field in enumerate(self.ordering):
+            equals = {prev: cursor[j] for j, prev in enumerate(self.ordering[:i])}
+            condition |= Q(**equals, **{f"{field}__gt": cursor[i]})
+        return queryset.filter(**{f"{self.ordering[0]}__gte": cursor[0]}).filter(condition)
+
+    def encode_cursor(self, values:list[str])->str:
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def decode_cursor(self, encoded:str|None)->list|None:
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            if len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                self.model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except Exception:
+            raise NotFound(detail="잘못된 커서입니다.")
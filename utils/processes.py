@@ -0,0 +1,14 @@
+"""
+ProcessPoolExecutor 자식 프로세스용 함수
+
+spawn 방식(macOS 기본값 등)의 자식 프로세스는 Django 설정 없이 시작하므로,
+이 모듈은 모델 등 Django 앱에 의존하는 모듈을 불러오지 않아야 합니다.
+"""
+import django
+
+def setup_django():
+    """
+    자식 프로세스에서 Django를 초기화합니다. (ProcessPoolExecutor의 initializer로 사용)
+    DJANGO_SETTINGS_MODULE 환경 변수는 부모 프로세스에서 물려받습니다.
+    """
+    django.setup()
@@ -0,0 +1,335 @@
+from datetime import datetime, timedelta
+from io import BytesIO
+from itertools import product
+import os
+import random
+import tempfile
+from types import SimpleNamespace
+import zlib
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadhandler import MemoryFileUploadHandler
+from django.http.multipartparser import MultiPartParser
+from django.test import RequestFactory, SimpleTestCase
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from django.utils.timezone import make_aware
+from rest_framework.response import Response
+from .decorators.view import idempotent
+from .files import InvalidFileError, verify_pdf
+from .helpers import FileUploadRule, IntervalIndex, build_interview_interval_index, max_bipartite_matching
+from .upload_handlers import FileUploadRuleHandler
+
+class IntervalIndexTest(SimpleTestCase):
+    def test_merges_overlapping_and_touching_intervals(self):
+        index = IntervalIndex([(5, 7), (1, 3), (3, 4), (10, 12), (11, 15)])
+        self.assertEqual(index.starts, [1, 5, 10])
+        self.assertEqual(index.ends, [4, 7, 15])
+        self.assertEqual(len(index), 3)
+
+    def test_bounds_are_inclusive(self):
+        index = IntervalIndex([(1, 3), (5, 5)])
+        for value in (1, 2, 3, 5):
+            self.assertIn(value, index)
+        for value in (0, 4, 6):
+            self.assertNotIn(value, index)
+
+    def test_ignores_reversed_intervals(self):
+        index = IntervalIndex([(4, 2)])
+        self.assertEqual(len(index), 0)
+        self.assertNotIn(3, index)
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            intervals = [
+                (start, start + rng.randint(-2, 6))
+                for start in (rng.randint(0, 40) for _ in range(rng.randint(0, 8)))
+            ]
+            index = IntervalIndex(intervals)
+            for value in range(-1, 50):
+                expected = any(start <= value <= end for start, end in intervals)
+                self.assertEqual(value in index, expected, (intervals, value))
+
+    def test_interview_interval_index_excludes_last_half_hour(self):
+        start = make_aware(datetime(2026, 3, 2, 10))
+        index = build_interview_interval_index([SimpleNamespace(start=start, end=start + timedelta(hours=1))])
+        self.assertIn(start, index)
+        self.assertIn(start + timedelta(minutes=30), index)
+        self.assertNotIn(start + timedelta(minutes=31), index)
+        self.assertNotIn(start - timedelta(minutes=30), index)
+
+def brute_force_matching_size(adjacency:list[list[int]], capacities:list[int])->int:
+    """
+    가능한 모든 배정(미배정 포함)을 시도해 구한 최대 매칭 크기
+    """
+    best = 0
+    for choice in product(*[[None, *edges] for edges in adjacency]):
+        used = [0] * len(capacities)
+        for j in choice:
+            if j is not None:
+                used[j] += 1
+        if all(count <= capacity for count, capacity in zip(used, capacities)):
+            best = max(best, sum(j is not None for j in choice))
+    return best
+
+class MaxBipartiteMatchingTest(SimpleTestCase):
+    def assertValidMatching(self, adjacency, capacities, matching):
+        self.assertEqual(len(matching), len(adjacency))
+        used = [0] * len(capacities)
+        for edges, j in zip(adjacency, matching):
+            if j is not None:
+                self.assertIn(j, edges)
+                used[j] += 1
+        for count, capacity in zip(used, capacities):
+            self.assertLessEqual(count, capacity)
+
+    def test_reassigns_to_make_room(self):
+        # 0이 먼저 0번을 가져가도 1이 0번만 가능하므로 0을 1번으로 옮겨야 함
+        adjacency = [[0, 1], [0]]
+        matching = max_bipartite_matching(adjacency, [1, 1])
+        self.assertEqual(matching, [1, 0])
+
+    def test_respects_capacity(self):
+        adjacency = [[0], [0], [0], [1]]
+        matching = max_bipartite_matching(adjacency, [2, 0])
+        self.assertValidMatching(adjacency, [2, 0], matching)
+        self.assertEqual(sum(j is not None for j in matching), 2)
+        self.assertIsNone(matching[3])
+
+    def test_empty(self):
+        self.assertEqual(max_bipartite_matching([], []), [])
+        self.assertEqual(max_bipartite_matching([[], []], [1]), [None, None])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            right = rng.randint(1, 4)
+            capacities = [rng.randint(0, 2) for _ in range(right)]
+            adjacency = [
+                rng.sample(range(right), rng.randint(0, right))
+                for _ in range(rng.randint(0, 6))
+            ]
+            matching = max_bipartite_matching(adjacency, capacities)
+            self.assertValidMatching(adjacency, capacities, matching)
+            self.assertEqual(
+                sum(j is not None for j in matching),
+                brute_force_matching_size(adjacency, capacities),
+                (adjacency, capacities),
+            )
+
+class CountingStream(BytesIO):
+    """
+    파서가 읽은 바이트 수를 세는 스트림
+    """
+    bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+class FileUploadRuleHandlerTest(SimpleTestCase):
+    rules = {
+        "portfolio": FileUploadRule("portfolio", ["pdf"], 1, 1024*1024, 2),
+    }
+
+    def parse(self, data:dict)->tuple[FileUploadRuleHandler, dict, CountingStream]:
+        body = encode_multipart(BOUNDARY, data)
+        stream = CountingStream(body)
+        meta = {"CONTENT_TYPE": MULTIPART_CONTENT, "CONTENT_LENGTH": str(len(body))}
+        handler = FileUploadRuleHandler(rules=self.rules)
+        _, files = MultiPartParser(meta, stream, [handler, MemoryFileUploadHandler()]).parse()
+        return handler, files, stream
+
+    def pdf(self, name:str="a.pdf", size:int=1024, head:bytes=b"%PDF-1.7\n")->SimpleUploadedFile:
+        return SimpleUploadedFile(name, head + b"0" * (size - len(head)))
+
+    def test_accepts_valid_file(self):
+        handler, files, _ = self.parse({"portfolio": [self.pdf()]})
+        self.assertEqual(handler.errors, {})
+        self.assertEqual(len(files.getlist("portfolio")), 1)
+
+    def test_rejects_oversized_file_without_reading_the_rest(self):
+        size = 8 * 1024*1024
+        handler, files, stream = self.parse({"portfolio": [self.pdf(size=size)]})
+        self.assertIn("최대 용량", handler.errors["portfolio"][0])
+        self.assertEqual(len(files.getlist("portfolio")), 0)
+        self.assertLess(stream.bytes_read, size // 2)
+
+    def test_rejects_wrong_signature(self):
+        handler, files, _ = self.parse({"portfolio": [self.pdf(head=b"\x89PNG\r\n\x1a\n")]})
+        self.assertIn("확장자(pdf)와 맞지 않습니다", handler.errors["portfolio"][0])
+        self.assertEqual(len(files.getlist("portfolio")), 0)
+
+    def test_rejects_signature_shorter_than_magic(self):
+        handler, _, _ = self.parse({"portfolio": [SimpleUploadedFile("a.pdf", b"%PD")]})
+        self.assertIn("확장자(pdf)와 맞지 않습니다", handler.errors["portfolio"][0])
+
+    def test_rejects_extension_count_and_unknown_field(self):
+        handler, _, _ = self.parse({"portfolio": [self.pdf(name="a.exe")]})
+        self.assertIn("확장자는 허용되지 않습니다", handler.errors["portfolio"][0])
+
+        handler, _, _ = self.parse({"portfolio": [self.pdf(), self.pdf(), self.pdf()]})
+        self.assertIn("최대 2개", handler.errors["portfolio"][0])
+
+        handler, _, _ = self.parse({"photo": [self.pdf()]})
+        self.assertIn("허용되지 않은 파일 필드", handler.errors["photo"][0])
+
+    def test_rejects_empty_file(self):
+        handler, _, _ = self.parse({"portfolio": [SimpleUploadedFile("a.pdf", b"")]})
+        self.assertTrue(handler.errors["portfolio"])
+
+def build_pdf(objects:dict[int, bytes], trailer:bytes=b"", xref_stream:bool=False, compressed:tuple[int, ...]=(), stream_data:bytes|None=None)->bytes:
+    """
+    테스트용 PDF를 만듭니다. (객체 번호는 1부터 연속)
+
+    xref_stream이면 FlateDecode로 압축한 xref 스트림을 쓰고, compressed의 객체는 객체 스트림에 넣습니다.
+    stream_data를 주면 xref 스트림의 압축 데이터를 그 값으로 바꿉니다.
+    """
+    out = b"%PDF-1.7\n"
+    locations:dict[int, tuple[int, int, int]] = dict() # 객체 번호 -> (종류, 오프셋 또는 객체 스트림 번호, 순번)
+    size = len(objects) + 1
+
+    def add(number:int, body:bytes):
+        nonlocal out
+        locations[number] = (1, len(out), 0)
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    for number, body in objects.items():
+        if number not in compressed:
+            add(number, body)
+
+    if compressed:
+        stream_number, size = size, size + 1
+        header = b" ".join(b"%d %d" % (number, i * 100) for i, number in enumerate(compressed)) + b" "
+        content = header + b"".join(objects[number].ljust(100) for number in compressed)
+        data = zlib.compress(content)
+        add(stream_number, b"<< /Type /ObjStm /N %d /First %d /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(compressed), len(header), len(data), data))
+        for i, number in enumerate(compressed):
+            locations[number] = (2, stream_number, i)
+
+    if not xref_stream:
+        xref_offset = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % size
+        for number in range(1, size):
+            out += b"%010d 00000 n \n" % locations[number][1]
+        out += b"trailer\n<< /Size %d %s >>\n" % (size, trailer)
+    else:
+        xref_number, size = size, size + 1
+        xref_offset = len(out)
+        locations[xref_number] = (1, xref_offset, 0)
+        rows = b"\x00" + (0).to_bytes(4, "big") + b"\xff"
+        for number in range(1, size):
+            kind, value, index = locations[number]
+            rows += bytes([kind]) + value.to_bytes(4, "big") + bytes([index])
+        data = zlib.compress(rows) if stream_data is None else stream_data
+        out += b"%d 0 obj\n<< /Type /XRef /Size %d /W [1 4 1] /Length %d /Filter /FlateDecode %s >>\nstream\n%s\nendstream\nendobj\n" % (xref_number, size, len(data), trailer, data)
+    out += b"startxref\n%d\n%%%%EOF\n" % xref_offset
+    return out
+
+class VerifyPdfTest(SimpleTestCase):
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [3 0 R] /Count 3 >>",
+        3: b"<< /Type /Page /Parent 2 0 R >>",
+    }
+
+    def verify(self, data:bytes)->int:
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+            f.write(data)
+        try:
+            return verify_pdf(f.name)
+        finally:
+            os.remove(f.name)
+
+    def assertInvalid(self, data:bytes, message:str):
+        with self.assertRaises(InvalidFileError) as context:
+            self.verify(data)
+        self.assertIn(message, str(context.exception))
+
+    def test_xref_table(self):
+        self.assertEqual(self.verify(build_pdf(self.objects, b"/Root 1 0 R")), 3)
+
+    def test_xref_stream_and_object_stream(self):
+        data = build_pdf(self.objects, b"/Root 1 0 R", xref_stream=True, compressed=(1, 2))
+        self.assertEqual(self.verify(data), 3)
+
+    def test_indirect_count(self):
+        objects = {**self.objects, 2: b"<< /Type /Pages /Kids [3 0 R] /Count 4 0 R >>", 4: b"7"}
+        self.assertEqual(self.verify(build_pdf(objects, b"/Root 1 0 R")), 7)
+
+    def test_not_pdf(self):
+        self.assertInvalid(b"\x89PNG\r\n\x1a\n" + b"0" * 100, "PDF 파일이 아닙니다")
+
+    def test_truncated(self):
+        data = build_pdf(self.objects, b"/Root 1 0 R")
+        self.assertInvalid(data[:len(data) // 2], "잘렸습니다")
+        self.assertInvalid(data[:-8], "잘렸습니다")
+
+    def test_malformed_xref(self):
+        data = build_pdf(self.objects, b"/Root 1 0 R")
+        self.assertInvalid(data.replace(b"xref\n0 4", b"xref\n0 x"), "xref가 손상되었습니다")
+
+        # startxref가 파일 밖을 가리킴
+        start = data.rindex(b"startxref")
+        self.assertInvalid(data[:start] + b"startxref\n999999\n%%EOF\n", "xref를 찾을 수 없습니다")
+
+    def test_prev_loop(self):
+        data = build_pdf(self.objects, b"/Root 1 0 R")
+        xref_offset = data.rindex(b"xref\n0 ")
+        self.assertInvalid(data.replace(b"/Root 1 0 R", b"/Root 1 0 R /Prev %d" % xref_offset), "xref를 찾을 수 없습니다")
+
+    def test_prev_reference_is_not_an_offset(self):
+        # /Prev 5 0 R는 오프셋 5가 아니므로 따라가지 않음
+        self.assertEqual(self.verify(build_pdf(self.objects, b"/Root 1 0 R /Prev 5 0 R")), 3)
+
+    def test_encrypted(self):
+        self.assertInvalid(build_pdf(self.objects, b"/Root 1 0 R /Encrypt 9 0 R"), "암호화된 PDF")
+
+    def test_no_pages(self):
+        objects = {**self.objects, 2: b"<< /Type /Pages /Kids [] /Count 0 >>"}
+        self.assertInvalid(build_pdf(objects, b"/Root 1 0 R"), "페이지가 없는 PDF")
+
+    def test_missing_object(self):
+        objects = {**self.objects, 1: b"<< /Type /Catalog /Pages 9 0 R >>"}
+        self.assertInvalid(build_pdf(objects, b"/Root 1 0 R"), "객체를 찾을 수 없습니다")
+
+    def test_compression_bomb(self):
+        # 압축 해제 시 64MB가 되는 xref 스트림 (압축 상태로는 수십 KB)
+        bomb = zlib.compress(b"\x00" * 64*1024*1024, 9)
+        data = build_pdf(self.objects, b"/Root 1 0 R", xref_stream=True, stream_data=bomb)
+        self.assertInvalid(data, "너무 큽니다")
+
+    def test_corrupt_stream(self):
+        data = build_pdf(self.objects, b"/Root 1 0 R", xref_stream=True, stream_data=b"not zlib data")
+        self.assertInvalid(data, "손상되었습니다")
+
+class IdempotentTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+    @idempotent()
+    def post(self, request):
+        self.calls += 1
+        return Response(status=201, data={"application_code": "ABCDE12345"})
+
+    def request(self, body:str='{"name": "a"}'):
+        return RequestFactory().post("/recruitments/", body, content_type="application/json", headers={"Idempotency-Key": "key-1"})
+
+    def test_replays_stored_response_without_plaintext_in_cache(self):
+        self.assertEqual(self.post(self.request()).data, {"application_code": "ABCDE12345"})
+
+        response = self.post(self.request())
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data, {"application_code": "ABCDE12345"})
+
+        stored = [cache.get(key) for key in cache.keys("*")]
+        self.assertEqual(len(stored), 1)
+        self.assertNotIn("ABCDE12345", repr(stored[0]))
+
+    def test_rejects_key_reused_for_other_request(self):
+        self.post(self.request())
+        self.assertEqual(self.post(self.request('{"name": "b"}')).status_code, 422)
+        self.assertEqual(self.calls, 1)
@@ -0,0 +1,73 @@
+import os
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from .helpers import FileUploadRule
+
+# 확장자별 파일 시그니처 (파일 맨 앞 바이트)
+FILE_SIGNATURES = {
+    "png": (b"\x89PNG\r\n\x1a\n",),
+    "jpg": (b"\xff\xd8\xff",),
+    "jpeg": (b"\xff\xd8\xff",),
+    "gif": (b"GIF87a", b"GIF89a"),
+    "pdf": (b"%PDF-",),
+}
+
+class FileUploadRuleHandler(FileUploadHandler):
+    """
+    multipart 본문을 받는 동안 파일 필드별 규칙(FileUploadRule)을 검사하는 업로드 핸들러
+
+    확장자, 파일 수, 파일 크기, 파일 시그니처 중 하나라도 어긋나면 나머지 본문을 읽지 않고 업로드를 중단합니다.
+    중단 사유는 errors에 남으므로, request.data를 읽은 뒤 errors를 확인해 응답해야 합니다.
+    (중단된 요청의 request.data에는 중단 전까지 받은 값만 들어 있음)
+
+    다른 업로드 핸들러보다 앞에 있어야 파일이 임시 저장되기 전에 검사할 수 있습니다.
+        request.upload_handlers.insert(0, FileUploadRuleHandler(request, rules))
+    """
+    def __init__(self, request=None, rules:dict[str, FileUploadRule]|None=None):
+        super().__init__(request)
+        self.rules = rules or dict()
+        self.counts = dict()
+        self.errors = dict()
+
+    def new_file(self, field_name, file_name, *args, **kwargs):
+        super().new_file(field_name, file_name, *args, **kwargs)
+        self.rule = self.rules.get(field_name)
+        self.head = b""
+        if self.rule is None:
+            self.abort("허용되지 않은 파일 필드입니다.")
+
+        self.counts[field_name] = self.counts.get(field_name, 0) + 1
+        if self.rule.max_count and self.counts[field_name] > self.rule.max_count:
+            self.abort(f"파일은 최대 {self.rule.max_count}개까지 제출할 수 있습니다.")
+
+        self.ext = os.path.splitext(file_name)[1].lower().lstrip(".")
+        if self.rule.allowed_extensions and self.ext not in self.rule.allowed_extensions:
+            self.abort(f"파일 '{file_name}'의 확장자는 허용되지 않습니다. (허용: {', '.join(self.rule.allowed_extensions)})")
+
+    def receive_data_chunk(self, raw_data, start):
+        if self.rule.max_size and start + len(raw_data) > self.rule.max_size:
+            self.abort(f"파일 '{self.file_name}'의 용량이 최대 용량 {self.rule.max_size // (1024*1024)}MB를 초과합니다.")
+
+        signatures = FILE_SIGNATURES.get(self.ext)
+        if signatures and self.head is not None:
+            self.head += raw_data[:max(map(len, signatures)) - len(self.head)]
+            if len(self.head) >= max(map(len, signatures)):
+                self.check_signature(signatures)
+        return raw_data
+
+    def file_complete(self, file_size):
+        signatures = FILE_SIGNATURES.get(self.ext)
+        if signatures and self.head is not None:
+            self.check_signature(signatures)
+
+        if file_size < self.rule.min_size:
+            self.abort(f"파일 '{self.file_name}'의 용량이 최소 용량 미만입니다.")
+        return None
+
+    def check_signature(self, signatures:tuple[bytes, ...]):
+        if not self.head.startswith(signatures):
+            self.abort(f"파일 '{self.file_name}'의 내용이 확장자({self.ext})와 맞지 않습니다.")
+        self.head = None # 검사 완료
+
+    def abort(self, message:str):
+        self.errors[self.field_name] = [message]
+        raise StopUpload(connection_reset=True)